@@ -9,7 +9,7 @@ It handles both online (connected to database) and offline
 (generating SQL scripts) migration modes.
 
 Features:
-    - Async SQLAlchemy support
+    - Synchronous psycopg2 connection (DDL is strictly sequential)
     - Automatic model discovery
     - Environment-based configuration
     - pgvector extension support
@@ -19,13 +19,12 @@ Features:
 # IMPORTS
 # =============================================================================
 # Standard library imports
-import asyncio  # For async migration support
+from functools import lru_cache  # Caching include_object decisions
 from logging.config import fileConfig  # Logging configuration
 
 # Third-party imports
-from sqlalchemy import pool  # Connection pooling
+from sqlalchemy import engine_from_config, pool  # Engine and pooling
 from sqlalchemy.engine import Connection  # Connection type
-from sqlalchemy.ext.asyncio import async_engine_from_config  # Async engine
 
 # Alembic imports
 from alembic import context  # Alembic context
@@ -48,6 +47,10 @@ if config.config_file_name is not None:
 # Import all models to ensure they're registered with the metadata
 # This is required for autogenerate to detect model changes
 
+# Application settings (the models below already import them, so there is
+# no circular-import reason to defer this into get_url())
+from app.config import settings
+
 # Import base and all models
 from app.models.base import Base
 from app.models.venue import Venue
@@ -66,21 +69,14 @@ def get_url() -> str:
     """
     Get the database URL from environment configuration.
     
+    Alembic runs on a synchronous engine, so this is the psycopg2 URL
+    (settings.sync_database_url also normalizes postgres:// and other
+    postgresql+driver:// URLs).
+    
     Returns:
         str: Database URL for migrations
     """
-    # Import settings here to avoid circular imports
-    from app.config import settings
-    
-    # Return the async URL (replace asyncpg with psycopg2 for Alembic)
-    # Alembic doesn't use async connections directly
-    url = settings.DATABASE_URL
-    
-    # If using asyncpg, convert to psycopg2 for Alembic
-    if url.startswith("postgresql+asyncpg://"):
-        url = url.replace("postgresql+asyncpg://", "postgresql://")
-    
-    return url
+    return settings.sync_database_url
 
 
 # =============================================================================
@@ -134,18 +130,27 @@ def do_run_migrations(connection: Connection) -> None:
         include_object=include_object,
         # Compare types for column type changes
         compare_type=True,
+        # Only reflect the default schema; together with SQLAlchemy 2.0's
+        # Inspector.get_multi_*() this lets autogenerate reflect every
+        # table's columns/indexes/constraints in one query per kind
+        include_schemas=False,
+        # Batch (copy-and-move) mode reflects table by table and defeats
+        # the multi-table reflection above; PostgreSQL doesn't need it
+        render_as_batch=False,
     )
 
     with context.begin_transaction():
         context.run_migrations()
 
 
-async def run_async_migrations() -> None:
+def run_migrations_online() -> None:
     """
-    Run migrations asynchronously.
+    Run migrations in 'online' mode.
     
-    Creates an async engine and runs migrations within
-    an async context.
+    In this scenario we need to create an Engine and associate
+    a connection with the context. Migrations run sequentially,
+    so a plain synchronous engine is used rather than paying for
+    an event loop and the async/greenlet bridge.
     """
     # Build configuration dictionary
     configuration = config.get_section(config.config_ini_section) or {}
@@ -153,34 +158,62 @@ async def run_async_migrations() -> None:
     # Override with actual database URL
     configuration["sqlalchemy.url"] = get_url()
     
-    # Create async engine
-    connectable = async_engine_from_config(
+    # Autogenerate only opens short-lived inspection connections, so it
+    # keeps NullPool; upgrades/downgrades hold exactly one connection for
+    # the whole run, which StaticPool hands out without reconnecting
+    autogenerate = getattr(config.cmd_opts, "autogenerate", False)
+    
+    # Create engine
+    connectable = engine_from_config(
         configuration,
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        poolclass=pool.NullPool if autogenerate else pool.StaticPool,
+        connect_args={
+            # DDL commits don't need to wait for WAL fsync, and a migration
+            # should fail fast rather than queue behind long-held locks
+            "options": "-c synchronous_commit=off -c lock_timeout=10s",
+        },
     )
 
     # Run migrations
-    async with connectable.connect() as connection:
-        await connection.run_sync(do_run_migrations)
+    with connectable.connect() as connection:
+        do_run_migrations(connection)
 
     # Dispose engine
-    await connectable.dispose()
+    connectable.dispose()
 
 
-def run_migrations_online() -> None:
+# =============================================================================
+# OBJECT FILTERING
+# =============================================================================
+# Tables that autogenerate should never manage
+_EXCLUDED_TABLES = frozenset({"alembic_version"})
+
+
+@lru_cache(maxsize=4096)
+def _include_name(type_: str, name: str) -> bool:
     """
-    Run migrations in 'online' mode.
+    Decide whether an object is included, by type and name only.
     
-    In this scenario we need to create an Engine and associate
-    a connection with the context.
+    Cached because autogenerate asks about the same objects repeatedly
+    and the answer never depends on the reflected/compared objects.
+    
+    Args:
+        type_: Type of object (table, column, index, etc.)
+        name: Name of the object
+    
+    Returns:
+        bool: True to include, False to exclude
     """
-    asyncio.run(run_async_migrations())
+    # Skip alembic's own version table and tables that start with
+    # underscore (internal/temp tables)
+    if type_ == "table" and (name[:1] == "_" or name in _EXCLUDED_TABLES):
+        return False
+    
+    # Include everything else
+    return True
 
 
-# =============================================================================
-# OBJECT FILTERING
-# =============================================================================
 def include_object(
     object,
     name,
@@ -204,16 +237,11 @@ def include_object(
     Returns:
         bool: True to include, False to exclude
     """
-    # Skip alembic's own version table
-    if type_ == "table" and name == "alembic_version":
-        return False
+    # Unnamed objects (e.g. some constraints) are always included
+    if name is None:
+        return True
     
-    # Skip tables that start with underscore (internal/temp tables)
-    if type_ == "table" and name.startswith("_"):
-        return False
-    
-    # Include everything else
-    return True
+    return _include_name(type_, name)
 
 
 # =============================================================================
@@ -14,7 +14,7 @@ This migration creates the initial database schema for Phase 1.
 Tables Created:
     - venues: Activity provider locations from Google Places
     - activities: Activity types offered at venues (AI-inferred)
-    - activity_sessions: Scheduled time slots for activities
+    - activity_sessions: Scheduled time slots for activities (partitioned by month)
     - vendor_credentials: Vendor portal login credentials
     - google_reviews: Raw reviews from Google Places
     - venue_quality_scores: AI-generated quality scores
@@ -22,16 +22,22 @@ Tables Created:
 
 Extensions:
     - pgvector: For vector embeddings (semantic search)
+    - pg_trgm: For fuzzy text search
+    - moddatetime: For updated_at triggers
+
+Functions:
+    - uuid_generate_v7(): Time-ordered UUID primary key defaults
 """
 
 # =============================================================================
 # IMPORTS
 # =============================================================================
-from typing import Sequence, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Sequence, Tuple, Union
 
-from alembic import op
+from alembic import context, op
 import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
+from sqlalchemy import pool
 
 # =============================================================================
 # REVISION IDENTIFIERS
@@ -43,390 +49,541 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 # =============================================================================
-# UPGRADE
+# SCHEMA SQL
 # =============================================================================
-def upgrade() -> None:
+# The whole Phase 1 schema is emitted as one pre-built script so that upgrade()
+# makes a single round-trip instead of compiling and dispatching ~30 separate
+# op.create_table / op.create_index calls. The ORM models remain the source
+# of truth for autogenerate comparisons (see alembic/env.py).
+SCHEMA_SQL = """
+-- =========================================================================
+-- ENABLE EXTENSIONS
+-- =========================================================================
+-- pgvector for vector embeddings (semantic search); halfvec needs >= 0.7.0
+CREATE EXTENSION IF NOT EXISTS vector;
+
+-- pg_trgm for fuzzy text search (fallback when Pinecone unavailable)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- moddatetime for maintaining updated_at in C via row triggers
+CREATE EXTENSION IF NOT EXISTS moddatetime;
+
+-- =========================================================================
+-- UUID V7 GENERATOR
+-- =========================================================================
+-- Time-ordered UUIDs: the first 48 bits are the Unix epoch in milliseconds,
+-- the rest is random. New rows therefore land on the right-most pages of
+-- every primary-key B-tree instead of random pages, which keeps inserts
+-- append-mostly. Must stay bit-compatible with app.models.base.uuid7().
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+BEGIN
+    RETURN encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    placing substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                    FROM 1 FOR 6
+                ),
+                52, 1
+            ),
+            53, 1
+        ),
+        'hex'
+    )::uuid;
+END
+$$ LANGUAGE plpgsql VOLATILE;
+
+-- =========================================================================
+-- VENUES TABLE
+-- =========================================================================
+-- Free-form strings are TEXT (same storage as VARCHAR in Postgres); VARCHAR(n)
+-- is kept only where the length is a real rule (card descriptions, codes).
+CREATE TABLE venues (
+    -- Primary key
+    id UUID NOT NULL DEFAULT uuid_generate_v7(),
+
+    -- Google Places data
+    google_place_id TEXT UNIQUE,
+    name TEXT NOT NULL,
+    slug TEXT NOT NULL UNIQUE,
+
+    -- Descriptions
+    short_description VARCHAR(150),
+    full_description TEXT,
+
+    -- Category
+    primary_category TEXT,
+
+    -- Location
+    address_line1 TEXT,
+    address_line2 TEXT,
+    city TEXT,
+    state TEXT,
+    postal_code TEXT,
+    country VARCHAR(100) DEFAULT 'India',
+
+    -- Coordinates (float8, the native input type of point() used by the
+    -- idx_venues_location GiST index)
+    latitude DOUBLE PRECISION,
+    longitude DOUBLE PRECISION,
+
+    -- Contact
+    contact_phone TEXT,
+    website_url TEXT,
+
+    -- Ratings
+    google_rating REAL,
+    google_review_count INTEGER NOT NULL DEFAULT 0,
+
+    -- Status
+    is_active BOOLEAN NOT NULL DEFAULT true,
+    data_source TEXT NOT NULL DEFAULT 'google_places',
+
+    -- Metadata (JSONB)
+    business_hours JSONB,
+    google_types JSONB,
+    photos_urls JSONB DEFAULT '[]',
+
+    -- Vector embedding for semantic search (768 dimensions for Gemini),
+    -- stored at half precision: same cosine ranking, half the bytes
+    description_embedding halfvec(768),
+
+    -- Embedding sync tracking
+    embedding_outdated BOOLEAN NOT NULL DEFAULT true,
+    last_embedding_update TIMESTAMP WITH TIME ZONE,
+
+    -- Timestamps
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (id)
+);
+
+-- =========================================================================
+-- ACTIVITIES TABLE
+-- =========================================================================
+CREATE TABLE activities (
+    -- Primary key
+    id UUID NOT NULL DEFAULT uuid_generate_v7(),
+
+    -- Foreign key to venue
+    venue_id UUID NOT NULL REFERENCES venues (id) ON DELETE CASCADE,
+
+    -- Basic info
+    name TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    short_description VARCHAR(150),
+    full_description TEXT,
+    category TEXT NOT NULL,
+
+    -- Requirements
+    min_age INTEGER NOT NULL DEFAULT 3,
+    max_age INTEGER NOT NULL DEFAULT 15,
+    duration_minutes INTEGER NOT NULL DEFAULT 60,
+    capacity_per_session INTEGER NOT NULL DEFAULT 15,
+
+    -- Pricing
+    credits_required INTEGER NOT NULL DEFAULT 2,
+
+    -- Metadata (JSONB)
+    activity_tags JSONB,
+    learning_outcomes JSONB DEFAULT '[]',
+    what_to_bring JSONB DEFAULT '[]',
+    photos_urls JSONB DEFAULT '[]',
+
+    -- Ratings (denormalized)
+    average_rating REAL,
+    total_reviews INTEGER NOT NULL DEFAULT 0,
+
+    -- Status
+    is_active BOOLEAN NOT NULL DEFAULT true,
+
+    -- Vector embedding for semantic search
+    description_embedding halfvec(768),
+
+    -- Embedding sync
+    embedding_outdated BOOLEAN NOT NULL DEFAULT true,
+
+    -- Timestamps
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (id)
+);
+
+-- =========================================================================
+-- ACTIVITY SESSIONS TABLE
+-- =========================================================================
+-- Range-partitioned by month on session_date so date-bounded queries prune
+-- to a few partitions and each partition's indexes stay small. The primary
+-- key must include the partition key.
+CREATE TABLE activity_sessions (
+    -- Primary key
+    id UUID NOT NULL DEFAULT uuid_generate_v7(),
+
+    -- Foreign key to activity
+    activity_id UUID NOT NULL REFERENCES activities (id) ON DELETE CASCADE,
+
+    -- Schedule
+    session_date DATE NOT NULL,
+    start_time TIME NOT NULL,
+    end_time TIME NOT NULL,
+    timezone VARCHAR(50) NOT NULL DEFAULT 'Asia/Kolkata',
+
+    -- Capacity
+    total_capacity INTEGER NOT NULL DEFAULT 15,
+    booked_count INTEGER NOT NULL DEFAULT 0,
+
+    -- Status bitmask (bit 0 = cancelled, bit 1 = completed); one smallint
+    -- instead of padded booleans interleaved with variable-length columns
+    status SMALLINT NOT NULL DEFAULT 0,
+    cancellation_reason TEXT,
+
+    -- Instructor
+    instructor_name TEXT,
+    session_notes TEXT,
+
+    -- Timestamps
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (id, session_date)
+) PARTITION BY RANGE (session_date);
+
+-- Monthly partitions for the next 24 months, plus a default partition that
+-- catches anything outside that window (back-dated or far-future sessions)
+DO $$
+DECLARE
+    month_start DATE;
+BEGIN
+    FOR i IN 0..23 LOOP
+        month_start := (date_trunc('month', CURRENT_DATE) + make_interval(months => i))::date;
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF activity_sessions FOR VALUES FROM (%L) TO (%L)',
+            'activity_sessions_' || to_char(month_start, 'YYYY_MM'),
+            month_start,
+            (month_start + INTERVAL '1 month')::date
+        );
+    END LOOP;
+END
+$$;
+
+CREATE TABLE IF NOT EXISTS activity_sessions_default PARTITION OF activity_sessions DEFAULT;
+
+-- CONCURRENTLY is not supported on partitioned tables, so these are built
+-- here on the (empty) parent and cascade to every partition as local indexes.
+-- idx_sessions_available also serves plain activity_id lookups (leftmost
+-- prefix, including FK cascades), so there is no separate activity_id index.
+CREATE INDEX idx_sessions_date ON activity_sessions (session_date);
+CREATE INDEX idx_sessions_available ON activity_sessions (activity_id, session_date) INCLUDE (start_time, booked_count, status);
+
+-- =========================================================================
+-- VENDOR CREDENTIALS TABLE
+-- =========================================================================
+CREATE TABLE vendor_credentials (
+    -- Primary key
+    id UUID NOT NULL DEFAULT uuid_generate_v7(),
+
+    -- Foreign key to venue
+    venue_id UUID NOT NULL REFERENCES venues (id) ON DELETE CASCADE,
+
+    -- Authentication
+    email TEXT NOT NULL UNIQUE,
+    password_hash TEXT NOT NULL,
+
+    -- Profile
+    name TEXT NOT NULL,
+    phone TEXT,
+
+    -- Status
+    is_active BOOLEAN NOT NULL DEFAULT true,
+
+    -- Login tracking
+    last_login_at TIMESTAMP WITH TIME ZONE,
+    last_login_ip INET,
+
+    -- Password reset
+    password_reset_token TEXT,
+    password_reset_expires_at TIMESTAMP WITH TIME ZONE,
+
+    -- Timestamps
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (id)
+);
+
+-- =========================================================================
+-- GOOGLE REVIEWS TABLE
+-- =========================================================================
+CREATE TABLE google_reviews (
+    -- Primary key
+    id UUID NOT NULL DEFAULT uuid_generate_v7(),
+
+    -- Foreign key to venue
+    venue_id UUID NOT NULL REFERENCES venues (id) ON DELETE CASCADE,
+
+    -- Google data
+    google_review_id TEXT UNIQUE,
+    author_name TEXT,
+    author_url TEXT,
+    profile_photo_url TEXT,
+
+    -- Review content
+    rating INTEGER NOT NULL,
+    text TEXT,
+    language VARCHAR(10),
+    relative_time_description TEXT,
+    review_time TIMESTAMP WITH TIME ZONE,
+
+    -- Processing status bitmask (bit 0 = processed)
+    status SMALLINT NOT NULL DEFAULT 0,
+    processed_at TIMESTAMP WITH TIME ZONE,
+
+    -- Timestamps
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (id)
+);
+
+-- =========================================================================
+-- VENUE QUALITY SCORES TABLE
+-- =========================================================================
+CREATE TABLE venue_quality_scores (
+    -- Primary key
+    id UUID NOT NULL DEFAULT uuid_generate_v7(),
+
+    -- Foreign key to venue (one-to-one)
+    venue_id UUID NOT NULL UNIQUE REFERENCES venues (id) ON DELETE CASCADE,
+
+    -- Individual quality scores (1-5 scale). Scores and ratings are REAL
+    -- (float4): fixed-width and hardware-fast to sort/aggregate, and ample
+    -- precision for a 1-5 scale. Prices below stay NUMERIC for exact money.
+    hygiene_score REAL,
+    safety_score REAL,
+    teaching_score REAL,
+    facilities_score REAL,
+    value_score REAL,
+    ambience_score REAL,
+    staff_score REAL,
+    location_score REAL,
+
+    -- Composite score
+    overall_score REAL,
+
+    -- Confidence and metadata
+    confidence REAL,
+    review_count_analyzed INTEGER NOT NULL DEFAULT 0,
+    key_phrases JSONB,
+
+    -- Processing info
+    model_version TEXT,
+    processed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (id)
+);
+
+-- =========================================================================
+-- VENUE MOCK PRICING TABLE
+-- =========================================================================
+CREATE TABLE venue_mock_pricing (
+    -- Primary key
+    id UUID NOT NULL DEFAULT uuid_generate_v7(),
+
+    -- Foreign key to venue
+    venue_id UUID NOT NULL REFERENCES venues (id) ON DELETE CASCADE,
+
+    -- Activity type
+    activity_type TEXT NOT NULL,
+
+    -- Prices in INR
+    weekday_price_inr NUMERIC(10, 2) NOT NULL,
+    weekend_price_inr NUMERIC(10, 2) NOT NULL,
+
+    -- Source
+    price_source TEXT NOT NULL DEFAULT 'algorithm',
+
+    -- Timestamps
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (id),
+    CONSTRAINT uq_venue_activity_pricing UNIQUE (venue_id, activity_type)
+);
+"""
+
+
+# =============================================================================
+# UPDATED_AT TRIGGERS
+# =============================================================================
+# Tables with an updated_at column get a moddatetime trigger, so the column is
+# maintained by Postgres for every UPDATE, including bulk/Core statements that
+# bypass the ORM's onupdate hook.
+UPDATED_AT_TABLES = (
+    'venues',
+    'activities',
+    'activity_sessions',
+    'vendor_credentials',
+    'venue_mock_pricing',
+)
+
+SCHEMA_SQL += "".join(
+    f"CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} "
+    f"FOR EACH ROW EXECUTE FUNCTION moddatetime(updated_at);\n"
+    for table in UPDATED_AT_TABLES
+)
+
+
+# =============================================================================
+# INDEX SQL
+# =============================================================================
+# Indexes are built with CONCURRENTLY so re-applying the migration against a
+# populated database never takes an ACCESS EXCLUSIVE lock on the table.
+# CONCURRENTLY cannot run inside a transaction (or a multi-statement string),
+# so each statement is issued on its own in autocommit mode. Statements are
+# grouped by table: concurrent builds on the same table block each other
+# (SHARE UPDATE EXCLUSIVE), but different tables can be built in parallel.
+INDEX_SQL = {
+    'venues': (
+        # slug and google_place_id need no extra index: their UNIQUE
+        # constraints are already backed by unique B-trees
+        
+        # Covering indexes (INCLUDE) for the hot listing paths so counts and
+        # narrow projections can be answered by index-only scans. Those need
+        # an up-to-date visibility map: VACUUM ANALYZE after bulk onboarding.
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_venues_city ON venues (lower(city)) "
+        "INCLUDE (name, slug, google_rating) WHERE is_active",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_venues_category ON venues (primary_category)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_venues_rating ON venues (google_rating)",
+        # Partial indexes on the hot "active only" predicates; a plain index on
+        # the mostly-true is_active flag would never be selective
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_venues_active_city ON venues (city) WHERE is_active",
+        # GiST over point(lon, lat) supports kNN (<->) and box/radius searches,
+        # which a (latitude, longitude) B-tree can only serve by stripe scans
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_venues_location ON venues USING gist (point(longitude, latitude))",
+    ),
+    'activities': (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_activities_venue_id ON activities (venue_id) "
+        "INCLUDE (name, category, credits_required)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_activities_category ON activities (category)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_activities_age_range ON activities (min_age, max_age)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_activities_active_category ON activities (category) WHERE is_active",
+    ),
+    'vendor_credentials': (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_vendor_creds_venue_id ON vendor_credentials (venue_id)",
+    ),
+    'google_reviews': (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_google_reviews_venue_id ON google_reviews (venue_id)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_google_reviews_unprocessed ON google_reviews (venue_id) WHERE (status & 1) = 0",
+    ),
+    'venue_quality_scores': (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_quality_scores_overall ON venue_quality_scores (overall_score)",
+    ),
+    # venue_mock_pricing needs no extra index: venue_id is the leading column
+    # of the uq_venue_activity_pricing unique constraint
+}
+
+
+# =============================================================================
+# VECTOR INDEX SQL
+# =============================================================================
+# Approximate nearest-neighbour indexes for the description_embedding columns.
+# Embeddings are stored as halfvec (FP16, pgvector >= 0.7.0), which halves the
+# bytes read per distance computation; every pgvector release with halfvec
+# also has HNSW, so no IVFFlat fallback is needed.
+EMBEDDING_INDEX_SQL = {
+    'venues': (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_venues_embedding ON venues "
+        "USING hnsw (description_embedding halfvec_cosine_ops) WITH (m = 16, ef_construction = 64)",
+    ),
+    'activities': (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_activities_embedding ON activities "
+        "USING hnsw (description_embedding halfvec_cosine_ops) WITH (m = 16, ef_construction = 64)",
+    ),
+}
+
+
+# =============================================================================
+# PARALLEL INDEX BUILDS
+# =============================================================================
+# Number of tables whose indexes are built at the same time, each on its own
+# connection, and the parallel workers Postgres may use for each build
+INDEX_BUILD_WORKERS = 4
+MAX_PARALLEL_MAINTENANCE_WORKERS = 8
+
+
+def _build_indexes_in_parallel(index_sql: Dict[str, Tuple[str, ...]]) -> None:
     """
-    Create initial database schema.
+    Build each table's indexes concurrently on separate connections.
     
-    This creates all tables needed for Phase 1 of Nexus Family Pass.
+    Args:
+        index_sql: CREATE INDEX statements grouped by table name
     """
-    
-    # =========================================================================
-    # ENABLE EXTENSIONS
-    # =========================================================================
-    # Enable pgvector extension for vector embeddings
-    # Required for semantic search functionality
-    op.execute('CREATE EXTENSION IF NOT EXISTS vector')
-    
-    # Enable pg_trgm for fuzzy text search (fallback when Pinecone unavailable)
-    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
-    
-    # =========================================================================
-    # VENUES TABLE
-    # =========================================================================
-    op.create_table(
-        'venues',
-        # Primary key
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False,
-                  server_default=sa.text('gen_random_uuid()')),
-        
-        # Google Places data
-        sa.Column('google_place_id', sa.String(255), nullable=True, unique=True),
-        sa.Column('name', sa.String(255), nullable=False),
-        sa.Column('slug', sa.String(255), nullable=False, unique=True),
-        
-        # Descriptions
-        sa.Column('short_description', sa.String(150), nullable=True),
-        sa.Column('full_description', sa.Text(), nullable=True),
-        
-        # Category
-        sa.Column('primary_category', sa.String(50), nullable=True),
-        
-        # Location
-        sa.Column('address_line1', sa.String(255), nullable=True),
-        sa.Column('address_line2', sa.String(255), nullable=True),
-        sa.Column('city', sa.String(100), nullable=True),
-        sa.Column('state', sa.String(100), nullable=True),
-        sa.Column('postal_code', sa.String(20), nullable=True),
-        sa.Column('country', sa.String(100), nullable=True, server_default='India'),
-        
-        # Coordinates
-        sa.Column('latitude', sa.Numeric(10, 8), nullable=True),
-        sa.Column('longitude', sa.Numeric(11, 8), nullable=True),
-        
-        # Contact
-        sa.Column('contact_phone', sa.String(50), nullable=True),
-        sa.Column('website_url', sa.String(500), nullable=True),
-        
-        # Ratings
-        sa.Column('google_rating', sa.Numeric(3, 2), nullable=True),
-        sa.Column('google_review_count', sa.Integer(), nullable=False, server_default='0'),
-        
-        # Status
-        sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        sa.Column('data_source', sa.String(50), nullable=False, server_default='google_places'),
-        
-        # Metadata (JSONB)
-        sa.Column('business_hours', postgresql.JSONB(), nullable=True),
-        sa.Column('google_types', postgresql.JSONB(), nullable=True),
-        sa.Column('photos_urls', postgresql.JSONB(), nullable=True, server_default='[]'),
-        
-        # Vector embedding for semantic search (768 dimensions for Gemini)
-        # Note: Using raw SQL for vector type as SQLAlchemy doesn't support it natively
-        
-        # Embedding sync tracking
-        sa.Column('embedding_outdated', sa.Boolean(), nullable=False, server_default='true'),
-        sa.Column('last_embedding_update', sa.DateTime(timezone=True), nullable=True),
-        
-        # Timestamps
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False,
-                  server_default=sa.text('CURRENT_TIMESTAMP')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False,
-                  server_default=sa.text('CURRENT_TIMESTAMP')),
-        
-        # Primary key constraint
-        sa.PrimaryKeyConstraint('id'),
-    )
-    
-    # Add vector column using raw SQL (pgvector)
-    op.execute('''
-        ALTER TABLE venues 
-        ADD COLUMN description_embedding vector(768)
-    ''')
-    
-    # Create indexes for venues
-    op.create_index('idx_venues_slug', 'venues', ['slug'])
-    op.create_index('idx_venues_google_place_id', 'venues', ['google_place_id'])
-    op.create_index('idx_venues_city', 'venues', ['city'])
-    op.create_index('idx_venues_category', 'venues', ['primary_category'])
-    op.create_index('idx_venues_rating', 'venues', ['google_rating'])
-    op.create_index('idx_venues_active', 'venues', ['is_active'])
-    op.create_index('idx_venues_coordinates', 'venues', ['latitude', 'longitude'])
-    
-    # =========================================================================
-    # ACTIVITIES TABLE
-    # =========================================================================
-    op.create_table(
-        'activities',
-        # Primary key
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False,
-                  server_default=sa.text('gen_random_uuid()')),
-        
-        # Foreign key to venue
-        sa.Column('venue_id', postgresql.UUID(as_uuid=True), nullable=False),
-        
-        # Basic info
-        sa.Column('name', sa.String(255), nullable=False),
-        sa.Column('slug', sa.String(255), nullable=False),
-        sa.Column('short_description', sa.String(150), nullable=True),
-        sa.Column('full_description', sa.Text(), nullable=True),
-        sa.Column('category', sa.String(50), nullable=False),
-        
-        # Requirements
-        sa.Column('min_age', sa.Integer(), nullable=False, server_default='3'),
-        sa.Column('max_age', sa.Integer(), nullable=False, server_default='15'),
-        sa.Column('duration_minutes', sa.Integer(), nullable=False, server_default='60'),
-        sa.Column('capacity_per_session', sa.Integer(), nullable=False, server_default='15'),
-        
-        # Pricing
-        sa.Column('credits_required', sa.Integer(), nullable=False, server_default='2'),
-        
-        # Metadata (JSONB)
-        sa.Column('activity_tags', postgresql.JSONB(), nullable=True),
-        sa.Column('learning_outcomes', postgresql.JSONB(), nullable=True, server_default='[]'),
-        sa.Column('what_to_bring', postgresql.JSONB(), nullable=True, server_default='[]'),
-        sa.Column('photos_urls', postgresql.JSONB(), nullable=True, server_default='[]'),
-        
-        # Ratings (denormalized)
-        sa.Column('average_rating', sa.Numeric(3, 2), nullable=True),
-        sa.Column('total_reviews', sa.Integer(), nullable=False, server_default='0'),
-        
-        # Status
-        sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        
-        # Embedding sync
-        sa.Column('embedding_outdated', sa.Boolean(), nullable=False, server_default='true'),
-        
-        # Timestamps
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False,
-                  server_default=sa.text('CURRENT_TIMESTAMP')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False,
-                  server_default=sa.text('CURRENT_TIMESTAMP')),
-        
-        # Constraints
-        sa.PrimaryKeyConstraint('id'),
-        sa.ForeignKeyConstraint(['venue_id'], ['venues.id'], ondelete='CASCADE'),
-    )
-    
-    # Add vector column
-    op.execute('''
-        ALTER TABLE activities 
-        ADD COLUMN description_embedding vector(768)
-    ''')
-    
-    # Create indexes for activities
-    op.create_index('idx_activities_venue_id', 'activities', ['venue_id'])
-    op.create_index('idx_activities_category', 'activities', ['category'])
-    op.create_index('idx_activities_age_range', 'activities', ['min_age', 'max_age'])
-    op.create_index('idx_activities_active', 'activities', ['is_active'])
-    
-    # =========================================================================
-    # ACTIVITY SESSIONS TABLE
-    # =========================================================================
-    op.create_table(
-        'activity_sessions',
-        # Primary key
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False,
-                  server_default=sa.text('gen_random_uuid()')),
-        
-        # Foreign key to activity
-        sa.Column('activity_id', postgresql.UUID(as_uuid=True), nullable=False),
-        
-        # Schedule
-        sa.Column('session_date', sa.Date(), nullable=False),
-        sa.Column('start_time', sa.Time(), nullable=False),
-        sa.Column('end_time', sa.Time(), nullable=False),
-        sa.Column('timezone', sa.String(50), nullable=False, server_default='Asia/Kolkata'),
-        
-        # Capacity
-        sa.Column('total_capacity', sa.Integer(), nullable=False, server_default='15'),
-        sa.Column('booked_count', sa.Integer(), nullable=False, server_default='0'),
-        
-        # Status
-        sa.Column('is_cancelled', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('cancellation_reason', sa.Text(), nullable=True),
-        sa.Column('is_completed', sa.Boolean(), nullable=False, server_default='false'),
-        
-        # Instructor
-        sa.Column('instructor_name', sa.String(255), nullable=True),
-        sa.Column('session_notes', sa.Text(), nullable=True),
-        
-        # Timestamps
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False,
-                  server_default=sa.text('CURRENT_TIMESTAMP')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False,
-                  server_default=sa.text('CURRENT_TIMESTAMP')),
-        
-        # Constraints
-        sa.PrimaryKeyConstraint('id'),
-        sa.ForeignKeyConstraint(['activity_id'], ['activities.id'], ondelete='CASCADE'),
+    # Dedicated autocommit connections to the same database as the migration
+    engine = sa.create_engine(
+        op.get_bind().engine.url,
+        poolclass=pool.NullPool,
+        isolation_level="AUTOCOMMIT",
     )
     
-    # Create indexes for sessions
-    op.create_index('idx_sessions_activity_id', 'activity_sessions', ['activity_id'])
-    op.create_index('idx_sessions_date', 'activity_sessions', ['session_date'])
-    op.create_index('idx_sessions_available', 'activity_sessions', 
-                    ['activity_id', 'session_date', 'is_cancelled'])
+    def build(statements: Tuple[str, ...]) -> None:
+        with engine.connect() as connection:
+            connection.exec_driver_sql(
+                f"SET max_parallel_maintenance_workers = {MAX_PARALLEL_MAINTENANCE_WORKERS}"
+            )
+            for statement in statements:
+                connection.exec_driver_sql(statement)
     
-    # =========================================================================
-    # VENDOR CREDENTIALS TABLE
-    # =========================================================================
-    op.create_table(
-        'vendor_credentials',
-        # Primary key
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False,
-                  server_default=sa.text('gen_random_uuid()')),
-        
-        # Foreign key to venue
-        sa.Column('venue_id', postgresql.UUID(as_uuid=True), nullable=False),
-        
-        # Authentication
-        sa.Column('email', sa.String(255), nullable=False, unique=True),
-        sa.Column('password_hash', sa.String(255), nullable=False),
-        
-        # Profile
-        sa.Column('name', sa.String(255), nullable=False),
-        sa.Column('phone', sa.String(50), nullable=True),
-        
-        # Status
-        sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        
-        # Login tracking
-        sa.Column('last_login_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('last_login_ip', postgresql.INET(), nullable=True),
-        
-        # Password reset
-        sa.Column('password_reset_token', sa.String(255), nullable=True),
-        sa.Column('password_reset_expires_at', sa.DateTime(timezone=True), nullable=True),
-        
-        # Timestamps
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False,
-                  server_default=sa.text('CURRENT_TIMESTAMP')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False,
-                  server_default=sa.text('CURRENT_TIMESTAMP')),
-        
-        # Constraints
-        sa.PrimaryKeyConstraint('id'),
-        sa.ForeignKeyConstraint(['venue_id'], ['venues.id'], ondelete='CASCADE'),
-    )
-    
-    # Create indexes for vendor credentials
-    op.create_index('idx_vendor_creds_email', 'vendor_credentials', ['email'])
-    op.create_index('idx_vendor_creds_venue_id', 'vendor_credentials', ['venue_id'])
-    
-    # =========================================================================
-    # GOOGLE REVIEWS TABLE
-    # =========================================================================
-    op.create_table(
-        'google_reviews',
-        # Primary key
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False,
-                  server_default=sa.text('gen_random_uuid()')),
-        
-        # Foreign key to venue
-        sa.Column('venue_id', postgresql.UUID(as_uuid=True), nullable=False),
-        
-        # Google data
-        sa.Column('google_review_id', sa.String(255), nullable=True, unique=True),
-        sa.Column('author_name', sa.String(255), nullable=True),
-        sa.Column('author_url', sa.String(500), nullable=True),
-        sa.Column('profile_photo_url', sa.String(500), nullable=True),
-        
-        # Review content
-        sa.Column('rating', sa.Integer(), nullable=False),
-        sa.Column('text', sa.Text(), nullable=True),
-        sa.Column('language', sa.String(10), nullable=True),
-        sa.Column('relative_time_description', sa.String(100), nullable=True),
-        sa.Column('review_time', sa.DateTime(timezone=True), nullable=True),
-        
-        # Processing status
-        sa.Column('is_processed', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('processed_at', sa.DateTime(timezone=True), nullable=True),
-        
-        # Timestamps
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False,
-                  server_default=sa.text('CURRENT_TIMESTAMP')),
-        
-        # Constraints
-        sa.PrimaryKeyConstraint('id'),
-        sa.ForeignKeyConstraint(['venue_id'], ['venues.id'], ondelete='CASCADE'),
-    )
-    
-    # Create indexes for reviews
-    op.create_index('idx_google_reviews_venue_id', 'google_reviews', ['venue_id'])
-    op.create_index('idx_google_reviews_processed', 'google_reviews', ['is_processed'])
-    
-    # =========================================================================
-    # VENUE QUALITY SCORES TABLE
-    # =========================================================================
-    op.create_table(
-        'venue_quality_scores',
-        # Primary key
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False,
-                  server_default=sa.text('gen_random_uuid()')),
-        
-        # Foreign key to venue (one-to-one)
-        sa.Column('venue_id', postgresql.UUID(as_uuid=True), nullable=False, unique=True),
-        
-        # Individual quality scores (1-5 scale)
-        sa.Column('hygiene_score', sa.Numeric(3, 2), nullable=True),
-        sa.Column('safety_score', sa.Numeric(3, 2), nullable=True),
-        sa.Column('teaching_score', sa.Numeric(3, 2), nullable=True),
-        sa.Column('facilities_score', sa.Numeric(3, 2), nullable=True),
-        sa.Column('value_score', sa.Numeric(3, 2), nullable=True),
-        sa.Column('ambience_score', sa.Numeric(3, 2), nullable=True),
-        sa.Column('staff_score', sa.Numeric(3, 2), nullable=True),
-        sa.Column('location_score', sa.Numeric(3, 2), nullable=True),
-        
-        # Composite score
-        sa.Column('overall_score', sa.Numeric(3, 2), nullable=True),
-        
-        # Confidence and metadata
-        sa.Column('confidence', sa.Numeric(4, 3), nullable=True),
-        sa.Column('review_count_analyzed', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('key_phrases', postgresql.JSONB(), nullable=True),
-        
-        # Processing info
-        sa.Column('model_version', sa.String(50), nullable=True),
-        sa.Column('processed_at', sa.DateTime(timezone=True), nullable=False,
-                  server_default=sa.text('CURRENT_TIMESTAMP')),
-        
-        # Constraints
-        sa.PrimaryKeyConstraint('id'),
-        sa.ForeignKeyConstraint(['venue_id'], ['venues.id'], ondelete='CASCADE'),
-    )
+    try:
+        with ThreadPoolExecutor(max_workers=INDEX_BUILD_WORKERS) as executor:
+            futures = [executor.submit(build, statements) for statements in index_sql.values()]
+            
+            # Surface the first failure, if any
+            for future in as_completed(futures):
+                future.result()
+    finally:
+        engine.dispose()
+
+
+# =============================================================================
+# UPGRADE
+# =============================================================================
+def upgrade() -> None:
+    """
+    Create initial database schema.
     
-    # Create indexes for quality scores
-    op.create_index('idx_quality_scores_venue_id', 'venue_quality_scores', ['venue_id'])
-    op.create_index('idx_quality_scores_overall', 'venue_quality_scores', ['overall_score'])
+    This creates all tables needed for Phase 1 of Nexus Family Pass
+    by executing SCHEMA_SQL in a single batch, then builds the indexes
+    concurrently (and one table per worker in parallel) once the tables
+    are committed.
+    """
+    if context.is_offline_mode():
+        # Offline (--sql) mode has no live connection; emit the script as-is
+        op.execute(SCHEMA_SQL)
+    else:
+        # Send the whole script to the driver without SQLAlchemy compilation.
+        # no_parameters keeps psycopg2 from reading the format() specifiers
+        # in the partition DO block (%I, %L) as bind placeholders.
+        op.get_bind().exec_driver_sql(
+            SCHEMA_SQL,
+            execution_options={"no_parameters": True},
+        )
     
-    # =========================================================================
-    # VENUE MOCK PRICING TABLE
-    # =========================================================================
-    op.create_table(
-        'venue_mock_pricing',
-        # Primary key
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False,
-                  server_default=sa.text('gen_random_uuid()')),
-        
-        # Foreign key to venue
-        sa.Column('venue_id', postgresql.UUID(as_uuid=True), nullable=False),
-        
-        # Activity type
-        sa.Column('activity_type', sa.String(50), nullable=False),
-        
-        # Prices in INR
-        sa.Column('weekday_price_inr', sa.Numeric(10, 2), nullable=False),
-        sa.Column('weekend_price_inr', sa.Numeric(10, 2), nullable=False),
-        
-        # Source
-        sa.Column('price_source', sa.String(50), nullable=False, server_default='algorithm'),
-        
-        # Timestamps
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False,
-                  server_default=sa.text('CURRENT_TIMESTAMP')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False,
-                  server_default=sa.text('CURRENT_TIMESTAMP')),
-        
-        # Constraints
-        sa.PrimaryKeyConstraint('id'),
-        sa.ForeignKeyConstraint(['venue_id'], ['venues.id'], ondelete='CASCADE'),
-        sa.UniqueConstraint('venue_id', 'activity_type', name='uq_venue_activity_pricing'),
-    )
+    # Merge per-table index groups (B-tree/GiST plus HNSW)
+    index_sql = {
+        table: INDEX_SQL.get(table, ()) + EMBEDDING_INDEX_SQL.get(table, ())
+        for table in {**INDEX_SQL, **EMBEDDING_INDEX_SQL}
+    }
     
-    # Create indexes for mock pricing
-    op.create_index('idx_mock_pricing_venue_id', 'venue_mock_pricing', ['venue_id'])
+    # Build indexes outside the migration transaction
+    with op.get_context().autocommit_block():
+        if context.is_offline_mode():
+            for statements in index_sql.values():
+                for statement in statements:
+                    op.execute(statement)
+        else:
+            _build_indexes_in_parallel(index_sql)
 
 
 # =============================================================================
@@ -434,10 +591,15 @@ def upgrade() -> None:
 # =============================================================================
 def downgrade() -> None:
     """
-    Drop all tables created in this migration.
+    Drop all tables, triggers and functions created in this migration.
     
     WARNING: This will delete all data! Use with caution.
     """
+    # Drop the updated_at triggers (dropping the tables would also remove
+    # them; explicit so nothing depends on moddatetime below)
+    for table in UPDATED_AT_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+    
     # Drop tables in reverse order (to handle foreign key constraints)
     op.drop_table('venue_mock_pricing')
     op.drop_table('venue_quality_scores')
@@ -447,4 +609,9 @@ def downgrade() -> None:
     op.drop_table('activities')
     op.drop_table('venues')
     
-    # Note: Extensions are not dropped as they may be used by other applications
+    # Drop the UUID generator the table defaults used
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
+    
+    # moddatetime only backs the triggers above. The vector and pg_trgm
+    # extensions are not dropped as they may be used by other applications
+    op.execute("DROP EXTENSION IF EXISTS moddatetime")
@@ -0,0 +1,88 @@
+"""Add webhook_jobs table
+
+Revision ID: 002_webhook_jobs
+Revises: 001_initial_schema
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+# =============================================================================
+# NEXUS FAMILY PASS - WEBHOOK JOBS
+# =============================================================================
+"""
+This migration adds the webhook_jobs table.
+
+Webhook job status used to live in a per-process dict, so polling a job
+only worked when the request happened to reach the worker that created
+it. Storing jobs in Postgres makes them visible to every worker.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+from typing import Sequence, Union
+
+from alembic import op
+
+# =============================================================================
+# REVISION IDENTIFIERS
+# =============================================================================
+revision: str = '002_webhook_jobs'
+down_revision: Union[str, None] = '001_initial_schema'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# =============================================================================
+# SCHEMA SQL
+# =============================================================================
+SCHEMA_SQL = """
+CREATE TABLE webhook_jobs (
+    -- Primary key (public job ID)
+    id UUID NOT NULL DEFAULT uuid_generate_v7(),
+
+    -- Job state
+    job_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    message TEXT NOT NULL,
+
+    -- Request, output and errors
+    payload JSONB,
+    result JSONB,
+    errors JSONB,
+
+    -- Timestamps
+    completed_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (id)
+);
+
+CREATE INDEX idx_webhook_jobs_created_at ON webhook_jobs (created_at);
+
+CREATE TRIGGER trg_webhook_jobs_updated_at BEFORE UPDATE ON webhook_jobs
+FOR EACH ROW EXECUTE FUNCTION moddatetime(updated_at);
+"""
+
+
+# =============================================================================
+# UPGRADE
+# =============================================================================
+def upgrade() -> None:
+    """
+    Create the webhook_jobs table.
+    
+    The table is new and empty, so its index is built in the same
+    transaction rather than CONCURRENTLY.
+    """
+    op.execute(SCHEMA_SQL)
+
+
+# =============================================================================
+# DOWNGRADE
+# =============================================================================
+def downgrade() -> None:
+    """
+    Drop the webhook_jobs table.
+    """
+    op.drop_table('webhook_jobs')
@@ -0,0 +1,70 @@
+"""Add webhook job dedupe key
+
+Revision ID: 003_webhook_job_dedupe
+Revises: 002_webhook_jobs
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+# =============================================================================
+# NEXUS FAMILY PASS - WEBHOOK JOB DEDUPLICATION
+# =============================================================================
+"""
+This migration adds webhook_jobs.dedupe_key.
+
+N8N retries a webhook when a response is slow or lost, which used to
+start the same workflow twice. The partial unique index allows only one
+pending or running job per identical request; create_job returns the
+existing job's ID instead of queuing a duplicate.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+from typing import Sequence, Union
+
+from alembic import op
+
+# =============================================================================
+# REVISION IDENTIFIERS
+# =============================================================================
+revision: str = '003_webhook_job_dedupe'
+down_revision: Union[str, None] = '002_webhook_jobs'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# =============================================================================
+# SCHEMA SQL
+# =============================================================================
+SCHEMA_SQL = """
+ALTER TABLE webhook_jobs ADD COLUMN dedupe_key TEXT;
+
+COMMENT ON COLUMN webhook_jobs.dedupe_key IS
+    'Hash of job type and request for deduplication';
+
+CREATE UNIQUE INDEX idx_webhook_jobs_in_flight_dedupe ON webhook_jobs (dedupe_key)
+WHERE status IN ('pending', 'running');
+"""
+
+
+# =============================================================================
+# UPGRADE
+# =============================================================================
+def upgrade() -> None:
+    """
+    Add the dedupe_key column and its in-flight unique index.
+    
+    Existing rows get NULL keys, which the unique index ignores.
+    """
+    op.execute(SCHEMA_SQL)
+
+
+# =============================================================================
+# DOWNGRADE
+# =============================================================================
+def downgrade() -> None:
+    """
+    Drop the dedupe_key column (and with it the index).
+    """
+    op.execute("DROP INDEX IF EXISTS idx_webhook_jobs_in_flight_dedupe")
+    op.drop_column('webhook_jobs', 'dedupe_key')
@@ -0,0 +1,73 @@
+"""Add webhook job lease columns
+
+Revision ID: 004_webhook_job_lease
+Revises: 003_webhook_job_dedupe
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+# =============================================================================
+# NEXUS FAMILY PASS - WEBHOOK JOB LEASES
+# =============================================================================
+"""
+This migration adds webhook_jobs.heartbeat_at and webhook_jobs.attempts.
+
+A job left running by a worker that crashed or was killed used to stay
+running forever (and, through the in-flight dedupe index, swallow every
+retry of the same request). The worker running a job now refreshes
+heartbeat_at; a running job whose heartbeat is older than the lease is
+claimed again, or failed once it has used up its attempts.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+from typing import Sequence, Union
+
+from alembic import op
+
+# =============================================================================
+# REVISION IDENTIFIERS
+# =============================================================================
+revision: str = '004_webhook_job_lease'
+down_revision: Union[str, None] = '003_webhook_job_dedupe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# =============================================================================
+# SCHEMA SQL
+# =============================================================================
+SCHEMA_SQL = """
+ALTER TABLE webhook_jobs
+    ADD COLUMN heartbeat_at TIMESTAMP WITH TIME ZONE,
+    ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0;
+
+COMMENT ON COLUMN webhook_jobs.heartbeat_at IS
+    'Last heartbeat from the worker running the job';
+COMMENT ON COLUMN webhook_jobs.attempts IS
+    'Number of times the job has been claimed';
+"""
+
+
+# =============================================================================
+# UPGRADE
+# =============================================================================
+def upgrade() -> None:
+    """
+    Add the lease columns.
+    
+    Jobs already running get a NULL heartbeat; the worker treats those as
+    expired, so they are picked up again after the upgrade.
+    """
+    op.execute(SCHEMA_SQL)
+
+
+# =============================================================================
+# DOWNGRADE
+# =============================================================================
+def downgrade() -> None:
+    """
+    Drop the lease columns.
+    """
+    op.drop_column('webhook_jobs', 'attempts')
+    op.drop_column('webhook_jobs', 'heartbeat_at')
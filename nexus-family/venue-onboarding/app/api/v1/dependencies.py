@@ -13,13 +13,13 @@ Dependencies are used to:
 
 Usage:
     ```python
-    from app.api.v1.dependencies import get_venue_service
+    from app.api.v1.dependencies import Services, get_services
     
     @router.get("/venues")
     async def list_venues(
-        venue_service: VenueService = Depends(get_venue_service)
+        services: Services = Depends(get_services)
     ):
-        return await venue_service.list_venues()
+        return await services.venue.list_venues()
     ```
 """
 
@@ -27,14 +27,21 @@ Usage:
 # IMPORTS
 # =============================================================================
 # Standard library imports
-from typing import Optional  # Type hints
+import hashlib  # Token hashing for the session cache
+import time  # Monotonic clock for cache expiry
+from collections import OrderedDict  # LRU ordering for the session cache
+from dataclasses import dataclass  # Service container
+from datetime import datetime  # Session expiry handling
+from functools import cached_property  # Lazy service construction
+from typing import Optional, Tuple  # Type hints
 from uuid import UUID  # UUID type
 
 # Third-party imports
-from fastapi import Depends, Header, HTTPException, status  # FastAPI utilities
+from fastapi import Depends, Header, HTTPException, Query, status  # FastAPI utilities
 from sqlalchemy.ext.asyncio import AsyncSession  # Session type
 
 # Local imports
+from app.config import settings  # Configuration
 from app.core.database import get_db  # Database session
 from app.core.security import get_session  # Session management
 from app.services.venue_service import VenueService  # Services
@@ -46,92 +53,193 @@ from app.core.exceptions import AuthenticationError  # Exceptions
 # =============================================================================
 # SERVICE DEPENDENCIES
 # =============================================================================
-async def get_venue_service(
+@dataclass
+class Services:
+    """
+    Per-request container for the service layer.
+    
+    All services share the request's database session. Each one is
+    constructed lazily on first access and then reused, so an endpoint
+    (and the auth dependencies it pulls in) only pays for the services
+    it actually touches.
+    
+    Attributes:
+        db: Request-scoped database session
+    """
+    
+    db: AsyncSession
+    
+    @cached_property
+    def venue(self) -> VenueService:
+        """VenueService bound to this request's session."""
+        return VenueService(self.db)
+    
+    @cached_property
+    def activity(self) -> ActivityService:
+        """ActivityService bound to this request's session."""
+        return ActivityService(self.db)
+    
+    @cached_property
+    def vendor(self) -> VendorService:
+        """VendorService bound to this request's session."""
+        return VendorService(self.db)
+
+
+async def get_services(
     db: AsyncSession = Depends(get_db),
-) -> VenueService:
+) -> Services:
     """
-    Dependency that provides a VenueService instance.
+    Dependency that provides the per-request Services container.
+    
+    FastAPI caches dependencies per request, so the endpoint and any auth
+    dependency (get_current_vendor) receive the same container and the
+    same pooled connection.
     
     Args:
         db: Database session (injected)
     
     Returns:
-        VenueService: Configured service instance
+        Services: Service container for this request
     
     Example:
         ```python
         @router.get("/venues")
         async def list_venues(
-            service: VenueService = Depends(get_venue_service)
+            services: Services = Depends(get_services)
         ):
-            return await service.list_venues()
+            return await services.venue.list_venues()
         ```
     """
-    return VenueService(db)
+    return Services(db)
 
 
-async def get_activity_service(
-    db: AsyncSession = Depends(get_db),
-) -> ActivityService:
+# =============================================================================
+# SESSION VALIDATION CACHE
+# =============================================================================
+# Validated sessions, keyed by a hash of the bearer token so raw tokens are
+# never held here. Repeat requests with the same token skip the database
+# check in VendorService.validate_session. Entries live for at most
+# settings.SESSION_CACHE_TTL_SECONDS (or until the session itself expires),
+# which bounds how long a deactivated vendor can keep using an existing token.
+_SESSION_CACHE_MAXSIZE = 10_000
+_session_cache: "OrderedDict[bytes, Tuple[float, dict]]" = OrderedDict()
+
+
+def _token_key(token: str) -> bytes:
     """
-    Dependency that provides an ActivityService instance.
+    Hash a session token into a compact cache key.
     
     Args:
-        db: Database session (injected)
+        token: Raw session token
     
     Returns:
-        ActivityService: Configured service instance
+        bytes: 16-byte BLAKE2b digest of the token
     """
-    return ActivityService(db)
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
 
 
-async def get_vendor_service(
-    db: AsyncSession = Depends(get_db),
-) -> VendorService:
+def _get_cached_session(token: str) -> Optional[dict]:
     """
-    Dependency that provides a VendorService instance.
+    Look up a previously validated session.
     
     Args:
-        db: Database session (injected)
+        token: Raw session token
     
     Returns:
-        VendorService: Configured service instance
+        Optional[dict]: Cached session data, or None on a miss/expiry
     """
-    return VendorService(db)
+    key = _token_key(token)
+    entry = _session_cache.get(key)
+    
+    if entry is None:
+        return None
+    
+    expires_at, session = entry
+    if time.monotonic() >= expires_at:
+        del _session_cache[key]
+        return None
+    
+    # Mark as recently used
+    _session_cache.move_to_end(key)
+    return session
+
+
+def _cache_session(token: str, session: dict) -> None:
+    """
+    Store a validated session in the cache.
+    
+    Args:
+        token: Raw session token
+        session: Session data returned by VendorService.validate_session
+    """
+    # Never cache beyond the session's own expiry
+    remaining = (
+        datetime.fromisoformat(session["expires_at"]) - datetime.utcnow()
+    ).total_seconds()
+    ttl = min(settings.SESSION_CACHE_TTL_SECONDS, remaining)
+    
+    if ttl <= 0:
+        return
+    
+    key = _token_key(token)
+    _session_cache[key] = (time.monotonic() + ttl, session)
+    _session_cache.move_to_end(key)
+    
+    # Evict least recently used entries beyond the size limit
+    while len(_session_cache) > _SESSION_CACHE_MAXSIZE:
+        _session_cache.popitem(last=False)
+
+
+def invalidate_token(token: str) -> None:
+    """
+    Drop a token from the session validation cache.
+    
+    Must be called whenever a session is deleted (e.g. logout) so the
+    token stops authenticating immediately rather than after the TTL.
+    
+    Args:
+        token: Raw session token
+    """
+    _session_cache.pop(_token_key(token), None)
 
 
 # =============================================================================
 # AUTHENTICATION DEPENDENCIES
 # =============================================================================
-async def get_current_vendor(
-    authorization: Optional[str] = Header(None, alias="Authorization"),
-    vendor_service: VendorService = Depends(get_vendor_service),
-) -> dict:
+# Authorization scheme prefix, compared case-insensitively (RFC 7235)
+_BEARER_PREFIX = "bearer "
+
+
+def _extract_bearer_token(authorization: Optional[str]) -> Optional[str]:
     """
-    Dependency that validates vendor authentication and returns vendor info.
+    Extract the token from an Authorization header without raising.
     
-    This dependency extracts the session token from the Authorization header,
-    validates it, and returns the vendor's session data.
+    Uses a single slice for the case-insensitive scheme check (no
+    split/list allocation on every request).
     
     Args:
-        authorization: Authorization header value (Bearer token)
-        vendor_service: Vendor service (injected)
+        authorization: Authorization header value
+    
+    Returns:
+        Optional[str]: The bearer token, or None if missing/malformed
+    """
+    if authorization and authorization[:7].lower() == _BEARER_PREFIX:
+        return authorization[7:].strip() or None
+    return None
+
+
+def parse_bearer_token(authorization: Optional[str]) -> str:
+    """
+    Extract the token from a "Bearer <token>" Authorization header.
+    
+    Args:
+        authorization: Authorization header value
     
     Returns:
-        dict: Vendor session data including vendor_id and venue_id
+        str: The bearer token
     
     Raises:
-        HTTPException: If authentication fails
-    
-    Example:
-        ```python
-        @router.get("/me")
-        async def get_profile(
-            current_vendor: dict = Depends(get_current_vendor)
-        ):
-            vendor_id = current_vendor["user_id"]
-            return {"vendor_id": vendor_id}
-        ```
+        HTTPException: If the header is missing or malformed
     """
     # Check if Authorization header is present
     if not authorization:
@@ -142,19 +250,83 @@ async def get_current_vendor(
         )
     
     # Extract token from "Bearer <token>" format
-    parts = authorization.split()
+    token = _extract_bearer_token(authorization)
     
-    if len(parts) != 2 or parts[0].lower() != "bearer":
+    if token is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authorization format. Use 'Bearer <token>'",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    token = parts[1]
+    return token
+
+
+async def _try_validate(token: str, services: "Services") -> Optional[dict]:
+    """
+    Resolve a session token to session data without raising.
+    
+    Checks the session validation cache first and only falls through to
+    VendorService.validate_session on a miss.
+    
+    Args:
+        token: Raw session token
+        services: Service container
+    
+    Returns:
+        Optional[dict]: Session data, or None if the token is not valid
+    """
+    # Fast path: session validated recently
+    session = _get_cached_session(token)
+    if session is not None:
+        return session
+    
+    session = await services.vendor.validate_session(token)
+    if session is not None:
+        # Parse the vendor ID once per cache fill, not once per request
+        session["vendor_uuid"] = UUID(session["user_id"])
+        _cache_session(token, session)
+    
+    return session
+
+
+async def get_current_vendor(
+    authorization: Optional[str] = Header(None, alias="Authorization"),
+    services: Services = Depends(get_services),
+) -> dict:
+    """
+    Dependency that validates vendor authentication and returns vendor info.
     
-    # Validate session
-    session = await vendor_service.validate_session(token)
+    This dependency extracts the session token from the Authorization header,
+    validates it, and returns the vendor's session data. Validated sessions
+    are cached briefly (see settings.SESSION_CACHE_TTL_SECONDS) to avoid a
+    database lookup on every request.
+    
+    Args:
+        authorization: Authorization header value (Bearer token)
+        services: Service container (injected)
+    
+    Returns:
+        dict: Vendor session data, with the parsed vendor ID under
+            "vendor_uuid" (the dict is shared; do not mutate it)
+    
+    Raises:
+        HTTPException: If authentication fails
+    
+    Example:
+        ```python
+        @router.get("/me")
+        async def get_profile(
+            current_vendor: dict = Depends(get_current_vendor)
+        ):
+            vendor_id = current_vendor["vendor_uuid"]
+            return {"vendor_id": str(vendor_id)}
+        ```
+    """
+    token = parse_bearer_token(authorization)
+    
+    # Validate session (cached)
+    session = await _try_validate(token, services)
     
     if session is None:
         raise HTTPException(
@@ -168,28 +340,28 @@ async def get_current_vendor(
 
 async def get_optional_vendor(
     authorization: Optional[str] = Header(None, alias="Authorization"),
-    vendor_service: VendorService = Depends(get_vendor_service),
+    services: Services = Depends(get_services),
 ) -> Optional[dict]:
     """
     Optional authentication dependency.
     
     Returns vendor session if authenticated, None otherwise.
     Use this for endpoints that work both with and without authentication.
+    Missing or invalid credentials never raise, so anonymous traffic
+    doesn't pay for exception handling.
     
     Args:
         authorization: Authorization header value (optional)
-        vendor_service: Vendor service (injected)
+        services: Service container (injected)
     
     Returns:
         Optional[dict]: Vendor session data or None
     """
-    if not authorization:
+    token = _extract_bearer_token(authorization)
+    if token is None:
         return None
     
-    try:
-        return await get_current_vendor(authorization, vendor_service)
-    except HTTPException:
-        return None
+    return await _try_validate(token, services)
 
 
 # =============================================================================
@@ -200,6 +372,9 @@ class PaginationParams:
     Pagination parameters dependency.
     
     Provides validated pagination parameters with sensible defaults.
+    Built by get_pagination, whose query parameters carry the bounds, so
+    FastAPI validates them while parsing the request (out-of-range values
+    get a 422).
     
     Attributes:
         page: Current page number (1-indexed)
@@ -210,17 +385,15 @@ class PaginationParams:
         ```python
         @router.get("/items")
         async def list_items(
-            pagination: PaginationParams = Depends()
+            pagination: PaginationParams = Depends(get_pagination)
         ):
             return items[pagination.skip:pagination.skip + pagination.page_size]
         ```
     """
     
-    def __init__(
-        self,
-        page: int = 1,
-        page_size: int = 20,
-    ) -> None:
+    __slots__ = ("page", "page_size", "skip")
+    
+    def __init__(self, page: int = 1, page_size: int = 20) -> None:
         """
         Initialize pagination parameters.
         
@@ -228,14 +401,32 @@ class PaginationParams:
             page: Page number (default: 1, min: 1)
             page_size: Items per page (default: 20, min: 1, max: 100)
         """
-        # Validate and set page
-        self.page = max(1, page)
-        
-        # Validate and set page_size (clamp between 1 and 100)
-        self.page_size = max(1, min(100, page_size))
+        self.page = page
+        self.page_size = page_size
         
         # Calculate skip (offset) for database queries
-        self.skip = (self.page - 1) * self.page_size
+        self.skip = (page - 1) * page_size
+
+
+# Parameter dependencies are plain `async def` functions rather than the
+# classes themselves: FastAPI runs any sync callable (including a class
+# used as Depends()) in the threadpool, which costs a thread hop per
+# dependency per request.
+async def get_pagination(
+    page: int = Query(1, ge=1, description="Page number (1-indexed)"),
+    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+) -> PaginationParams:
+    """
+    Dependency that builds pagination parameters from the query string.
+    
+    Args:
+        page: Page number (default: 1, min: 1)
+        page_size: Items per page (default: 20, min: 1, max: 100)
+    
+    Returns:
+        PaginationParams: Validated pagination parameters
+    """
+    return PaginationParams(page, page_size)
 
 
 # =============================================================================
@@ -246,8 +437,11 @@ class VenueFilterParams:
     Venue filtering parameters dependency.
     
     Provides validated filter parameters for venue listing.
+    Built by get_venue_filters, whose query parameters carry the bounds.
     """
     
+    __slots__ = ("city", "category", "min_rating", "search")
+    
     def __init__(
         self,
         city: Optional[str] = None,
@@ -270,13 +464,45 @@ class VenueFilterParams:
         self.search = search
 
 
+async def get_venue_filters(
+    city: Optional[str] = Query(None, max_length=100),
+    category: Optional[str] = Query(None, max_length=100),
+    min_rating: Optional[float] = Query(None, ge=0, le=5),
+    search: Optional[str] = Query(None, max_length=128),
+) -> VenueFilterParams:
+    """
+    Dependency that builds venue filter parameters from the query string.
+    
+    Args:
+        city: Filter by city name
+        category: Filter by primary category
+        min_rating: Minimum Google rating (0-5)
+        search: Text search query
+    
+    Returns:
+        VenueFilterParams: Validated venue filters
+    """
+    return VenueFilterParams(city, category, min_rating, search)
+
+
 class ActivityFilterParams:
     """
     Activity filtering parameters dependency.
     
     Provides validated filter parameters for activity listing.
+    Built by get_activity_filters, whose query parameters carry the bounds.
     """
     
+    __slots__ = (
+        "category",
+        "age",
+        "city",
+        "venue_id",
+        "min_credits",
+        "max_credits",
+        "search",
+    )
+    
     def __init__(
         self,
         category: Optional[str] = None,
@@ -306,3 +532,38 @@ class ActivityFilterParams:
         self.min_credits = min_credits
         self.max_credits = max_credits
         self.search = search
+
+
+async def get_activity_filters(
+    category: Optional[str] = Query(None, max_length=100),
+    age: Optional[int] = Query(None, ge=0, le=18),
+    city: Optional[str] = Query(None, max_length=100),
+    venue_id: Optional[UUID] = None,
+    min_credits: Optional[int] = Query(None, ge=0),
+    max_credits: Optional[int] = Query(None, ge=0),
+    search: Optional[str] = Query(None, max_length=128),
+) -> ActivityFilterParams:
+    """
+    Dependency that builds activity filter parameters from the query string.
+    
+    Args:
+        category: Filter by activity category
+        age: Filter by child's age (0-18)
+        city: Filter by venue city
+        venue_id: Filter by specific venue
+        min_credits: Minimum credits required
+        max_credits: Maximum credits required
+        search: Text search query
+    
+    Returns:
+        ActivityFilterParams: Validated activity filters
+    """
+    return ActivityFilterParams(
+        category=category,
+        age=age,
+        city=city,
+        venue_id=venue_id,
+        min_credits=min_credits,
+        max_credits=max_credits,
+        search=search,
+    )
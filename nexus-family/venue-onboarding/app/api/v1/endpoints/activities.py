@@ -19,15 +19,26 @@ from typing import List, Optional  # Type hints
 from uuid import UUID  # UUID type
 
 # Third-party imports
-from fastapi import APIRouter, Depends, Query, Path  # Router and utilities
+from fastapi import APIRouter, Depends, Query, Path, Request, Response  # Router and utilities
+from fastapi.responses import ORJSONResponse  # Direct JSON responses
+from pydantic import TypeAdapter  # Batch validation
 
 # Local imports
 from app.api.v1.dependencies import (
-    get_activity_service,
+    get_services,
+    get_pagination,
+    get_activity_filters,
+    Services,
     PaginationParams,
     ActivityFilterParams,
 )
-from app.services.activity_service import ActivityService
+from app.api.v1.responses import (
+    list_response,
+    lookup_response,
+    model_response,
+    rows_to_schemas,
+)
+from app.core.cache import get_lookup  # Lookup cache
 from app.schemas.activity import (
     ActivityResponse,
     ActivityListResponse,
@@ -41,21 +52,25 @@ from app.schemas.activity import (
 # =============================================================================
 router = APIRouter()
 
+# Validates a whole page of ORM rows in one call into pydantic-core
+_ACTIVITY_LIST_ADAPTER = TypeAdapter(List[ActivityResponse])
+_SESSION_LIST_ADAPTER = TypeAdapter(List[ActivitySessionResponse])
+
 
 # =============================================================================
 # ENDPOINTS
 # =============================================================================
 @router.get(
     "",
-    response_model=ActivityListResponse,
+    responses={200: {"model": ActivityListResponse}},
     summary="List Activities",
     description="Get a paginated list of activities with optional filtering.",
 )
 async def list_activities(
-    pagination: PaginationParams = Depends(),
-    filters: ActivityFilterParams = Depends(),
-    activity_service: ActivityService = Depends(get_activity_service),
-) -> ActivityListResponse:
+    pagination: PaginationParams = Depends(get_pagination),
+    filters: ActivityFilterParams = Depends(get_activity_filters),
+    services: Services = Depends(get_services),
+) -> Response:
     """
     List all activities with pagination and filtering.
     
@@ -70,7 +85,7 @@ async def list_activities(
     Args:
         pagination: Pagination parameters (page, page_size)
         filters: Filter parameters
-        activity_service: Activity service (injected)
+        services: Service container (injected)
     
     Returns:
         ActivityListResponse: Paginated list of activities
@@ -79,7 +94,7 @@ async def list_activities(
         GET /api/v1/activities?category=sports&age=7&city=Bangalore
     """
     # Call service to get activities
-    activities, total = await activity_service.list_activities(
+    activities, total = await services.activity.list_activities(
         page=pagination.page,
         page_size=pagination.page_size,
         category=filters.category,
@@ -95,34 +110,21 @@ async def list_activities(
     # Calculate pagination metadata
     total_pages = max(1, (total + pagination.page_size - 1) // pagination.page_size)
     
-    # Convert models to response schemas with venue info
-    activity_responses = []
-    for activity in activities:
-        response = ActivityResponse.model_validate(activity)
-        
-        # Add computed display fields
-        response.age_range_display = f"Ages {activity.min_age}-{activity.max_age}"
-        
-        # Format duration
-        if activity.duration_minutes >= 60:
-            hours = activity.duration_minutes // 60
-            mins = activity.duration_minutes % 60
-            if mins == 0:
-                response.duration_display = f"{hours} hour{'s' if hours > 1 else ''}"
-            else:
-                response.duration_display = f"{hours}h {mins}m"
-        else:
-            response.duration_display = f"{activity.duration_minutes} mins"
-        
-        activity_responses.append(response)
-    
-    return ActivityListResponse(
+    # Convert models to response schemas (age_range_display and
+    # duration_display are read from the model's display properties)
+    activity_responses = rows_to_schemas(
+        ActivityResponse,
+        _ACTIVITY_LIST_ADAPTER,
+        activities,
+    )
+    
+    return model_response(ActivityListResponse(
         activities=activity_responses,
         total=total,
         page=pagination.page,
         page_size=pagination.page_size,
         total_pages=total_pages,
-    )
+    ))
 
 
 @router.get(
@@ -132,11 +134,15 @@ async def list_activities(
     description="Get list of available activity categories.",
 )
 async def get_categories(
-    activity_service: ActivityService = Depends(get_activity_service),
-) -> List[str]:
+    request: Request,
+    services: Services = Depends(get_services),
+) -> Response:
     """
     Get list of available activity categories.
     
+    The result is cached briefly and served with an ETag, so repeat
+    requests with If-None-Match get a 304 without a body.
+    
     Returns:
         List of category names
     
@@ -144,7 +150,11 @@ async def get_categories(
         GET /api/v1/activities/categories
         Response: ["sports", "stem", "arts", "music", "dance"]
     """
-    return await activity_service.get_available_categories()
+    body, etag = await get_lookup(
+        "activities:categories",
+        services.activity.get_available_categories,
+    )
+    return lookup_response(request, body, etag)
 
 
 @router.get(
@@ -153,11 +163,14 @@ async def get_categories(
     description="Get the supported age range for activities.",
 )
 async def get_age_range(
-    activity_service: ActivityService = Depends(get_activity_service),
-) -> dict:
+    request: Request,
+    services: Services = Depends(get_services),
+) -> Response:
     """
     Get the range of ages supported by activities.
     
+    Cached and ETagged the same way as /categories.
+    
     Returns:
         dict: min_age and max_age
     
@@ -165,7 +178,11 @@ async def get_age_range(
         GET /api/v1/activities/age-range
         Response: {"min_age": 3, "max_age": 15}
     """
-    return await activity_service.get_age_range()
+    body, etag = await get_lookup(
+        "activities:age_range",
+        services.activity.get_age_range,
+    )
+    return lookup_response(request, body, etag)
 
 
 @router.get(
@@ -180,7 +197,7 @@ async def get_activity(
         True,
         description="Include upcoming sessions in response"
     ),
-    activity_service: ActivityService = Depends(get_activity_service),
+    services: Services = Depends(get_services),
 ) -> ActivityDetailResponse:
     """
     Get detailed activity information.
@@ -195,7 +212,7 @@ async def get_activity(
     Args:
         activity_id: The activity's UUID
         include_sessions: Whether to include upcoming sessions
-        activity_service: Activity service (injected)
+        services: Service container (injected)
     
     Returns:
         ActivityDetailResponse: Detailed activity information
@@ -206,44 +223,15 @@ async def get_activity(
     Example:
         GET /api/v1/activities/123e4567-e89b-12d3-a456-426614174000
     """
-    activity = await activity_service.get_activity_detail(
+    activity = await services.activity.get_activity_detail(
         activity_id,
         include_sessions=include_sessions,
     )
     
-    # Build response
-    response = ActivityDetailResponse.model_validate(activity)
-    
-    # Add computed display fields
-    response.age_range_display = f"Ages {activity.min_age}-{activity.max_age}"
-    
-    # Format duration
-    if activity.duration_minutes >= 60:
-        hours = activity.duration_minutes // 60
-        mins = activity.duration_minutes % 60
-        if mins == 0:
-            response.duration_display = f"{hours} hour{'s' if hours > 1 else ''}"
-        else:
-            response.duration_display = f"{hours}h {mins}m"
-    else:
-        response.duration_display = f"{activity.duration_minutes} mins"
-    
-    # Add venue information
-    if activity.venue:
-        response.venue_name = activity.venue.name
-        response.venue_slug = activity.venue.slug
-        response.venue_rating = activity.venue.google_rating
-        response.venue_address = activity.venue.address_line1
-        response.venue_city = activity.venue.city
-    
-    # Add upcoming sessions if loaded
-    if include_sessions and hasattr(activity, '_upcoming_sessions'):
-        response.upcoming_sessions = [
-            ActivitySessionResponse.model_validate(session)
-            for session in activity._upcoming_sessions
-        ]
-    
-    return response
+    # Build response in one validation pass: display fields come from the
+    # model's properties, venue fields and upcoming sessions from the
+    # schema's validation aliases
+    return ActivityDetailResponse.model_validate(activity)
 
 
 @router.get(
@@ -260,7 +248,7 @@ async def get_activity_sessions(
         le=50,
         description="Maximum sessions to return"
     ),
-    activity_service: ActivityService = Depends(get_activity_service),
+    services: Services = Depends(get_services),
 ) -> ActivitySessionListResponse:
     """
     Get upcoming sessions for an activity.
@@ -273,7 +261,7 @@ async def get_activity_sessions(
     Args:
         activity_id: The activity's UUID
         limit: Maximum sessions to return
-        activity_service: Activity service (injected)
+        services: Service container (injected)
     
     Returns:
         ActivitySessionListResponse: List of upcoming sessions
@@ -281,26 +269,17 @@ async def get_activity_sessions(
     Example:
         GET /api/v1/activities/123e4567.../sessions?limit=20
     """
-    sessions = await activity_service.get_upcoming_sessions(
+    sessions = await services.activity.get_upcoming_sessions(
         activity_id,
         limit=limit,
     )
     
-    # Convert to response format with computed fields
-    session_responses = []
-    for session in sessions:
-        response = ActivitySessionResponse.model_validate(session)
-        
-        # Add computed fields
-        response.available_spots = session.total_capacity - session.booked_count
-        response.is_full = response.available_spots == 0
-        
-        # Format time display
-        start = session.start_time.strftime("%I:%M %p")
-        end = session.end_time.strftime("%I:%M %p")
-        response.time_display = f"{start} - {end}"
-        
-        session_responses.append(response)
+    # Convert to response format (available_spots, is_full and
+    # time_display are read from the model's properties)
+    session_responses = _SESSION_LIST_ADAPTER.validate_python(
+        sessions,
+        from_attributes=True,
+    )
     
     return ActivitySessionListResponse(
         sessions=session_responses,
@@ -315,8 +294,8 @@ async def get_activity_sessions(
 )
 async def get_activity_statistics(
     activity_id: UUID = Path(..., description="The activity's UUID"),
-    activity_service: ActivityService = Depends(get_activity_service),
-) -> dict:
+    services: Services = Depends(get_services),
+) -> ORJSONResponse:
     """
     Get statistics for an activity.
     
@@ -327,33 +306,36 @@ async def get_activity_statistics(
     
     Args:
         activity_id: The activity's UUID
-        activity_service: Activity service (injected)
+        services: Service container (injected)
     
     Returns:
-        dict: Activity statistics
+        ORJSONResponse: Activity statistics
     
     Example:
         GET /api/v1/activities/123e4567.../statistics
     """
-    return await activity_service.get_activity_statistics(activity_id)
+    # Returned as a response so FastAPI skips jsonable_encoder
+    return ORJSONResponse(
+        await services.activity.get_activity_statistics(activity_id)
+    )
 
 
 @router.get(
     "/venue/{venue_id}",
-    response_model=List[ActivityResponse],
+    responses={200: {"model": List[ActivityResponse]}},
     summary="Get Venue Activities",
     description="Get all activities for a specific venue.",
 )
 async def get_venue_activities(
     venue_id: UUID = Path(..., description="The venue's UUID"),
-    activity_service: ActivityService = Depends(get_activity_service),
-) -> List[ActivityResponse]:
+    services: Services = Depends(get_services),
+) -> Response:
     """
     Get all activities at a specific venue.
     
     Args:
         venue_id: The venue's UUID
-        activity_service: Activity service (injected)
+        services: Service container (injected)
     
     Returns:
         List of activities at the venue
@@ -361,12 +343,14 @@ async def get_venue_activities(
     Example:
         GET /api/v1/activities/venue/123e4567-e89b-12d3-a456-426614174000
     """
-    activities = await activity_service.get_venue_activities(
+    activities = await services.activity.get_venue_activities(
         venue_id,
         is_active=True,
     )
     
-    return [
-        ActivityResponse.model_validate(activity)
-        for activity in activities
-    ]
+    activity_responses = rows_to_schemas(
+        ActivityResponse,
+        _ACTIVITY_LIST_ADAPTER,
+        activities,
+    )
+    return list_response(_ACTIVITY_LIST_ADAPTER, activity_responses)
@@ -16,15 +16,18 @@ These endpoints are used for:
 # IMPORTS
 # =============================================================================
 # Standard library imports
-from datetime import datetime  # Timestamp
+import time  # Wall clock seconds for probe response refresh
+from datetime import datetime, timezone  # Timestamp
+from typing import Any, Dict, Optional, Tuple  # Type hints
 
 # Third-party imports
-from fastapi import APIRouter, Depends  # Router and dependencies
+import orjson  # Fast JSON serialization
+from fastapi import APIRouter, Depends, Response  # Router and dependencies
 
 # Local imports
 from app import __version__  # Application version
 from app.config import settings  # Configuration
-from app.core.database import check_db_connection  # Database health
+from app.core.database import is_db_healthy  # Cached database health
 from app.schemas.common import HealthResponse  # Response schema
 
 # =============================================================================
@@ -34,16 +37,67 @@ from app.schemas.common import HealthResponse  # Response schema
 router = APIRouter()
 
 
+# =============================================================================
+# PRE-RENDERED PROBE RESPONSES
+# =============================================================================
+# Health endpoints are hit every few seconds by load balancers and
+# Kubernetes. Their bodies only vary by timestamp and the cached database
+# status, so each variant's body is rendered at most once per second and
+# reused until the second rolls over. Only the bytes are shared: every
+# request gets its own Response, since middleware (e.g. CORS) edits
+# response headers in place. Endpoints return these directly (no
+# response_model), which skips HealthResponse validation; HealthResponse
+# is still referenced in `responses` for the OpenAPI docs.
+_probe_bodies: Dict[str, Tuple[int, bytes]] = {}
+
+
+def _probe_response(
+    key: str,
+    status: str,
+    details: Optional[Dict[str, Any]] = None,
+) -> Response:
+    """
+    Build a health probe response from the pre-rendered body.
+    
+    Args:
+        key: Cache key identifying the response variant
+        status: Status value to report (e.g. "healthy", "alive")
+        details: Optional extra details to include
+    
+    Returns:
+        Response: New JSON response; the body is refreshed once per second
+    """
+    second = int(time.time())
+    entry = _probe_bodies.get(key)
+    
+    if entry is not None and entry[0] == second:
+        return Response(content=entry[1], media_type="application/json")
+    
+    content = {
+        "status": status,
+        "version": __version__,
+        "environment": settings.APP_ENV,
+        "timestamp": datetime.fromtimestamp(second, timezone.utc),
+    }
+    if details is not None:
+        content["details"] = details
+    
+    body = orjson.dumps(content)
+    _probe_bodies[key] = (second, body)
+    
+    return Response(content=body, media_type="application/json")
+
+
 # =============================================================================
 # ENDPOINTS
 # =============================================================================
 @router.get(
     "",
-    response_model=HealthResponse,
+    responses={200: {"model": HealthResponse}},
     summary="Health Check",
     description="Basic health check endpoint that verifies the API is running.",
 )
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """
     Basic health check endpoint.
     
@@ -62,20 +116,16 @@ async def health_check() -> HealthResponse:
         }
         ```
     """
-    return HealthResponse(
-        status="healthy",
-        version=__version__,
-        timestamp=datetime.utcnow(),
-    )
+    return _probe_response("health", "healthy")
 
 
 @router.get(
     "/detailed",
-    response_model=HealthResponse,
+    responses={200: {"model": HealthResponse}},
     summary="Detailed Health Check",
     description="Detailed health check that verifies database connectivity.",
 )
-async def detailed_health_check() -> HealthResponse:
+async def detailed_health_check() -> Response:
     """
     Detailed health check with dependency verification.
     
@@ -83,8 +133,9 @@ async def detailed_health_check() -> HealthResponse:
         - API is running
         - Database is connected and responding
     
-    Use this for comprehensive health monitoring.
-    Note: This endpoint is slower than the basic health check.
+    Use this for comprehensive health monitoring. Database status comes
+    from the background monitor (refreshed every second), so this
+    endpoint doesn't query the database itself.
     
     Returns:
         HealthResponse: Detailed health status with dependency info
@@ -103,30 +154,29 @@ async def detailed_health_check() -> HealthResponse:
         ```
     """
     # Check database connectivity
-    db_healthy = await check_db_connection()
+    db_healthy = is_db_healthy()
     
     # Determine overall status
     # Status is "healthy" only if all dependencies are healthy
     overall_status = "healthy" if db_healthy else "degraded"
     
-    return HealthResponse(
-        status=overall_status,
-        version=__version__,
-        timestamp=datetime.utcnow(),
+    return _probe_response(
+        f"detailed:{db_healthy}",
+        overall_status,
         details={
             "database": "healthy" if db_healthy else "unhealthy",
             "environment": settings.APP_ENV,
-        }
+        },
     )
 
 
 @router.get(
     "/ready",
-    response_model=HealthResponse,
+    responses={200: {"model": HealthResponse}},
     summary="Readiness Check",
     description="Kubernetes readiness probe endpoint.",
 )
-async def readiness_check() -> HealthResponse:
+async def readiness_check() -> Response:
     """
     Readiness check for Kubernetes.
     
@@ -141,34 +191,29 @@ async def readiness_check() -> HealthResponse:
         If this returns an error status, traffic will be routed elsewhere.
     """
     # Check database
-    db_healthy = await check_db_connection()
+    db_healthy = is_db_healthy()
     
     if not db_healthy:
         # Return unhealthy status (still 200, but status field indicates issue)
-        return HealthResponse(
-            status="not_ready",
-            version=__version__,
-            timestamp=datetime.utcnow(),
+        return _probe_response(
+            "ready:False",
+            "not_ready",
             details={
                 "database": "unhealthy",
                 "message": "Database connection failed"
-            }
+            },
         )
     
-    return HealthResponse(
-        status="ready",
-        version=__version__,
-        timestamp=datetime.utcnow(),
-    )
+    return _probe_response("ready:True", "ready")
 
 
 @router.get(
     "/live",
-    response_model=HealthResponse,
+    responses={200: {"model": HealthResponse}},
     summary="Liveness Check",
     description="Kubernetes liveness probe endpoint.",
 )
-async def liveness_check() -> HealthResponse:
+async def liveness_check() -> Response:
     """
     Liveness check for Kubernetes.
     
@@ -181,9 +226,6 @@ async def liveness_check() -> HealthResponse:
     Note:
         Kubernetes uses this to determine if the pod should be restarted.
         This should be fast and always succeed if the process is healthy.
+        The response body is pre-rendered (see _probe_response).
     """
-    return HealthResponse(
-        status="alive",
-        version=__version__,
-        timestamp=datetime.utcnow(),
-    )
+    return _probe_response("live", "alive")
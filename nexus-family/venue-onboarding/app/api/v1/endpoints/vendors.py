@@ -27,18 +27,26 @@ Phase 2 Will Add:
 # IMPORTS
 # =============================================================================
 # Standard library imports
-from typing import List  # Type hints
+from typing import AsyncIterator, List, Optional  # Type hints
 from uuid import UUID  # UUID type
 
 # Third-party imports
-from fastapi import APIRouter, Depends, HTTPException, status  # Router
+from fastapi import APIRouter, Depends, Header, Response  # Router
+from fastapi.responses import ORJSONResponse, StreamingResponse  # Direct responses
+from pydantic import TypeAdapter  # Batch validation
 
 # Local imports
 from app.api.v1.dependencies import (
-    get_vendor_service,
+    get_services,
+    Services,
     get_current_vendor,
+    invalidate_token,
+    parse_bearer_token,
 )
-from app.services.vendor_service import VendorService
+from app.api.v1.responses import model_response, row_to_schema, stream_json_array
+from app.core.database import get_session_factory  # Sessions for streaming
+from app.core.exceptions import NotFoundError  # Exceptions
+from app.services.activity_service import ActivityService  # Activity streaming
 from app.schemas.vendor import (
     VendorLoginRequest,
     VendorLoginResponse,
@@ -60,26 +68,29 @@ from app.schemas.activity import ActivityResponse
 # =============================================================================
 router = APIRouter()
 
+# Validate whole result lists in one call into pydantic-core
+_PRICING_LIST_ADAPTER = TypeAdapter(List[MockPricingResponse])
+
 
 # =============================================================================
 # AUTHENTICATION ENDPOINTS
 # =============================================================================
 @router.post(
     "/login",
-    response_model=VendorLoginResponse,
+    responses={200: {"model": VendorLoginResponse}},
     summary="Vendor Login",
     description="Authenticate vendor with email and password.",
 )
 async def vendor_login(
     credentials: VendorLoginRequest,
-    vendor_service: VendorService = Depends(get_vendor_service),
-) -> VendorLoginResponse:
+    services: Services = Depends(get_services),
+) -> Response:
     """
     Authenticate a vendor and return a session token.
     
     Args:
         credentials: Email and password
-        vendor_service: Vendor service (injected)
+        services: Service container (injected)
     
     Returns:
         VendorLoginResponse: Session token and vendor info
@@ -91,41 +102,40 @@ async def vendor_login(
         POST /api/v1/vendors/login
         Body: {"email": "vendor@example.com", "password": "password"}
     """
-    result = await vendor_service.authenticate(
-        email=credentials.email,
-        password=credentials.password,
+    result = await services.vendor.authenticate(
+        email=credentials["email"],
+        password=credentials["password"],
     )
     
-    return VendorLoginResponse(
+    # authenticate() returns exactly the response fields, already typed,
+    # so the response is built and serialized once, without re-validation
+    return model_response(VendorLoginResponse.model_construct(
         success=True,
-        token=result["token"],
-        expires_at=result["expires_at"],
-        vendor_id=result["vendor_id"],
-        venue_id=result["venue_id"],
-        vendor_name=result["vendor_name"],
-        venue_name=result["venue_name"],
         message="Login successful",
-    )
+        **result,
+    ))
 
 
 @router.post(
     "/logout",
-    response_model=VendorLogoutResponse,
+    responses={200: {"model": VendorLogoutResponse}},
     summary="Vendor Logout",
     description="Invalidate current session token.",
 )
 async def vendor_logout(
+    authorization: Optional[str] = Header(None, alias="Authorization"),
     current_vendor: dict = Depends(get_current_vendor),
-    vendor_service: VendorService = Depends(get_vendor_service),
-) -> VendorLogoutResponse:
+    services: Services = Depends(get_services),
+) -> Response:
     """
     Log out the current vendor.
     
     Invalidates the session token.
     
     Args:
+        authorization: Authorization header value (Bearer token)
         current_vendor: Current vendor session (injected)
-        vendor_service: Vendor service (injected)
+        services: Service container (injected)
     
     Returns:
         VendorLogoutResponse: Logout confirmation
@@ -134,13 +144,15 @@ async def vendor_logout(
         POST /api/v1/vendors/logout
         Header: Authorization: Bearer <token>
     """
-    # Get token from session (stored when validating)
     # Note: In Phase 2 with JWT, we'll handle this differently
+    token = parse_bearer_token(authorization)
+    await services.vendor.logout(token)
+    invalidate_token(token)
     
-    return VendorLogoutResponse(
+    return model_response(VendorLogoutResponse.model_construct(
         success=True,
         message="Logged out successfully",
-    )
+    ))
 
 
 # =============================================================================
@@ -154,14 +166,14 @@ async def vendor_logout(
 )
 async def get_current_vendor_profile(
     current_vendor: dict = Depends(get_current_vendor),
-    vendor_service: VendorService = Depends(get_vendor_service),
+    services: Services = Depends(get_services),
 ) -> VendorProfileResponse:
     """
     Get the current vendor's profile.
     
     Args:
         current_vendor: Current vendor session (injected)
-        vendor_service: Vendor service (injected)
+        services: Service container (injected)
     
     Returns:
         VendorProfileResponse: Vendor profile with venue info
@@ -170,16 +182,11 @@ async def get_current_vendor_profile(
         GET /api/v1/vendors/me
         Header: Authorization: Bearer <token>
     """
-    vendor_id = UUID(current_vendor["user_id"])
-    vendor = await vendor_service.get_vendor_profile(vendor_id)
-    
-    response = VendorProfileResponse.model_validate(vendor)
+    vendor_id = current_vendor["vendor_uuid"]
+    vendor = await services.vendor.get_vendor_profile(vendor_id)
     
-    # Add venue name from relationship
-    if vendor.venue:
-        response.venue_name = vendor.venue.name
-    
-    return response
+    # venue_name is set by the service, so one pass builds the response
+    return row_to_schema(VendorProfileResponse, vendor)
 
 
 @router.put(
@@ -191,7 +198,7 @@ async def get_current_vendor_profile(
 async def update_vendor_profile(
     profile_update: VendorProfileUpdateRequest,
     current_vendor: dict = Depends(get_current_vendor),
-    vendor_service: VendorService = Depends(get_vendor_service),
+    services: Services = Depends(get_services),
 ) -> VendorProfileResponse:
     """
     Update the current vendor's profile.
@@ -203,7 +210,7 @@ async def update_vendor_profile(
     Args:
         profile_update: Fields to update
         current_vendor: Current vendor session (injected)
-        vendor_service: Vendor service (injected)
+        services: Service container (injected)
     
     Returns:
         VendorProfileResponse: Updated profile
@@ -212,20 +219,15 @@ async def update_vendor_profile(
         PUT /api/v1/vendors/me
         Body: {"name": "New Name", "phone": "+91 98765 43210"}
     """
-    vendor_id = UUID(current_vendor["user_id"])
+    vendor_id = current_vendor["vendor_uuid"]
     
-    vendor = await vendor_service.update_vendor_profile(
+    vendor = await services.vendor.update_vendor_profile(
         vendor_id=vendor_id,
-        display_name=profile_update.display_name,
-        phone=profile_update.phone,
+        display_name=profile_update.get("display_name"),
+        phone=profile_update.get("phone"),
     )
     
-    response = VendorProfileResponse.model_validate(vendor)
-    
-    if vendor.venue:
-        response.venue_name = vendor.venue.name
-    
-    return response
+    return row_to_schema(VendorProfileResponse, vendor)
 
 
 @router.post(
@@ -236,18 +238,18 @@ async def update_vendor_profile(
 async def change_password(
     password_change: VendorPasswordChangeRequest,
     current_vendor: dict = Depends(get_current_vendor),
-    vendor_service: VendorService = Depends(get_vendor_service),
-) -> dict:
+    services: Services = Depends(get_services),
+) -> ORJSONResponse:
     """
     Change the current vendor's password.
     
     Args:
         password_change: Current and new password
         current_vendor: Current vendor session (injected)
-        vendor_service: Vendor service (injected)
+        services: Service container (injected)
     
     Returns:
-        dict: Success message
+        ORJSONResponse: Success message
     
     Raises:
         401: Current password incorrect
@@ -261,22 +263,17 @@ async def change_password(
             "confirm_password": "new"
         }
     """
-    # Validate passwords match
-    if password_change.new_password != password_change.confirm_password:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail="New password and confirmation don't match",
-        )
-    
-    vendor_id = UUID(current_vendor["user_id"])
+    # Matching confirmation is checked by VendorPasswordChangeRequest
+    vendor_id = current_vendor["vendor_uuid"]
     
-    await vendor_service.change_password(
+    await services.vendor.change_password(
         vendor_id=vendor_id,
         current_password=password_change.current_password,
         new_password=password_change.new_password,
     )
     
-    return {"message": "Password changed successfully"}
+    # Returned as a response so FastAPI skips jsonable_encoder
+    return ORJSONResponse({"message": "Password changed successfully"})
 
 
 # =============================================================================
@@ -290,14 +287,14 @@ async def change_password(
 )
 async def get_vendor_venue(
     current_vendor: dict = Depends(get_current_vendor),
-    vendor_service: VendorService = Depends(get_vendor_service),
+    services: Services = Depends(get_services),
 ) -> VendorVenueResponse:
     """
     Get the current vendor's venue details.
     
     Args:
         current_vendor: Current vendor session (injected)
-        vendor_service: Vendor service (injected)
+        services: Service container (injected)
     
     Returns:
         VendorVenueResponse: Venue details
@@ -306,8 +303,8 @@ async def get_vendor_venue(
         GET /api/v1/vendors/me/venue
         Header: Authorization: Bearer <token>
     """
-    vendor_id = UUID(current_vendor["user_id"])
-    venue = await vendor_service.get_vendor_venue(vendor_id)
+    vendor_id = current_vendor["vendor_uuid"]
+    venue = await services.vendor.get_vendor_venue(vendor_id)
     
     return VendorVenueResponse.model_validate(venue)
 
@@ -320,7 +317,7 @@ async def get_vendor_venue(
 )
 async def get_venue_summary(
     current_vendor: dict = Depends(get_current_vendor),
-    vendor_service: VendorService = Depends(get_vendor_service),
+    services: Services = Depends(get_services),
 ) -> VendorVenueSummaryResponse:
     """
     Get summary statistics for the vendor's venue.
@@ -332,7 +329,7 @@ async def get_venue_summary(
     
     Args:
         current_vendor: Current vendor session (injected)
-        vendor_service: Vendor service (injected)
+        services: Service container (injected)
     
     Returns:
         VendorVenueSummaryResponse: Venue summary
@@ -340,17 +337,19 @@ async def get_venue_summary(
     Example:
         GET /api/v1/vendors/me/venue/summary
     """
-    vendor_id = UUID(current_vendor["user_id"])
-    venue = await vendor_service.get_vendor_venue(vendor_id)
+    vendor_id = current_vendor["vendor_uuid"]
+    
+    # Activity counts come from SQL; no activity rows are loaded
+    venue, total_activities, active_activities = (
+        await services.vendor.get_vendor_venue_summary(vendor_id)
+    )
     
     # Build summary
     return VendorVenueSummaryResponse(
         venue_id=venue.id,
         venue_name=venue.name,
-        total_activities=len(venue.activities) if venue.activities else 0,
-        active_activities=len([
-            a for a in (venue.activities or []) if a.is_active
-        ]),
+        total_activities=total_activities,
+        active_activities=active_activities,
         google_rating=venue.google_rating,
         total_reviews=venue.google_review_count,
         quality_score=(
@@ -363,20 +362,22 @@ async def get_venue_summary(
 
 @router.get(
     "/me/venue/activities",
-    response_model=List[ActivityResponse],
+    responses={200: {"model": List[ActivityResponse]}},
     summary="Get Venue Activities",
     description="Get all activities at vendor's venue.",
 )
 async def get_vendor_venue_activities(
     current_vendor: dict = Depends(get_current_vendor),
-    vendor_service: VendorService = Depends(get_vendor_service),
-) -> List[ActivityResponse]:
+) -> StreamingResponse:
     """
     Get all activities at the vendor's venue.
     
+    The JSON array is streamed while rows are read from a server-side
+    cursor, so large venues neither buffer the whole list in memory nor
+    delay the first byte until the last row is loaded.
+    
     Args:
         current_vendor: Current vendor session (injected)
-        vendor_service: Vendor service (injected)
     
     Returns:
         List of activities
@@ -384,13 +385,32 @@ async def get_vendor_venue_activities(
     Example:
         GET /api/v1/vendors/me/venue/activities
     """
-    vendor_id = UUID(current_vendor["user_id"])
-    venue = await vendor_service.get_vendor_venue(vendor_id)
+    # The venue is recorded in the session at login
+    venue_id = UUID(current_vendor["extra_data"]["venue_id"])
     
-    return [
-        ActivityResponse.model_validate(activity)
-        for activity in (venue.activities or [])
-    ]
+    return StreamingResponse(
+        _stream_venue_activities(venue_id),
+        media_type="application/json",
+    )
+
+
+async def _stream_venue_activities(venue_id: UUID) -> AsyncIterator[bytes]:
+    """
+    Stream a venue's activities as a JSON array.
+    
+    Runs after the endpoint has returned, when the request's own database
+    session is already closed, so it opens a session of its own.
+    
+    Args:
+        venue_id: The venue's UUID
+    
+    Yields:
+        bytes: Pieces of the JSON array
+    """
+    async with get_session_factory()() as db:
+        activities = ActivityService(db).stream_venue_activities(venue_id)
+        async for chunk in stream_json_array(ActivityResponse, activities):
+            yield chunk
 
 
 @router.get(
@@ -401,14 +421,14 @@ async def get_vendor_venue_activities(
 )
 async def get_vendor_venue_quality_scores(
     current_vendor: dict = Depends(get_current_vendor),
-    vendor_service: VendorService = Depends(get_vendor_service),
+    services: Services = Depends(get_services),
 ) -> QualityScoreResponse:
     """
     Get AI quality scores for the vendor's venue.
     
     Args:
         current_vendor: Current vendor session (injected)
-        vendor_service: Vendor service (injected)
+        services: Service container (injected)
     
     Returns:
         QualityScoreResponse: AI quality scores
@@ -419,10 +439,11 @@ async def get_vendor_venue_quality_scores(
     Example:
         GET /api/v1/vendors/me/venue/quality-scores
     """
-    from app.core.exceptions import NotFoundError
-    
-    vendor_id = UUID(current_vendor["user_id"])
-    venue = await vendor_service.get_vendor_venue(vendor_id)
+    vendor_id = current_vendor["vendor_uuid"]
+    venue = await services.vendor.get_vendor_venue(
+        vendor_id,
+        include_quality_score=True,
+    )
     
     if not venue.quality_score:
         raise NotFoundError(
@@ -437,20 +458,20 @@ async def get_vendor_venue_quality_scores(
 # =============================================================================
 @router.get(
     "/me/pricing",
-    response_model=MockPricingListResponse,
+    responses={200: {"model": MockPricingListResponse}},
     summary="Get Vendor Pricing",
     description="Get mock pricing for vendor's venue.",
 )
 async def get_vendor_pricing(
     current_vendor: dict = Depends(get_current_vendor),
-    vendor_service: VendorService = Depends(get_vendor_service),
-) -> MockPricingListResponse:
+    services: Services = Depends(get_services),
+) -> Response:
     """
     Get mock pricing for the vendor's venue.
     
     Args:
         current_vendor: Current vendor session (injected)
-        vendor_service: Vendor service (injected)
+        services: Service container (injected)
     
     Returns:
         MockPricingListResponse: List of pricing records
@@ -458,15 +479,16 @@ async def get_vendor_pricing(
     Example:
         GET /api/v1/vendors/me/pricing
     """
-    vendor_id = UUID(current_vendor["user_id"])
-    pricing = await vendor_service.get_vendor_pricing(vendor_id)
+    vendor_id = current_vendor["vendor_uuid"]
+    pricing = await services.vendor.get_vendor_pricing(vendor_id)
     
-    return MockPricingListResponse(
-        pricing=[
-            MockPricingResponse.model_validate(p) for p in pricing
-        ],
+    return model_response(MockPricingListResponse(
+        pricing=_PRICING_LIST_ADAPTER.validate_python(
+            pricing,
+            from_attributes=True,
+        ),
         total=len(pricing),
-    )
+    ))
 
 
 @router.put(
@@ -478,7 +500,7 @@ async def get_vendor_pricing(
 async def update_vendor_pricing(
     pricing_update: MockPricingUpdateRequest,
     current_vendor: dict = Depends(get_current_vendor),
-    vendor_service: VendorService = Depends(get_vendor_service),
+    services: Services = Depends(get_services),
 ) -> MockPricingResponse:
     """
     Update mock pricing for an activity type.
@@ -486,7 +508,7 @@ async def update_vendor_pricing(
     Args:
         pricing_update: Activity type and new prices
         current_vendor: Current vendor session (injected)
-        vendor_service: Vendor service (injected)
+        services: Service container (injected)
     
     Returns:
         MockPricingResponse: Updated pricing
@@ -502,13 +524,13 @@ async def update_vendor_pricing(
             "weekend_price_inr": 550
         }
     """
-    vendor_id = UUID(current_vendor["user_id"])
+    vendor_id = current_vendor["vendor_uuid"]
     
-    pricing = await vendor_service.update_vendor_pricing(
+    pricing = await services.vendor.update_vendor_pricing(
         vendor_id=vendor_id,
-        activity_type=pricing_update.activity_type,
-        weekday_price=pricing_update.weekday_price_inr,
-        weekend_price=pricing_update.weekend_price_inr,
+        activity_type=pricing_update["activity_type"],
+        weekday_price=pricing_update.get("weekday_price_inr"),
+        weekend_price=pricing_update.get("weekend_price_inr"),
     )
     
     return MockPricingResponse.model_validate(pricing)
@@ -20,42 +20,62 @@ from typing import List, Optional  # Type hints
 from uuid import UUID  # UUID type
 
 # Third-party imports
-from fastapi import APIRouter, Depends, Query, Path  # Router and utilities
+from fastapi import APIRouter, Depends, Query, Path, Request, Response  # Router and utilities
+from pydantic import TypeAdapter  # Batch validation
 
 # Local imports
 from app.api.v1.dependencies import (
-    get_venue_service,
+    get_services,
+    get_pagination,
+    get_venue_filters,
+    Services,
     PaginationParams,
     VenueFilterParams,
 )
-from app.services.venue_service import VenueService
+from app.api.v1.responses import lookup_response, model_response, rows_to_schemas
+from app.core.cache import get_cached_body, get_lookup  # Response caches
+from app.core.exceptions import NotFoundError  # Exceptions
 from app.schemas.venue import (
     VenueResponse,
-    VenueListResponse,
+    VenuePageResponse,
     VenueDetailResponse,
 )
-from app.schemas.vendor import QualityScoreResponse, MockPricingListResponse
+from app.schemas.vendor import (
+    QualityScoreResponse,
+    MockPricingResponse,
+    MockPricingListResponse,
+)
 
 # =============================================================================
 # ROUTER
 # =============================================================================
 router = APIRouter()
 
+# Validate whole result lists in one call into pydantic-core
+_VENUE_LIST_ADAPTER = TypeAdapter(List[VenueResponse])
+_PRICING_LIST_ADAPTER = TypeAdapter(List[MockPricingResponse])
+
+# Serializes a whole list page to bytes in pydantic-core
+_VENUE_PAGE_ADAPTER = TypeAdapter(VenuePageResponse)
+
+# Seconds a serialized venue list page is reused for identical queries
+_VENUE_LIST_CACHE_TTL = 60.0
+
 
 # =============================================================================
 # ENDPOINTS
 # =============================================================================
 @router.get(
     "",
-    response_model=VenueListResponse,
+    responses={200: {"model": VenuePageResponse}},
     summary="List Venues",
     description="Get a paginated list of venues with optional filtering.",
 )
 async def list_venues(
-    pagination: PaginationParams = Depends(),
-    filters: VenueFilterParams = Depends(),
-    venue_service: VenueService = Depends(get_venue_service),
-) -> VenueListResponse:
+    pagination: PaginationParams = Depends(get_pagination),
+    filters: VenueFilterParams = Depends(get_venue_filters),
+    services: Services = Depends(get_services),
+) -> Response:
     """
     List all venues with pagination and filtering.
     
@@ -68,54 +88,80 @@ async def list_venues(
     Args:
         pagination: Pagination parameters (page, page_size)
         filters: Filter parameters
-        venue_service: Venue service (injected)
+        services: Service container (injected)
     
     Returns:
-        VenueListResponse: Paginated list of venues
+        VenuePageResponse: Paginated list of venues
     
     Example:
         GET /api/v1/venues?city=Bangalore&min_rating=4.0&page=1&page_size=20
-    """
-    # Call service to get venues
-    venues, total = await venue_service.list_venues(
-        page=pagination.page,
-        page_size=pagination.page_size,
-        city=filters.city,
-        category=filters.category,
-        min_rating=filters.min_rating,
-        search_query=filters.search,
-        is_active=True,
-    )
     
-    # Calculate pagination metadata
-    total_pages = max(1, (total + pagination.page_size - 1) // pagination.page_size)
-    
-    # Convert models to response schemas
-    venue_responses = [
-        VenueResponse.model_validate(venue) for venue in venues
-    ]
-    
-    return VenueListResponse(
-        venues=venue_responses,
-        total=total,
-        page=pagination.page,
-        page_size=pagination.page_size,
-        total_pages=total_pages,
-    )
+    Note:
+        The result is the same for every caller, so the serialized page
+        is cached per filter/page combination for _VENUE_LIST_CACHE_TTL
+        seconds (and dropped on any venue write).
+    """
+    async def build_page() -> bytes:
+        # Call service to get venues
+        venues, total = await services.venue.list_venues(
+            page=pagination.page,
+            page_size=pagination.page_size,
+            city=filters.city,
+            category=filters.category,
+            min_rating=filters.min_rating,
+            search_query=filters.search,
+            is_active=True,
+        )
+        
+        # Calculate pagination metadata
+        total_pages = max(1, (total + pagination.page_size - 1) // pagination.page_size)
+        
+        # Convert models to response schemas
+        venue_responses = rows_to_schemas(
+            VenueResponse,
+            _VENUE_LIST_ADAPTER,
+            venues,
+        )
+        
+        return _VENUE_PAGE_ADAPTER.dump_json(VenuePageResponse(
+            venues=venue_responses,
+            total=total,
+            page=pagination.page,
+            page_size=pagination.page_size,
+            total_pages=total_pages,
+        ))
+    
+    # repr() keeps None distinct from "None" and separators in values unambiguous
+    key = "venues:list:" + repr((
+        filters.city,
+        filters.category,
+        filters.min_rating,
+        filters.search,
+        pagination.page,
+        pagination.page_size,
+    ))
+    body, _ = await get_cached_body(key, build_page, _VENUE_LIST_CACHE_TTL)
+    
+    return Response(content=body, media_type="application/json")
 
 
 @router.get(
     "/cities",
-    response_model=List[str],
+    responses={200: {"model": List[str]}},
     summary="Get Available Cities",
     description="Get list of cities that have venues.",
 )
 async def get_cities(
-    venue_service: VenueService = Depends(get_venue_service),
-) -> List[str]:
+    request: Request,
+    services: Services = Depends(get_services),
+) -> Response:
     """
     Get list of cities with active venues.
     
+    The result is cached until a venue is written (or for
+    LOOKUP_CACHE_TTL) and served with an ETag, so repeat requests with
+    If-None-Match get a 304 without a body.
+    
     Returns:
         List of city names
     
@@ -123,21 +169,28 @@ async def get_cities(
         GET /api/v1/venues/cities
         Response: ["Bangalore", "Chennai", "Mumbai"]
     """
-    return await venue_service.get_available_cities()
+    body, etag = await get_lookup(
+        "venues:cities",
+        services.venue.get_available_cities,
+    )
+    return lookup_response(request, body, etag)
 
 
 @router.get(
     "/categories",
-    response_model=List[str],
+    responses={200: {"model": List[str]}},
     summary="Get Available Categories",
     description="Get list of venue categories.",
 )
 async def get_categories(
-    venue_service: VenueService = Depends(get_venue_service),
-) -> List[str]:
+    request: Request,
+    services: Services = Depends(get_services),
+) -> Response:
     """
     Get list of available venue categories.
     
+    Cached and ETagged the same way as /cities.
+    
     Returns:
         List of category names
     
@@ -145,7 +198,11 @@ async def get_categories(
         GET /api/v1/venues/categories
         Response: ["sports", "arts", "stem", "music"]
     """
-    return await venue_service.get_available_categories()
+    body, etag = await get_lookup(
+        "venues:categories",
+        services.venue.get_available_categories,
+    )
+    return lookup_response(request, body, etag)
 
 
 @router.get(
@@ -156,7 +213,7 @@ async def get_categories(
 )
 async def get_venue(
     venue_id: UUID = Path(..., description="The venue's UUID"),
-    venue_service: VenueService = Depends(get_venue_service),
+    services: Services = Depends(get_services),
 ) -> VenueDetailResponse:
     """
     Get detailed venue information.
@@ -169,7 +226,7 @@ async def get_venue(
     
     Args:
         venue_id: The venue's UUID
-        venue_service: Venue service (injected)
+        services: Service container (injected)
     
     Returns:
         VenueDetailResponse: Detailed venue information
@@ -180,7 +237,7 @@ async def get_venue(
     Example:
         GET /api/v1/venues/123e4567-e89b-12d3-a456-426614174000
     """
-    venue = await venue_service.get_venue_detail(venue_id)
+    venue = await services.venue.get_venue_detail(venue_id)
     
     # Build response with related data
     response = VenueDetailResponse.model_validate(venue)
@@ -204,8 +261,13 @@ async def get_venue(
     description="Get venue details using URL-friendly slug.",
 )
 async def get_venue_by_slug(
-    slug: str = Path(..., description="The venue's URL slug"),
-    venue_service: VenueService = Depends(get_venue_service),
+    slug: str = Path(
+        ...,
+        max_length=255,
+        pattern=r"^[a-z0-9-]+$",
+        description="The venue's URL slug",
+    ),
+    services: Services = Depends(get_services),
 ) -> VenueDetailResponse:
     """
     Get venue by URL slug.
@@ -214,7 +276,7 @@ async def get_venue_by_slug(
     
     Args:
         slug: The venue's URL slug
-        venue_service: Venue service (injected)
+        services: Service container (injected)
     
     Returns:
         VenueDetailResponse: Detailed venue information
@@ -225,7 +287,7 @@ async def get_venue_by_slug(
     Example:
         GET /api/v1/venues/slug/abc-swimming-academy
     """
-    venue = await venue_service.get_venue_by_slug(slug)
+    venue = await services.venue.get_venue_by_slug(slug)
     return VenueDetailResponse.model_validate(venue)
 
 
@@ -237,7 +299,7 @@ async def get_venue_by_slug(
 )
 async def get_venue_quality_scores(
     venue_id: UUID = Path(..., description="The venue's UUID"),
-    venue_service: VenueService = Depends(get_venue_service),
+    services: Services = Depends(get_services),
 ) -> QualityScoreResponse:
     """
     Get AI-generated quality scores for a venue.
@@ -255,7 +317,7 @@ async def get_venue_quality_scores(
     
     Args:
         venue_id: The venue's UUID
-        venue_service: Venue service (injected)
+        services: Service container (injected)
     
     Returns:
         QualityScoreResponse: AI-generated quality scores
@@ -266,10 +328,9 @@ async def get_venue_quality_scores(
     Example:
         GET /api/v1/venues/123e4567-e89b-12d3-a456-426614174000/quality-scores
     """
-    scores = await venue_service.get_venue_quality_scores(venue_id)
+    scores = await services.venue.get_venue_quality_scores(venue_id)
     
     if scores is None:
-        from app.core.exceptions import NotFoundError
         raise NotFoundError(
             "Quality scores not available for this venue",
             details={"venue_id": str(venue_id)}
@@ -280,14 +341,14 @@ async def get_venue_quality_scores(
 
 @router.get(
     "/{venue_id}/pricing",
-    response_model=MockPricingListResponse,
+    responses={200: {"model": MockPricingListResponse}},
     summary="Get Venue Pricing",
     description="Get mock pricing for a venue's activities (Phase 1).",
 )
 async def get_venue_pricing(
     venue_id: UUID = Path(..., description="The venue's UUID"),
-    venue_service: VenueService = Depends(get_venue_service),
-) -> MockPricingListResponse:
+    services: Services = Depends(get_services),
+) -> Response:
     """
     Get mock pricing for a venue.
     
@@ -296,7 +357,7 @@ async def get_venue_pricing(
     
     Args:
         venue_id: The venue's UUID
-        venue_service: Venue service (injected)
+        services: Service container (injected)
     
     Returns:
         MockPricingListResponse: List of pricing records
@@ -304,18 +365,17 @@ async def get_venue_pricing(
     Example:
         GET /api/v1/venues/123e4567-e89b-12d3-a456-426614174000/pricing
     """
-    from app.schemas.vendor import MockPricingResponse
+    pricing = await services.venue.get_venue_mock_pricing(venue_id)
     
-    pricing = await venue_service.get_venue_mock_pricing(venue_id)
-    
-    pricing_responses = [
-        MockPricingResponse.model_validate(p) for p in pricing
-    ]
+    pricing_responses = _PRICING_LIST_ADAPTER.validate_python(
+        pricing,
+        from_attributes=True,
+    )
     
-    return MockPricingListResponse(
+    return model_response(MockPricingListResponse(
         pricing=pricing_responses,
         total=len(pricing_responses),
-    )
+    ))
 
 
 @router.get(
@@ -325,11 +385,13 @@ async def get_venue_pricing(
 )
 async def get_venue_statistics(
     venue_id: UUID = Path(..., description="The venue's UUID"),
-    venue_service: VenueService = Depends(get_venue_service),
-) -> dict:
+    services: Services = Depends(get_services),
+) -> Response:
     """
     Get statistics for a venue.
     
+    The JSON body is built by the database and returned unchanged.
+    
     Returns:
         - Activity count
         - Review count
@@ -338,12 +400,15 @@ async def get_venue_statistics(
     
     Args:
         venue_id: The venue's UUID
-        venue_service: Venue service (injected)
+        services: Service container (injected)
     
     Returns:
-        dict: Venue statistics
+        Response: Venue statistics JSON
     
     Example:
         GET /api/v1/venues/123e4567-e89b-12d3-a456-426614174000/statistics
     """
-    return await venue_service.get_venue_statistics(venue_id)
+    return Response(
+        content=await services.venue.get_venue_statistics(venue_id),
+        media_type="application/json",
+    )
@@ -0,0 +1,225 @@
+# =============================================================================
+# NEXUS FAMILY PASS - API RESPONSE HELPERS
+# =============================================================================
+"""
+API Response Helpers Module.
+
+Hot list endpoints already build their response schemas explicitly.
+Returning them through `response_model` makes FastAPI validate and
+serialize them a second time. These helpers serialize once with
+pydantic-core and return a plain Response, which FastAPI passes through
+untouched.
+
+Endpoints using them declare their schema via
+`responses={200: {"model": ...}}` so the OpenAPI docs are unchanged.
+
+Usage:
+    ```python
+    from app.api.v1.responses import model_response
+    
+    @router.get("", responses={200: {"model": VenuePageResponse}})
+    async def list_venues(...) -> Response:
+        return model_response(VenuePageResponse(...))
+    ```
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Standard library imports
+from typing import Any, AsyncIterator, Iterable, List, Type, TypeVar  # Type hints
+
+# Third-party imports
+from fastapi import Request, Response  # Request and raw response
+from pydantic import BaseModel, TypeAdapter  # Serialization
+
+# Local imports
+from app.config import settings  # Configuration
+
+# Schema type for ORM conversion helpers
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+# Seconds clients/CDNs may reuse a lookup response
+_LOOKUP_MAX_AGE = 300
+
+
+# =============================================================================
+# RESPONSE HELPERS
+# =============================================================================
+def model_response(model: BaseModel) -> Response:
+    """
+    Serialize a response schema straight to a JSON response.
+    
+    Uses the model's pydantic-core serializer directly, which writes
+    bytes (model_dump_json() returns str, costing an extra encode).
+    
+    Args:
+        model: Fully built response schema
+    
+    Returns:
+        Response: application/json response with the serialized model
+    """
+    return Response(
+        content=model.__pydantic_serializer__.to_json(model),
+        media_type="application/json",
+    )
+
+
+def list_response(adapter: TypeAdapter, items: Any) -> Response:
+    """
+    Serialize a validated list straight to a JSON response.
+    
+    Args:
+        adapter: TypeAdapter the items were validated with
+        items: Validated items
+    
+    Returns:
+        Response: application/json response with the serialized list
+    """
+    return Response(
+        content=adapter.dump_json(items),
+        media_type="application/json",
+    )
+
+
+def lookup_response(request: Request, body: bytes, etag: str) -> Response:
+    """
+    Build a cacheable lookup response, or a bodiless 304 if the client has it.
+    
+    Args:
+        request: Incoming request (checked for If-None-Match)
+        body: Serialized JSON body (from app.core.cache.get_lookup)
+        etag: Quoted ETag for the body
+    
+    Returns:
+        Response: 200 with body, or 304 Not Modified
+    """
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={_LOOKUP_MAX_AGE}",
+    }
+    
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+# =============================================================================
+# ORM CONVERSION
+# =============================================================================
+def construct_from_orm(schema: Type[SchemaT], obj: Any) -> SchemaT:
+    """
+    Build a response schema from an ORM object without validation.
+    
+    Column types are already enforced by the database, so re-validating
+    every field of every row is wasted work. Attributes that are None
+    are left out so the schema's own defaults (e.g. empty lists) apply,
+    matching what validation would produce.
+    
+    Only use this for schemas whose field types match the ORM attribute
+    types exactly (no Decimal -> float conversions, no aliases).
+    
+    Args:
+        schema: Response schema class
+        obj: ORM model instance
+    
+    Returns:
+        SchemaT: Unvalidated schema instance
+    """
+    data = {}
+    for name in schema.model_fields:
+        value = getattr(obj, name, None)
+        if value is not None:
+            data[name] = value
+    return schema.model_construct(**data)
+
+
+def row_to_schema(schema: Type[SchemaT], row: Any) -> SchemaT:
+    """
+    Convert a single ORM row to a response schema.
+    
+    Same validation policy as rows_to_schemas, for rows that arrive one
+    at a time (e.g. from a streamed query).
+    
+    Args:
+        schema: Response schema class
+        row: ORM model instance
+    
+    Returns:
+        SchemaT: Response schema
+    """
+    if settings.skip_response_validation:
+        return construct_from_orm(schema, row)
+    return schema.model_validate(row, from_attributes=True)
+
+
+def rows_to_schemas(
+    schema: Type[SchemaT],
+    adapter: TypeAdapter,
+    rows: Iterable[Any],
+) -> List[SchemaT]:
+    """
+    Convert ORM rows to response schemas.
+    
+    Uses construct_from_orm when settings.skip_response_validation is
+    enabled, and full batch validation through the adapter otherwise
+    (always in debug mode).
+    
+    Args:
+        schema: Response schema class
+        adapter: TypeAdapter for List[schema]
+        rows: ORM model instances
+    
+    Returns:
+        List[SchemaT]: Response schemas
+    """
+    if settings.skip_response_validation:
+        return [construct_from_orm(schema, row) for row in rows]
+    return adapter.validate_python(rows, from_attributes=True)
+
+
+# =============================================================================
+# STREAMING
+# =============================================================================
+# Serialized items buffered before each chunk is handed to the server
+_STREAM_CHUNK_ITEMS = 64
+
+
+async def stream_json_array(
+    schema: Type[BaseModel],
+    rows: AsyncIterator[Any],
+) -> AsyncIterator[bytes]:
+    """
+    Serialize streamed ORM rows as a JSON array, chunk by chunk.
+    
+    Intended as the body of a StreamingResponse: the opening bracket
+    and the first items are sent while later rows are still being read.
+    
+    Args:
+        schema: Response schema class for each item
+        rows: Async iterator of ORM model instances
+    
+    Yields:
+        bytes: Consecutive pieces of one JSON array
+    """
+    serializer = schema.__pydantic_serializer__
+    parts: List[bytes] = [b"["]
+    first = True
+    
+    async for row in rows:
+        if not first:
+            parts.append(b",")
+        parts.append(serializer.to_json(row_to_schema(schema, row)))
+        first = False
+        
+        if len(parts) >= _STREAM_CHUNK_ITEMS:
+            yield b"".join(parts)
+            parts = []
+    
+    parts.append(b"]")
+    yield b"".join(parts)
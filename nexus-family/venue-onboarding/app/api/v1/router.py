@@ -16,6 +16,7 @@ prefixes for URL organization.
 # =============================================================================
 # Third-party imports
 from fastapi import APIRouter  # Router class
+from fastapi.responses import ORJSONResponse  # Fast JSON serialization
 
 # Local imports - endpoint routers
 from app.api.v1.endpoints import (
@@ -31,7 +32,9 @@ from app.api.v1.endpoints import (
 # =============================================================================
 # Create the main v1 router
 # This router will be included in the main application with prefix /api/v1
-api_router = APIRouter()
+# orjson is set here too so v1 responses stay on the fast serializer even
+# if the router is mounted on an app without that default
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
 # =============================================================================
 # INCLUDE ENDPOINT ROUTERS
@@ -29,7 +29,7 @@ Usage:
 # IMPORTS
 # =============================================================================
 # Standard library imports
-from functools import lru_cache  # Cache for singleton pattern
+from functools import cached_property, lru_cache  # Singleton and derived-value caching
 from typing import Optional  # Optional type hints
 
 # Third-party imports
@@ -37,6 +37,20 @@ from pydantic import Field, field_validator  # Validation decorators
 from pydantic_settings import BaseSettings, SettingsConfigDict  # Settings base class
 
 
+# =============================================================================
+# ALLOWED VALUES
+# =============================================================================
+# Accepted values for the validated string settings (messages keep the
+# documented order)
+_APP_ENVS = ("development", "staging", "production")
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_TRACING_MODES = ("full", "errors", "false")
+
+_APP_ENV_SET = frozenset(_APP_ENVS)
+_LOG_LEVEL_SET = frozenset(_LOG_LEVELS)
+_TRACING_MODE_SET = frozenset(_TRACING_MODES)
+
+
 # =============================================================================
 # CONFIGURATION CLASS
 # =============================================================================
@@ -102,9 +116,9 @@ class Settings(BaseSettings):
     # Connection pool size - number of persistent connections
     # Adjust based on Supabase plan limits
     DATABASE_POOL_SIZE: int = Field(
-        default=5,
+        default=20,
         ge=1,  # Greater than or equal to 1
-        le=20,  # Less than or equal to 20
+        le=50,  # Less than or equal to 50
         description="Number of connections in the pool",
     )
     
@@ -116,6 +130,31 @@ class Settings(BaseSettings):
         description="Maximum connections beyond pool size",
     )
     
+    # Seconds to wait for a pooled connection before giving up
+    DATABASE_POOL_TIMEOUT: int = Field(
+        default=30,
+        ge=1,
+        le=300,
+        description="Seconds to wait for a connection from the pool",
+    )
+    
+    # Recycle pooled connections after this many seconds
+    DATABASE_POOL_RECYCLE: int = Field(
+        default=3600,
+        ge=60,
+        description="Maximum connection age in seconds before recycling",
+    )
+    
+    # Prepared statement cache size per connection (asyncpg)
+    # Set to 0 when connecting through PgBouncer/Supavisor in transaction
+    # mode (e.g. Supabase port 6543), which can't keep prepared statements
+    DATABASE_STATEMENT_CACHE_SIZE: int = Field(
+        default=500,
+        ge=0,
+        le=10000,
+        description="Prepared statements cached per connection (0 disables)",
+    )
+    
     # Echo SQL statements to logs (for debugging)
     DATABASE_ECHO: bool = Field(
         default=False,
@@ -177,6 +216,16 @@ class Settings(BaseSettings):
         description="Max requests per minute to Gemini",
     )
     
+    # Venues a batch workflow (batch onboarding, quality scoring) processes
+    # at once. Each one makes Places/Gemini calls, so keep this within the
+    # API quotas (1 = strictly sequential).
+    BATCH_CONCURRENCY: int = Field(
+        default=3,
+        ge=1,
+        le=32,
+        description="Concurrent venues per batch workflow",
+    )
+    
     # Embedding model for vector generation
     GEMINI_EMBEDDING_MODEL: str = Field(
         default="models/embedding-001",
@@ -237,6 +286,15 @@ class Settings(BaseSettings):
         description="Secret for webhook authentication",
     )
 
+    # Webhook jobs each API process runs at once (0 = only enqueue jobs
+    # here and leave running them to other processes)
+    WEBHOOK_JOB_CONCURRENCY: int = Field(
+        default=4,
+        ge=0,
+        le=64,
+        description="Concurrent webhook jobs per process",
+    )
+
     # LangChain temperature defaults
     LANGCHAIN_DEFAULT_TEMPERATURE: float = Field(
         default=0.7,
@@ -267,6 +325,13 @@ class Settings(BaseSettings):
         description="Enable debug mode",
     )
     
+    # Build list responses from ORM rows without pydantic validation
+    # (always validated when APP_DEBUG is on)
+    SKIP_RESPONSE_VALIDATION: bool = Field(
+        default=True,
+        description="Skip validation of trusted ORM rows in list responses",
+    )
+    
     # Secret key for session signing
     APP_SECRET_KEY: str = Field(
         default="change-this-in-production",
@@ -344,6 +409,17 @@ class Settings(BaseSettings):
         description="Session expiry time in hours",
     )
     
+    # How long a validated session is trusted without re-checking the
+    # vendor in the database (0 disables the cache). Logout always
+    # invalidates immediately; this only bounds how long a deactivated
+    # vendor's existing token keeps working.
+    SESSION_CACHE_TTL_SECONDS: int = Field(
+        default=60,
+        ge=0,
+        le=3600,
+        description="Validated session cache TTL in seconds",
+    )
+    
     # =========================================================================
     # MOCK DATA CONFIGURATION (PHASE 1)
     # =========================================================================
@@ -389,10 +465,9 @@ class Settings(BaseSettings):
         Raises:
             ValueError: If the environment is not valid
         """
-        allowed = ["development", "staging", "production"]
         v_lower = v.lower()
-        if v_lower not in allowed:
-            raise ValueError(f"APP_ENV must be one of: {', '.join(allowed)}")
+        if v_lower not in _APP_ENV_SET:
+            raise ValueError(f"APP_ENV must be one of: {', '.join(_APP_ENVS)}")
         return v_lower
     
     @field_validator("LOG_LEVEL")
@@ -410,10 +485,9 @@ class Settings(BaseSettings):
         Raises:
             ValueError: If the log level is not valid
         """
-        allowed = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         v_upper = v.upper()
-        if v_upper not in allowed:
-            raise ValueError(f"LOG_LEVEL must be one of: {', '.join(allowed)}")
+        if v_upper not in _LOG_LEVEL_SET:
+            raise ValueError(f"LOG_LEVEL must be one of: {', '.join(_LOG_LEVELS)}")
         return v_upper
     
     @field_validator("LANGSMITH_TRACING_ENABLED")
@@ -431,26 +505,65 @@ class Settings(BaseSettings):
         Raises:
             ValueError: If the tracing mode is not valid
         """
-        allowed = ["full", "errors", "false"]
         v_lower = v.lower()
-        if v_lower not in allowed:
-            raise ValueError(f"LANGSMITH_TRACING_ENABLED must be one of: {', '.join(allowed)}")
+        if v_lower not in _TRACING_MODE_SET:
+            raise ValueError(
+                f"LANGSMITH_TRACING_ENABLED must be one of: {', '.join(_TRACING_MODES)}"
+            )
         return v_lower
     
     # =========================================================================
     # COMPUTED PROPERTIES
     # =========================================================================
-    @property
+    # Settings are read-only after startup, so each derived value is
+    # computed once and kept in the instance __dict__ (pydantic v2 supports
+    # cached_property on models). Some, like skip_response_validation, are
+    # read on every request.
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production environment."""
         return self.APP_ENV == "production"
     
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development environment."""
         return self.APP_ENV == "development"
     
-    @property
+    @cached_property
+    def skip_response_validation(self) -> bool:
+        """Check if list responses may skip validation of ORM rows."""
+        return self.SKIP_RESPONSE_VALIDATION and not self.APP_DEBUG
+    
+    @cached_property
+    def cors_origins_list(self) -> tuple[str, ...]:
+        """Get the allowed CORS origins parsed from CORS_ORIGINS."""
+        return tuple(
+            origin.strip()
+            for origin in self.CORS_ORIGINS.split(",")
+            if origin.strip()
+        )
+    
+    def _database_url_with_driver(self, driver: str) -> str:
+        """
+        Rewrite DATABASE_URL to use a specific PostgreSQL driver.
+        
+        Accepts postgres://, postgresql:// and postgresql+<driver>://
+        URLs, so a URL copied from a provider dashboard (or one that
+        already names a sync driver) can never put a blocking driver
+        under the async engine.
+        
+        Args:
+            driver: SQLAlchemy driver name (e.g. "asyncpg")
+        
+        Returns:
+            Database URL with the given driver
+        """
+        scheme, sep, rest = self.DATABASE_URL.partition("://")
+        if not sep or scheme.split("+", 1)[0] not in ("postgres", "postgresql"):
+            return self.DATABASE_URL
+        return f"postgresql+{driver}://{rest}"
+    
+    @cached_property
     def async_database_url(self) -> str:
         """
         Get the async version of the database URL.
@@ -460,12 +573,9 @@ class Settings(BaseSettings):
         Returns:
             Database URL with asyncpg driver
         """
-        return self.DATABASE_URL.replace(
-            "postgresql://",
-            "postgresql+asyncpg://"
-        )
+        return self._database_url_with_driver("asyncpg")
     
-    @property
+    @cached_property
     def sync_database_url(self) -> str:
         """
         Get the sync version of the database URL.
@@ -475,12 +585,9 @@ class Settings(BaseSettings):
         Returns:
             Database URL with psycopg2 driver
         """
-        return self.DATABASE_URL.replace(
-            "postgresql://",
-            "postgresql+psycopg2://"
-        )
+        return self._database_url_with_driver("psycopg2")
     
-    @property
+    @cached_property
     def langsmith_enabled(self) -> bool:
         """Check if LangSmith tracing is enabled."""
         return self.LANGSMITH_TRACING_ENABLED != "false" and bool(self.LANGSMITH_API_KEY)
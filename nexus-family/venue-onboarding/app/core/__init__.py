@@ -9,10 +9,12 @@ used throughout the application. These are foundational components that
 don't contain business logic but provide essential functionality.
 
 Components:
+    - cache: In-process cache for rarely-changing lookups
     - database: Database connection and session management
     - exceptions: Custom exception classes and handlers
     - logging_config: Structured logging configuration
     - security: Authentication and authorization utilities
+    - time: Timezone-aware UTC clock helpers
 
 Usage:
     ```python
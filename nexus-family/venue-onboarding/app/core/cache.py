@@ -0,0 +1,120 @@
+# =============================================================================
+# NEXUS FAMILY PASS - LOOKUP CACHE
+# =============================================================================
+"""
+Lookup Cache Module.
+
+Dropdown lookups (cities, categories, age range) run a DISTINCT or
+aggregate query over a whole table, yet their answer changes a few times
+a day at most. This module keeps their serialized JSON body and ETag
+in-process for LOOKUP_CACHE_TTL seconds. Public list pages, which are the
+same for every caller with the same filters, are cached the same way
+with a shorter TTL (see get_cached_body).
+
+Keys are namespaced by table name ("venues:cities"), so a write path can
+drop every entry derived from a table with invalidate_lookups("venues").
+BaseService does this automatically on create/update/delete.
+
+Usage:
+    ```python
+    from app.core.cache import get_lookup
+    
+    body, etag = await get_lookup(
+        "venues:cities",
+        services.venue.get_available_cities,
+    )
+    ```
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Standard library imports
+import hashlib  # ETag computation
+import time  # Monotonic clock for cache expiry
+from collections import OrderedDict  # LRU ordering
+from typing import Any, Awaitable, Callable, Tuple  # Type hints
+
+# Third-party imports
+import orjson  # Fast JSON serialization
+
+
+# =============================================================================
+# CACHE STORAGE
+# =============================================================================
+# Seconds a cached lookup is served before it is reloaded
+LOOKUP_CACHE_TTL = 600.0
+
+# Upper bound on cached entries; list keys include free-text filters
+_CACHE_MAXSIZE = 2048
+
+# key -> (expiry on the monotonic clock, serialized body, quoted ETag)
+_lookup_cache: "OrderedDict[str, Tuple[float, bytes, str]]" = OrderedDict()
+
+
+# =============================================================================
+# CACHE FUNCTIONS
+# =============================================================================
+async def get_cached_body(
+    key: str,
+    loader: Callable[[], Awaitable[bytes]],
+    ttl: float,
+) -> Tuple[bytes, str]:
+    """
+    Return a cached serialized body and its ETag, rebuilding if stale.
+    
+    Args:
+        key: Cache key, prefixed with the source table ("venues:list:...")
+        loader: Coroutine function that builds the serialized body
+        ttl: Seconds the body may be served from the cache
+    
+    Returns:
+        Tuple of (serialized body, quoted ETag)
+    """
+    entry = _lookup_cache.get(key)
+    if entry is not None and time.monotonic() < entry[0]:
+        _lookup_cache.move_to_end(key)
+        return entry[1], entry[2]
+    
+    body = await loader()
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    _lookup_cache[key] = (time.monotonic() + ttl, body, etag)
+    _lookup_cache.move_to_end(key)
+    
+    # Evict least recently used entries beyond the size limit
+    while len(_lookup_cache) > _CACHE_MAXSIZE:
+        _lookup_cache.popitem(last=False)
+    
+    return body, etag
+
+
+async def get_lookup(
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+) -> Tuple[bytes, str]:
+    """
+    Return the cached JSON body and ETag for a lookup, reloading if stale.
+    
+    Args:
+        key: Cache key, prefixed with the source table ("venues:cities")
+        loader: Coroutine function that fetches the data
+    
+    Returns:
+        Tuple of (serialized body, quoted ETag)
+    """
+    async def load_body() -> bytes:
+        return orjson.dumps(await loader())
+    
+    return await get_cached_body(key, load_body, LOOKUP_CACHE_TTL)
+
+
+def invalidate_lookups(table: str) -> None:
+    """
+    Drop every cached entry derived from a table.
+    
+    Args:
+        table: Table name used as the key prefix (e.g. "venues")
+    """
+    prefix = f"{table}:"
+    for key in [k for k in _lookup_cache if k.startswith(prefix)]:
+        _lookup_cache.pop(key, None)
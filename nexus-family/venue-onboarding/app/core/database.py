@@ -31,10 +31,17 @@ Usage:
 # IMPORTS
 # =============================================================================
 # Standard library imports
-from typing import AsyncGenerator  # Type hint for async generators
+import asyncio  # Background health monitor
+import contextlib  # Cancelled-task cleanup
+from functools import lru_cache  # Engine/session factory singletons
+from typing import Any, AsyncGenerator, Optional  # Type hints
+
+# Third-party imports
+from fastapi import Request  # Access to app.state
 
 # Third-party imports - SQLAlchemy async components
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,     # Async connection class
     AsyncSession,        # Async session class
     AsyncEngine,         # Async engine class
     create_async_engine, # Factory to create async engines
@@ -57,14 +64,10 @@ logger = get_logger(__name__)
 # =============================================================================
 # DATABASE ENGINE
 # =============================================================================
-# The engine is created lazily and stored in this module-level variable
-# It's initialized by init_db() during application startup
-_engine: AsyncEngine | None = None
-
-# Session factory is also created lazily
-_async_session_factory: async_sessionmaker[AsyncSession] | None = None
-
-
+# The engine and session factory are created lazily on first call and
+# cached by lru_cache; init_db() creates them during application startup
+# and close_db() clears the caches.
+@lru_cache(maxsize=1)
 def get_engine() -> AsyncEngine:
     """
     Get or create the async database engine.
@@ -87,24 +90,20 @@ def get_engine() -> AsyncEngine:
         The engine manages a connection pool. For serverless environments
         (like Vercel), consider using NullPool to avoid connection issues.
     """
-    global _engine
-    
-    # Return existing engine if already created
-    if _engine is not None:
-        return _engine
-    
     # Log engine creation
     logger.info(
         "Creating database engine",
         extra={
             "pool_size": settings.DATABASE_POOL_SIZE,
             "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+            "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+            "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
         }
     )
     
     # Create the async engine
     # Note: We use the async database URL which has postgresql+asyncpg://
-    _engine = create_async_engine(
+    engine = create_async_engine(
         # Connection URL with asyncpg driver
         settings.async_database_url,
         
@@ -115,13 +114,26 @@ def get_engine() -> AsyncEngine:
         # max_overflow: Additional connections allowed beyond pool_size
         max_overflow=settings.DATABASE_MAX_OVERFLOW,
         
+        # pool_timeout: How long a request waits for a free connection
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        
         # pool_pre_ping: Test connections before using them
-        # This prevents errors from stale connections
+        # This prevents errors from stale connections (including ones
+        # dropped by Supabase's idle timeout), so recycling can be rare
         pool_pre_ping=True,
         
         # pool_recycle: Recycle connections after this many seconds
-        # Prevents issues with connection timeouts (e.g., Supabase's idle timeout)
-        pool_recycle=300,  # 5 minutes
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        
+        # Prepared statement caches (SQLAlchemy's asyncpg adapter and
+        # asyncpg itself). Queries are built with bound parameters, so the
+        # handful of filter combinations per listing endpoint are parsed
+        # and planned once per connection. Both must be 0 behind a
+        # transaction-mode pooler.
+        connect_args={
+            "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+            "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+        },
         
         # echo: Log all SQL statements (only in development)
         echo=settings.DATABASE_ECHO,
@@ -131,9 +143,10 @@ def get_engine() -> AsyncEngine:
     )
     
     logger.info("Database engine created successfully")
-    return _engine
+    return engine
 
 
+@lru_cache(maxsize=1)
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """
     Get or create the async session factory.
@@ -150,14 +163,8 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
         - autoflush=False: Manual flush control
         - expire_on_commit=False: Objects remain usable after commit
     """
-    global _async_session_factory
-    
-    # Return existing factory if already created
-    if _async_session_factory is not None:
-        return _async_session_factory
-    
     # Create session factory bound to the engine
-    _async_session_factory = async_sessionmaker(
+    session_factory = async_sessionmaker(
         # Bind to the database engine
         bind=get_engine(),
         
@@ -178,12 +185,58 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
     )
     
     logger.debug("Session factory created")
-    return _async_session_factory
+    return session_factory
 
 
 # =============================================================================
 # DATABASE LIFECYCLE
 # =============================================================================
+# Connectivity probe, built once and reused by every check
+_PING = text("SELECT 1")
+
+
+async def _ping(engine: AsyncEngine) -> None:
+    """
+    Run the connectivity probe on a pooled connection.
+    
+    The connection is switched to AUTOCOMMIT so the probe is a single
+    round-trip, without the BEGIN and ROLLBACK a transaction would add.
+    The isolation level is reset when the connection returns to the pool.
+    
+    Args:
+        engine: Engine to check out the connection from
+    """
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(_PING)
+
+
+async def _warm_pool(engine: AsyncEngine) -> None:
+    """
+    Open DATABASE_POOL_SIZE connections in parallel and return them to the pool.
+    
+    Each new connection pays a TCP+TLS handshake with the database, so
+    doing them all at startup keeps that latency off the first burst of
+    requests. Best effort: connections that fail to open are skipped.
+    
+    Args:
+        engine: Engine whose pool is filled
+    """
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(settings.DATABASE_POOL_SIZE)),
+        return_exceptions=True,
+    )
+    
+    conns = [c for c in results if isinstance(c, AsyncConnection)]
+    await asyncio.gather(*(conn.close() for conn in conns))
+    
+    if len(conns) < len(results):
+        logger.warning(
+            "Database pool only partly warmed",
+            extra={"opened": len(conns), "pool_size": len(results)},
+        )
+
+
 async def init_db() -> None:
     """
     Initialize the database connection.
@@ -195,6 +248,7 @@ async def init_db() -> None:
         1. Creates the database engine
         2. Creates the session factory
         3. Tests the connection with a simple query
+        4. Opens the pool's connections ahead of the first requests
     
     Raises:
         Exception: If database connection fails
@@ -215,10 +269,10 @@ async def init_db() -> None:
         get_session_factory()
         
         # Test the connection
-        async with engine.begin() as conn:
-            # Execute a simple query to verify connectivity
-            result = await conn.execute(text("SELECT 1"))
-            result.fetchone()
+        await _ping(engine)
+        
+        # Fill the pool before the server accepts traffic
+        await _warm_pool(engine)
         
         logger.info("Database connection verified successfully")
         
@@ -239,7 +293,7 @@ async def close_db() -> None:
     
     The function:
         1. Disposes of the engine (closes all connections)
-        2. Resets module-level variables
+        2. Clears the cached engine and session factory
     
     Example:
         Called in app/main.py lifespan context manager:
@@ -249,31 +303,40 @@ async def close_db() -> None:
             await close_db()
         ```
     """
-    global _engine, _async_session_factory
-    
     logger.info("Closing database connections...")
     
-    if _engine is not None:
+    # Nothing to close if the engine was never created
+    if get_engine.cache_info().currsize:
+        engine = get_engine()
+        get_session_factory.cache_clear()
+        get_engine.cache_clear()
+        
         # Dispose closes all connections in the pool
-        await _engine.dispose()
-        _engine = None
-        _async_session_factory = None
+        await engine.dispose()
         logger.info("Database connections closed")
 
 
 # =============================================================================
 # DEPENDENCY INJECTION
 # =============================================================================
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
     FastAPI dependency that provides a database session.
     
     This is the primary way to get a database session in route handlers.
     It creates a new session for each request and ensures proper cleanup.
     
+    Sessions come from the factory the lifespan stored on
+    app.state.db_session_factory, so every request checks a connection
+    out of the pool built once at startup. If startup could not reach
+    the database, the factory is created on first use instead.
+    
     The session is automatically closed when the request completes,
     even if an exception occurs.
     
+    Args:
+        request: The incoming request (injected by FastAPI)
+    
     Yields:
         AsyncSession: A database session for the request
         
@@ -294,26 +357,22 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         - By default, changes are not committed automatically
         - Call `await db.commit()` to persist changes
         - Call `await db.rollback()` to discard changes
-        - The session is rolled back on exceptions
+        - Uncommitted changes are rolled back when the session closes
     """
-    # Get the session factory
-    session_factory = get_session_factory()
+    # Get the session factory created at startup
+    session_factory = getattr(request.app.state, "db_session_factory", None)
+    if session_factory is None:
+        session_factory = get_session_factory()
     
-    # Create a new session
+    # Create a new session; closing it (always, via the context manager)
+    # rolls back any transaction the handler left open
     async with session_factory() as session:
         try:
             # Yield the session to the route handler
             yield session
-            
         except Exception as e:
-            # Rollback on any exception
-            await session.rollback()
             logger.error(f"Database session error, rolling back: {e}")
             raise
-            
-        finally:
-            # Session is automatically closed by the context manager
-            pass
 
 
 # =============================================================================
@@ -338,9 +397,7 @@ async def check_db_connection() -> bool:
         ```
     """
     try:
-        engine = get_engine()
-        async with engine.begin() as conn:
-            await conn.execute(text("SELECT 1"))
+        await _ping(get_engine())
         return True
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
@@ -348,8 +405,102 @@ async def check_db_connection() -> bool:
 
 
 # =============================================================================
-# ENGINE REFERENCE FOR ALEMBIC
+# HEALTH MONITOR
+# =============================================================================
+# Probes read a cached health flag instead of querying the database
+# themselves, so the DB check rate is fixed regardless of probe rate.
+_DB_HEALTH_INTERVAL = 1.0  # Seconds between checks
+_DB_HEALTH_TIMEOUT = 1.0  # A slower check counts as unhealthy
+
+_db_healthy: bool = False
+_db_health_task: Optional["asyncio.Task[None]"] = None
+
+
+async def _refresh_db_health() -> bool:
+    """
+    Run one bounded health check and store the result.
+    
+    Returns:
+        bool: Updated health status
+    """
+    global _db_healthy
+    
+    try:
+        _db_healthy = await asyncio.wait_for(
+            check_db_connection(),
+            timeout=_DB_HEALTH_TIMEOUT,
+        )
+    except TimeoutError:
+        logger.error("Database health check timed out")
+        _db_healthy = False
+    
+    return _db_healthy
+
+
+async def _db_health_loop() -> None:
+    """Refresh the cached health status every _DB_HEALTH_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(_DB_HEALTH_INTERVAL)
+        await _refresh_db_health()
+
+
+async def start_db_health_monitor() -> None:
+    """
+    Start the background database health monitor.
+    
+    Runs one check immediately so the first probe has a real result,
+    then refreshes in a background task. Called from the app lifespan.
+    """
+    global _db_health_task
+    
+    await _refresh_db_health()
+    
+    if _db_health_task is None:
+        _db_health_task = asyncio.create_task(_db_health_loop())
+
+
+async def stop_db_health_monitor() -> None:
+    """Cancel the background database health monitor."""
+    global _db_health_task
+    
+    if _db_health_task is not None:
+        _db_health_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _db_health_task
+        _db_health_task = None
+
+
+def is_db_healthy() -> bool:
+    """
+    Get the most recent database health status.
+    
+    Returns:
+        bool: Result of the last background check (False before the
+            monitor has started)
+    """
+    return _db_healthy
+
+
+# =============================================================================
+# LAZY ENGINE ATTRIBUTE
 # =============================================================================
-# Alembic needs a reference to create the engine
-# This is used in alembic/env.py
-engine = property(get_engine)
+def __getattr__(name: str) -> Any:
+    """
+    Resolve `database.engine` lazily (PEP 562 module __getattr__).
+    
+    `from app.core.database import engine` returns the real engine,
+    created on first access, instead of importing the module having to
+    build it.
+    
+    Args:
+        name: Attribute name looked up on the module
+    
+    Returns:
+        AsyncEngine: The engine, for name == "engine"
+    
+    Raises:
+        AttributeError: For any other missing attribute
+    """
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
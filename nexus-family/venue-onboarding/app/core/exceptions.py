@@ -38,7 +38,7 @@ from typing import Any, Dict, Optional  # Type hints
 
 # Third-party imports
 from fastapi import FastAPI, Request, status  # FastAPI components
-from fastapi.responses import JSONResponse  # JSON response class
+from fastapi.responses import ORJSONResponse  # JSON response class (orjson)
 from fastapi.exceptions import RequestValidationError  # Pydantic validation errors
 from pydantic import BaseModel  # For response schema
 
@@ -383,7 +383,7 @@ class DatabaseError(NexusException):
 async def nexus_exception_handler(
     request: Request,
     exc: NexusException,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle NexusException and subclasses.
     
@@ -395,7 +395,7 @@ async def nexus_exception_handler(
         exc: The exception that was raised
         
     Returns:
-        JSONResponse: Formatted error response
+        ORJSONResponse: Formatted error response
     """
     # Get request ID from headers if available (for tracing)
     request_id = request.headers.get("X-Request-ID")
@@ -415,7 +415,7 @@ async def nexus_exception_handler(
     # Convert exception to response
     error_response = exc.to_response(request_id)
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=error_response.model_dump(exclude_none=True),
     )
@@ -424,7 +424,7 @@ async def nexus_exception_handler(
 async def validation_exception_handler(
     request: Request,
     exc: RequestValidationError,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle Pydantic validation errors.
     
@@ -436,7 +436,7 @@ async def validation_exception_handler(
         exc: The validation exception
         
     Returns:
-        JSONResponse: Formatted validation error response
+        ORJSONResponse: Formatted validation error response
     """
     # Get request ID
     request_id = request.headers.get("X-Request-ID")
@@ -471,7 +471,7 @@ async def validation_exception_handler(
         request_id=request_id,
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=error_response.model_dump(exclude_none=True),
     )
@@ -480,7 +480,7 @@ async def validation_exception_handler(
 async def generic_exception_handler(
     request: Request,
     exc: Exception,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle unexpected exceptions.
     
@@ -492,7 +492,7 @@ async def generic_exception_handler(
         exc: The exception that was raised
         
     Returns:
-        JSONResponse: Generic error response
+        ORJSONResponse: Generic error response
     """
     # Get request ID
     request_id = request.headers.get("X-Request-ID")
@@ -517,7 +517,7 @@ async def generic_exception_handler(
         request_id=request_id,
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=error_response.model_dump(exclude_none=True),
     )
@@ -27,7 +27,10 @@ Usage:
 # IMPORTS
 # =============================================================================
 # Standard library imports
+import atexit  # Flush queued records on exit
 import logging  # Python standard logging
+import logging.handlers  # Queue handler/listener
+import queue  # Log record queue
 import sys  # System-specific parameters (stdout)
 from typing import Any, Dict, Optional  # Type hints
 from datetime import datetime  # Timestamp handling
@@ -175,6 +178,32 @@ class DevelopmentFormatter(logging.Formatter):
         return message
 
 
+# =============================================================================
+# QUEUE HANDLER
+# =============================================================================
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for an in-process queue.
+    
+    The stock prepare() runs the full formatter on the calling thread and
+    drops exc_info so the record can be pickled. Records here never leave
+    the process, so prepare() only interpolates the message arguments.
+    That stays on the calling thread, because mutable args could change
+    before the listener got to them. The formatter (JSON or colored
+    output, exception tracebacks) then runs on the listener thread, with
+    extras and exc_info intact.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Background thread writing queued records to the real handler
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
 # =============================================================================
 # LOGGING SETUP
 # =============================================================================
@@ -188,6 +217,10 @@ def setup_logging() -> None:
     - Development: Human-readable colored output to stdout
     - Production: JSON structured output to stdout
     
+    Loggers only interpolate the message and enqueue the record; a
+    QueueListener thread runs the formatter and writes the output, so
+    formatting, stdout I/O and the handler lock stay off the event loop.
+    
     This function should be called once at application startup,
     typically in main.py before any other imports.
     
@@ -203,6 +236,13 @@ def setup_logging() -> None:
     # Import settings here to avoid circular imports
     from app.config import settings
     
+    global _log_listener
+    
+    # Stop the listener of a previous call (flushes its queue)
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+    
     # Get the root logger
     root_logger = logging.getLogger()
     
@@ -227,8 +267,17 @@ def setup_logging() -> None:
     
     handler.setFormatter(formatter)
     
-    # Add the handler to the root logger
-    root_logger.addHandler(handler)
+    # Route records through a queue to the stdout handler
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(
+        log_queue,
+        handler,
+        respect_handler_level=True,
+    )
+    _log_listener.start()
+    
+    # Add the queue handler to the root logger
+    root_logger.addHandler(_LocalQueueHandler(log_queue))
     
     # Configure third-party library log levels
     # These are often too verbose at DEBUG level
@@ -251,6 +300,15 @@ def setup_logging() -> None:
     )
 
 
+def _stop_log_listener() -> None:
+    """Write out any queued records before the interpreter exits."""
+    if _log_listener is not None:
+        _log_listener.stop()
+
+
+atexit.register(_stop_log_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for the given name.
@@ -0,0 +1,39 @@
+# =============================================================================
+# NEXUS FAMILY PASS - TIME UTILITIES
+# =============================================================================
+"""
+Time Utilities Module.
+
+This module provides timezone-aware "now" helpers:
+    - utcnow(): Current UTC time as an aware datetime
+
+Usage:
+    ```python
+    from app.core.time import utcnow
+    
+    @router.get("/status")
+    async def status():
+        return {"timestamp": utcnow()}
+    ```
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Standard library imports
+from datetime import datetime, timezone  # Timestamps
+
+
+# =============================================================================
+# CLOCK HELPERS
+# =============================================================================
+def utcnow() -> datetime:
+    """
+    Get the current UTC time.
+    
+    Timezone-aware replacement for the deprecated datetime.utcnow().
+    
+    Returns:
+        datetime: Current time with tzinfo=timezone.utc
+    """
+    return datetime.now(timezone.utc)
@@ -19,11 +19,13 @@ Nodes are designed to be:
 # =============================================================================
 # IMPORTS
 # =============================================================================
+import asyncio
 from typing import Dict, Any, List
 from datetime import datetime
 
 from langsmith import traceable
 
+from app.config import settings
 from app.core.logging_config import get_logger
 from app.integrations.ai.langgraph.state import (
     VenueOnboardingState,
@@ -598,8 +600,8 @@ async def score_venues_batch(state: QualityScoringBatchState) -> Dict[str, Any]:
     """
     Score all venues in the batch.
 
-    Processes each venue sequentially with rate limiting
-    to avoid API limits.
+    Scores up to settings.BATCH_CONCURRENCY venues at once, so
+    their Gemini calls overlap. Results keep the venues_data order.
 
     Args:
         state: Current state with venues_data
@@ -612,40 +614,43 @@ async def score_venues_batch(state: QualityScoringBatchState) -> Dict[str, Any]:
     logger.info(f"Scoring {len(state['venues_data'])} venues")
 
     chain = QualityScoringChain()
-    results = []
-    processed = 0
-    errors = 0
-
-    for venue_data in state["venues_data"]:
-        try:
-            scores = await chain.run(
-                venue_name=venue_data["venue_name"],
-                venue_type=venue_data["venue_type"],
-                reviews=venue_data["reviews"],
-            )
+    slots = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+
+    async def score_one(venue_data: Dict[str, Any]) -> Dict[str, Any]:
+        async with slots:
+            try:
+                scores = await chain.run(
+                    venue_name=venue_data["venue_name"],
+                    venue_type=venue_data["venue_type"],
+                    reviews=venue_data["reviews"],
+                )
 
-            results.append({
-                "venue_id": venue_data["venue_id"],
-                "scores": scores,
-                "success": True,
-            })
-            processed += 1
+                return {
+                    "venue_id": venue_data["venue_id"],
+                    "scores": scores,
+                    "success": True,
+                }
 
-        except Exception as e:
-            logger.warning(
-                f"Failed to score {venue_data['venue_name']}: {e}"
-            )
-            results.append({
-                "venue_id": venue_data["venue_id"],
-                "error": str(e),
-                "success": False,
-            })
-            errors += 1
+            except Exception as e:
+                logger.warning(
+                    f"Failed to score {venue_data['venue_name']}: {e}"
+                )
+                return {
+                    "venue_id": venue_data["venue_id"],
+                    "error": str(e),
+                    "success": False,
+                }
+
+    results = await asyncio.gather(
+        *(score_one(venue_data) for venue_data in state["venues_data"])
+    )
+    processed = sum(1 for result in results if result["success"])
+    errors = len(results) - processed
 
     logger.info(f"Scored {processed} venues, {errors} errors")
 
     return {
-        "results": results,
+        "results": list(results),
         "processed_count": processed,
         "error_count": errors,
         "status": WorkflowStatus.COMPLETED.value,
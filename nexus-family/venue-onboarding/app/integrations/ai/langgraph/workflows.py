@@ -30,12 +30,14 @@ Usage:
 # =============================================================================
 # IMPORTS
 # =============================================================================
-from typing import Dict, Any, Optional, List
+import asyncio
+from typing import Awaitable, Callable, Dict, Any, Optional, List
 from datetime import datetime
 
 from langgraph.graph import StateGraph, END
 from langsmith import traceable
 
+from app.config import settings
 from app.core.logging_config import get_logger
 from app.integrations.ai.langgraph.state import (
     VenueOnboardingState,
@@ -197,27 +199,48 @@ class VenueOnboardingWorkflow:
         self,
         place_ids: List[str],
         city: str,
+        on_venue_done: Optional[Callable[[], Awaitable[None]]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Run onboarding workflow for multiple venues.
 
+        Up to settings.BATCH_CONCURRENCY venues are onboarded at once, so
+        their Places/Gemini calls overlap instead of running back to back.
+
         Args:
             place_ids: List of Google Place IDs
             city: City for all venues
+            on_venue_done: Awaited after each venue finishes (progress hook)
 
         Returns:
-            List of workflow results
+            List of workflow results, in place_ids order
         """
-        results = []
-
-        for place_id in place_ids:
-            result = await self.run(
-                google_place_id=place_id,
-                city=city,
-            )
-            results.append(result)
+        slots = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+
+        async def run_one(place_id: str) -> Dict[str, Any]:
+            async with slots:
+                result = await self.run(google_place_id=place_id, city=city)
+            if on_venue_done is not None:
+                await on_venue_done()
+            return result
+
+        results = await asyncio.gather(
+            *(run_one(place_id) for place_id in place_ids),
+            return_exceptions=True,
+        )
 
-        return results
+        # run() reports failures in its state; this only catches the rest
+        return [
+            {
+                "google_place_id": place_id,
+                "status": WorkflowStatus.FAILED.value,
+                "errors": [str(result)],
+            }
+            # BaseException, so a cancelled venue is never passed on as a result
+            if isinstance(result, BaseException)
+            else result
+            for place_id, result in zip(place_ids, results, strict=True)
+        ]
 
 
 # =============================================================================
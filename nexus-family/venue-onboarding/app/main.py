@@ -31,10 +31,20 @@ from fastapi.responses import ORJSONResponse  # Fast JSON serialization
 # Local application imports
 from app import __version__, __app_name__  # Application metadata
 from app.config import settings  # Application configuration
-from app.core.database import init_db, close_db  # Database lifecycle
+from app.core.database import (  # Database lifecycle
+    init_db,
+    close_db,
+    get_session_factory,
+    start_db_health_monitor,
+    stop_db_health_monitor,
+)
 from app.core.logging_config import setup_logging, get_logger  # Logging
 from app.core.exceptions import setup_exception_handlers  # Error handling
 from app.api.v1.router import api_router  # API routes
+from app.services.job_queue import (  # Webhook job worker
+    start_job_worker,
+    stop_job_worker,
+)
 
 
 # =============================================================================
@@ -99,11 +109,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # This creates the async engine and session factory
     try:
         await init_db()
+        app.state.db_session_factory = get_session_factory()
         logger.info("Database connection pool initialized")
     except Exception as e:
         # Log the error but don't crash - let the app start
         # Requests will fail gracefully if DB is unavailable
         logger.error(f"Failed to initialize database: {e}")
+    
+    # Start the cached database health check used by readiness probes
+    await start_db_health_monitor()
+
+    # Start claiming queued webhook jobs (including any left from a restart)
+    await start_job_worker()
 
     # Initialize LangSmith tracing
     try:
@@ -147,8 +164,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     logger.info("Initiating graceful shutdown...")
     
+    # Stop the job worker first; it requeues the jobs it was running
+    await stop_job_worker()
+    
+    # Stop the health monitor before the pool goes away
+    await stop_db_health_monitor()
+    
     # Close database connections
     try:
+        app.state.db_session_factory = None
         await close_db()
         logger.info("Database connections closed")
     except Exception as e:
@@ -271,13 +295,8 @@ Phase 2 will add JWT tokens and OAuth2/SSO support.
     # CORS (Cross-Origin Resource Sharing) allows the frontend to make
     # requests to this API from a different origin (domain/port)
     
-    # Parse allowed origins from configuration
-    # Format: comma-separated list of URLs
-    allowed_origins = [
-        origin.strip() 
-        for origin in settings.CORS_ORIGINS.split(",")
-        if origin.strip()
-    ]
+    # Allowed origins, parsed once from the comma-separated setting
+    allowed_origins = settings.cors_origins_list
     
     # Add CORS middleware to the application
     application.add_middleware(
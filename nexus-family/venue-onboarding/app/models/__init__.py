@@ -16,6 +16,7 @@ Models Included:
     - GoogleReview: Raw reviews from Google Places
     - VenueQualityScore: AI-extracted quality scores
     - VenueMockPricing: Mock pricing for Phase 1
+    - WebhookJob: Background jobs started by N8N webhooks
 
 Relationships:
     ```
@@ -50,6 +51,7 @@ from app.models.activity import Activity, ActivitySession
 from app.models.vendor import VendorCredential
 from app.models.review import GoogleReview
 from app.models.quality_score import VenueQualityScore, VenueMockPricing
+from app.models.webhook_job import WebhookJob
 
 # =============================================================================
 # EXPORTS
@@ -69,4 +71,5 @@ __all__ = [
     "GoogleReview",
     "VenueQualityScore",
     "VenueMockPricing",
+    "WebhookJob",
 ]
@@ -24,6 +24,7 @@ Phase 2 Will Add:
 # =============================================================================
 # Standard library imports
 from datetime import time, date  # Time handling
+from functools import lru_cache  # Memoized display formatting
 from typing import Optional, List, TYPE_CHECKING  # Type hints
 
 # Third-party imports
@@ -33,18 +34,27 @@ from sqlalchemy import (
     Text,
     Float,
     Integer,
+    SmallInteger,
     Boolean,
     Date,
     Time,
     ForeignKey,
     Index,
+    literal_column,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB  # PostgreSQL types
+from sqlalchemy.ext.hybrid import hybrid_property  # Status flag accessors
 from sqlalchemy.orm import relationship, Mapped  # ORM relationships
-from pgvector.sqlalchemy import Vector  # pgvector extension
+from pgvector.sqlalchemy import HALFVEC  # pgvector extension (FP16 vectors)
 
 # Local imports
-from app.models.base import Base, UUIDMixin, TimestampMixin, ActiveStatusMixin
+from app.models.base import (
+    Base,
+    UUIDMixin,
+    TimestampMixin,
+    ActiveStatusMixin,
+    set_status_flag,
+)
 from app.config import settings  # For embedding dimension
 
 # Type checking imports (avoid circular imports)
@@ -52,6 +62,78 @@ if TYPE_CHECKING:
     from app.models.venue import Venue
 
 
+# =============================================================================
+# DISPLAY FORMATTING
+# =============================================================================
+# Activities share a small set of durations and age ranges, so the display
+# strings are built once per distinct value instead of once per row.
+@lru_cache(maxsize=256)
+def _format_age_range(min_age: int, max_age: int) -> str:
+    """
+    Format an age range for display.
+    
+    Args:
+        min_age: Minimum age
+        max_age: Maximum age
+    
+    Returns:
+        str: Formatted age range (e.g., "Ages 5-12")
+    """
+    return f"Ages {min_age}-{max_age}"
+
+
+@lru_cache(maxsize=256)
+def _format_duration(duration_minutes: int) -> str:
+    """
+    Format a duration in minutes for display.
+    
+    Args:
+        duration_minutes: Duration in minutes
+    
+    Returns:
+        str: Formatted duration (e.g., "1 hour", "1h 30m", "45 mins")
+    """
+    if duration_minutes >= 60:
+        hours = duration_minutes // 60
+        mins = duration_minutes % 60
+        if mins == 0:
+            return f"{hours} hour{'s' if hours > 1 else ''}"
+        return f"{hours}h {mins}m"
+    return f"{duration_minutes} mins"
+
+
+def _format_clock(value: time) -> str:
+    """
+    Format a time of day as 12-hour clock text.
+    
+    Equivalent to value.strftime("%I:%M %p") in the C locale, built from
+    the hour/minute integers to skip strftime's locale handling.
+    
+    Args:
+        value: Time of day
+    
+    Returns:
+        str: Formatted time (e.g., "09:30 AM")
+    """
+    hour = value.hour
+    return f"{hour % 12 or 12:02d}:{value.minute:02d} {'AM' if hour < 12 else 'PM'}"
+
+
+@lru_cache(maxsize=1024)
+def _format_time_range(start_time: time, end_time: time) -> str:
+    """
+    Format a session time range for display.
+    
+    Args:
+        start_time: Session start time
+        end_time: Session end time
+    
+    Returns:
+        str: Formatted time range (e.g., "10:00 AM - 11:00 AM")
+    """
+    return f"{_format_clock(start_time)} - {_format_clock(end_time)}"
+
+
 # =============================================================================
 # ACTIVITY MODEL
 # =============================================================================
@@ -116,8 +198,12 @@ class Activity(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
     __tablename__ = "activities"
     
     __table_args__ = (
-        # Index for venue's activities
-        Index("idx_activities_venue_id", "venue_id"),
+        # Covering index for venue's activities
+        Index(
+            "idx_activities_venue_id",
+            "venue_id",
+            postgresql_include=["name", "category", "credits_required"],
+        ),
         
         # Index for category filtering
         Index("idx_activities_category", "category"),
@@ -129,8 +215,16 @@ class Activity(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
         Index(
             "idx_activities_active_category",
             "category",
-            "is_active",
-            postgresql_where="is_active = true"
+            postgresql_where="is_active"
+        ),
+        
+        # HNSW index for cosine-distance semantic search
+        Index(
+            "idx_activities_embedding",
+            "description_embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"description_embedding": "halfvec_cosine_ops"},
         ),
         
         # Table comment
@@ -153,14 +247,14 @@ class Activity(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
     # =========================================================================
     # Activity name as displayed to users
     name: Mapped[str] = Column(
-        String(255),
+        Text,
         nullable=False,
         comment="Activity name",
     )
     
     # URL-friendly identifier
     slug: Mapped[str] = Column(
-        String(255),
+        Text,
         nullable=False,
         comment="URL-friendly identifier",
     )
@@ -181,7 +275,7 @@ class Activity(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
     
     # Activity category for filtering
     category: Mapped[str] = Column(
-        String(50),
+        Text,
         nullable=False,
         index=True,
         comment="Activity category (stem, arts, sports, etc.)",
@@ -238,9 +332,9 @@ class Activity(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
     # =========================================================================
     # Vector embedding for semantic search
     description_embedding = Column(
-        Vector(settings.EMBEDDING_DIMENSION),
+        HALFVEC(settings.EMBEDDING_DIMENSION),
         nullable=True,
-        comment=f"Vector embedding ({settings.EMBEDDING_DIMENSION}D) for semantic search",
+        comment=f"Half-precision vector embedding ({settings.EMBEDDING_DIMENSION}D) for semantic search",
     )
     
     # Flag indicating embedding needs regeneration
@@ -301,7 +395,7 @@ class Activity(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
     # SKILL LEVEL
     # =========================================================================
     skill_level: Mapped[str] = Column(
-        String(20),
+        Text,
         nullable=False,
         default="beginner",
         comment="Skill level: beginner, intermediate, advanced",
@@ -320,7 +414,7 @@ class Activity(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
     # =========================================================================
     # Average rating (computed from reviews)
     average_rating: Mapped[float] = Column(
-        Float,
+        Float(precision=24),
         nullable=False,
         default=0.0,
         comment="Average rating from reviews (1-5)",
@@ -370,7 +464,7 @@ class Activity(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
         Returns:
             str: Formatted age range (e.g., "Ages 5-12")
         """
-        return f"Ages {self.min_age}-{self.max_age}"
+        return _format_age_range(self.min_age, self.max_age)
     
     @property
     def duration_display(self) -> str:
@@ -378,15 +472,9 @@ class Activity(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
         Get formatted duration for display.
         
         Returns:
-            str: Formatted duration (e.g., "1 hour", "90 mins")
+            str: Formatted duration (e.g., "1 hour", "1h 30m")
         """
-        if self.duration_minutes >= 60:
-            hours = self.duration_minutes // 60
-            mins = self.duration_minutes % 60
-            if mins == 0:
-                return f"{hours} hour{'s' if hours > 1 else ''}"
-            return f"{hours}h {mins}m"
-        return f"{self.duration_minutes} mins"
+        return _format_duration(self.duration_minutes)
     
     @property
     def primary_photo_url(self) -> Optional[str]:
@@ -413,12 +501,12 @@ class ActivitySession(UUIDMixin, TimestampMixin, Base):
     In Phase 2, venues will manage real schedules.
     
     Attributes:
-        id: UUID primary key (from UUIDMixin)
+        id: UUID, primary key together with session_date (from UUIDMixin)
         created_at: Creation timestamp (from TimestampMixin)
         updated_at: Last update timestamp (from TimestampMixin)
         
         # Schedule
-        session_date: Date of the session
+        session_date: Date of the session (partition key, part of the PK)
         start_time: Session start time
         end_time: Session end time
         
@@ -427,7 +515,9 @@ class ActivitySession(UUIDMixin, TimestampMixin, Base):
         booked_count: Current bookings
         
         # Status
-        is_cancelled: Whether session is cancelled
+        status: Bitmask of STATUS_CANCELLED / STATUS_COMPLETED
+        is_cancelled: Whether session is cancelled (hybrid over status)
+        is_completed: Whether session has completed (hybrid over status)
         
     Relationships:
         activity: The activity this session belongs to
@@ -450,23 +540,25 @@ class ActivitySession(UUIDMixin, TimestampMixin, Base):
     __tablename__ = "activity_sessions"
     
     __table_args__ = (
-        # Index for activity's sessions
-        Index("idx_sessions_activity_id", "activity_id"),
-        
         # Index for date range queries
         Index("idx_sessions_date", "session_date"),
         
-        # Composite index for available sessions
+        # Composite covering index for an activity's sessions. Also serves
+        # plain activity_id lookups (leftmost prefix), so no separate
+        # activity_id index is needed; status is included so the
+        # not-cancelled filter can be checked without visiting the heap.
         Index(
             "idx_sessions_available",
             "activity_id",
             "session_date",
-            "is_cancelled",
-            postgresql_where="is_cancelled = false"
+            postgresql_include=["start_time", "booked_count", "status"],
         ),
         
-        # Table comment
-        {"comment": "Scheduled time slots for activities"},
+        # Table comment and monthly range partitioning (see 001_initial_schema)
+        {
+            "comment": "Scheduled time slots for activities",
+            "postgresql_partition_by": "RANGE (session_date)",
+        },
     )
     
     # =========================================================================
@@ -483,9 +575,11 @@ class ActivitySession(UUIDMixin, TimestampMixin, Base):
     # =========================================================================
     # SCHEDULE COLUMNS
     # =========================================================================
-    # Session date
+    # Session date. The table is range-partitioned on it, and Postgres
+    # requires the partition key in the primary key: (id, session_date)
     session_date: Mapped[date] = Column(
         Date,
+        primary_key=True,
         nullable=False,
         comment="Date of the session",
     )
@@ -534,12 +628,16 @@ class ActivitySession(UUIDMixin, TimestampMixin, Base):
     # =========================================================================
     # STATUS
     # =========================================================================
-    # Cancellation status
-    is_cancelled: Mapped[bool] = Column(
-        Boolean,
+    # Status flags packed into a single smallint using the STATUS_* bits;
+    # exposed as the is_cancelled / is_completed hybrid properties
+    STATUS_CANCELLED = 1
+    STATUS_COMPLETED = 2
+    
+    status: Mapped[int] = Column(
+        SmallInteger,
         nullable=False,
-        default=False,
-        comment="True if session is cancelled",
+        default=0,
+        comment="Status bitmask: 1 = cancelled, 2 = completed",
     )
     
     # Cancellation reason
@@ -549,19 +647,11 @@ class ActivitySession(UUIDMixin, TimestampMixin, Base):
         comment="Reason for cancellation",
     )
     
-    # Session completion status
-    is_completed: Mapped[bool] = Column(
-        Boolean,
-        nullable=False,
-        default=False,
-        comment="True if session has completed",
-    )
-    
     # =========================================================================
     # INSTRUCTOR (OPTIONAL)
     # =========================================================================
     instructor_name: Mapped[Optional[str]] = Column(
-        String(255),
+        Text,
         nullable=True,
         comment="Instructor name (if assigned)",
     )
@@ -585,6 +675,44 @@ class ActivitySession(UUIDMixin, TimestampMixin, Base):
     # =========================================================================
     # PROPERTIES
     # =========================================================================
+    @hybrid_property
+    def is_cancelled(self) -> bool:
+        """
+        Whether the session is cancelled.
+        
+        Returns:
+            bool: True if the cancelled bit is set
+        """
+        return bool((self.status or 0) & self.STATUS_CANCELLED)
+    
+    @is_cancelled.setter
+    def is_cancelled(self, value: bool) -> None:
+        self.status = set_status_flag(self.status, self.STATUS_CANCELLED, value)
+    
+    @is_cancelled.expression
+    def is_cancelled(cls):
+        # status is in idx_sessions_available's INCLUDE list, so this
+        # filter is checked from the index without visiting the heap
+        return cls.status.op("&")(literal_column("1")) != literal_column("0")
+    
+    @hybrid_property
+    def is_completed(self) -> bool:
+        """
+        Whether the session has completed.
+        
+        Returns:
+            bool: True if the completed bit is set
+        """
+        return bool((self.status or 0) & self.STATUS_COMPLETED)
+    
+    @is_completed.setter
+    def is_completed(self, value: bool) -> None:
+        self.status = set_status_flag(self.status, self.STATUS_COMPLETED, value)
+    
+    @is_completed.expression
+    def is_completed(cls):
+        return cls.status.op("&")(literal_column("2")) != literal_column("0")
+    
     @property
     def available_spots(self) -> int:
         """
@@ -613,6 +741,4 @@ class ActivitySession(UUIDMixin, TimestampMixin, Base):
         Returns:
             str: Formatted time (e.g., "10:00 AM - 11:00 AM")
         """
-        start = self.start_time.strftime("%I:%M %p")
-        end = self.end_time.strftime("%I:%M %p")
-        return f"{start} - {end}"
+        return _format_time_range(self.start_time, self.end_time)
@@ -27,9 +27,11 @@ Usage:
 # IMPORTS
 # =============================================================================
 # Standard library imports
+import os  # Random bytes for UUID generation
+import time  # Millisecond clock for UUID generation
 import uuid  # UUID generation
 from datetime import datetime  # Timestamp handling
-from typing import Any  # Type hints
+from typing import Any, Optional  # Type hints
 
 # Third-party imports
 from sqlalchemy import Column, DateTime, String, event
@@ -37,6 +39,53 @@ from sqlalchemy.dialects.postgresql import UUID  # PostgreSQL UUID type
 from sqlalchemy.orm import DeclarativeBase, declared_attr  # ORM utilities
 
 
+# =============================================================================
+# UUID GENERATION
+# =============================================================================
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7).
+    
+    The first 48 bits hold the Unix timestamp in milliseconds and the
+    remaining bits are random, so IDs generated later sort later. This
+    keeps primary-key B-tree inserts append-mostly instead of scattering
+    them across the index like uuid4() does.
+    
+    Mirrors the uuid_generate_v7() SQL function created by the initial
+    migration, so client- and server-generated IDs interleave correctly.
+    
+    Returns:
+        uuid.UUID: A new version 7 UUID
+    """
+    # 48-bit millisecond timestamp followed by 80 random bits
+    value = (time.time_ns() // 1_000_000) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    
+    # Set version (0111) and RFC 4122 variant (10) bits
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
+# =============================================================================
+# STATUS FLAGS
+# =============================================================================
+def set_status_flag(status: Optional[int], flag: int, value: bool) -> int:
+    """
+    Set or clear a bit in a packed status bitmask column.
+    
+    Args:
+        status: Current bitmask (None before the row is flushed)
+        flag: Bit to change
+        value: True to set the bit, False to clear it
+    
+    Returns:
+        int: Updated bitmask
+    """
+    status = status or 0
+    return status | flag if value else status & ~flag
+
+
 # =============================================================================
 # DECLARATIVE BASE CLASS
 # =============================================================================
@@ -114,12 +163,12 @@ class UUIDMixin:
     Mixin that adds a UUID primary key to models.
     
     This mixin adds an `id` column that uses PostgreSQL's UUID type.
-    UUIDs are generated automatically using Python's uuid4().
+    UUIDs are generated automatically using uuid7() (time-ordered).
     
     Benefits of UUIDs:
         - Globally unique across all tables and databases
         - Can be generated client-side (no round-trip to DB)
-        - No sequential guessing (security benefit)
+        - Time-ordered, so index inserts stay append-mostly
         - Safe for distributed systems
     
     Example:
@@ -140,7 +189,7 @@ class UUIDMixin:
         UUID primary key column.
         
         Uses PostgreSQL's native UUID type for efficient storage
-        and indexing. Default value is generated using uuid4().
+        and indexing. Default value is generated using uuid7().
         
         Returns:
             Column: UUID primary key column definition
@@ -153,13 +202,13 @@ class UUIDMixin:
             primary_key=True,
             
             # Generate UUID automatically if not provided
-            default=uuid.uuid4,
+            default=uuid7,
             
             # Don't allow NULL values
             nullable=False,
             
             # Add a comment for documentation
-            comment="Unique identifier (UUID v4)",
+            comment="Unique identifier (UUID v7)",
         )
 
 
@@ -342,6 +391,8 @@ class ActiveStatusMixin:
             Boolean,
             default=True,
             nullable=False,
-            index=True,  # Index for efficient filtering
+            # No standalone index: almost every row is active, so a plain
+            # boolean index is never selective. Models add partial indexes
+            # (WHERE is_active) on the columns they actually filter by.
             comment="True if record is active and visible",
         )
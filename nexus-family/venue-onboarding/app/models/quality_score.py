@@ -30,7 +30,6 @@ from decimal import Decimal  # Precise decimal handling
 # Third-party imports
 from sqlalchemy import (
     Column,
-    String,
     Text,
     Float,
     Integer,
@@ -108,9 +107,6 @@ class VenueQualityScore(UUIDMixin, TimestampMixin, Base):
     __tablename__ = "venue_quality_scores"
     
     __table_args__ = (
-        # Unique constraint - one score record per venue
-        Index("idx_quality_scores_venue_id", "venue_id", unique=True),
-        
         # Index on overall score for ranking
         Index("idx_quality_scores_overall", "overall_score"),
         
@@ -135,56 +131,56 @@ class VenueQualityScore(UUIDMixin, TimestampMixin, Base):
     # =========================================================================
     # Cleanliness and hygiene standards
     hygiene_score: Mapped[Optional[float]] = Column(
-        Float,
+        Float(precision=24),
         nullable=True,
         comment="Hygiene/cleanliness score (1-5)",
     )
     
     # Safety measures and protocols
     safety_score: Mapped[Optional[float]] = Column(
-        Float,
+        Float(precision=24),
         nullable=True,
         comment="Safety standards score (1-5)",
     )
     
     # Quality of instruction/coaching
     teaching_score: Mapped[Optional[float]] = Column(
-        Float,
+        Float(precision=24),
         nullable=True,
         comment="Teaching/instruction quality score (1-5)",
     )
     
     # Equipment and facilities quality
     facilities_score: Mapped[Optional[float]] = Column(
-        Float,
+        Float(precision=24),
         nullable=True,
         comment="Facilities/equipment score (1-5)",
     )
     
     # Value for money perception
     value_score: Mapped[Optional[float]] = Column(
-        Float,
+        Float(precision=24),
         nullable=True,
         comment="Value for money score (1-5)",
     )
     
     # Atmosphere and environment
     ambience_score: Mapped[Optional[float]] = Column(
-        Float,
+        Float(precision=24),
         nullable=True,
         comment="Ambience/atmosphere score (1-5)",
     )
     
     # Staff behavior and helpfulness
     staff_score: Mapped[Optional[float]] = Column(
-        Float,
+        Float(precision=24),
         nullable=True,
         comment="Staff quality score (1-5)",
     )
     
     # Accessibility and convenience
     location_score: Mapped[Optional[float]] = Column(
-        Float,
+        Float(precision=24),
         nullable=True,
         comment="Location/accessibility score (1-5)",
     )
@@ -194,7 +190,7 @@ class VenueQualityScore(UUIDMixin, TimestampMixin, Base):
     # =========================================================================
     # Overall weighted average score
     overall_score: Mapped[Optional[float]] = Column(
-        Float,
+        Float(precision=24),
         nullable=True,
         index=True,
         comment="Overall weighted average score (1-5)",
@@ -202,7 +198,7 @@ class VenueQualityScore(UUIDMixin, TimestampMixin, Base):
     
     # Confidence in the scores (0-1, based on review count and consistency)
     confidence: Mapped[float] = Column(
-        Float,
+        Float(precision=24),
         nullable=False,
         default=0.5,
         comment="Confidence in scores (0-1)",
@@ -263,7 +259,7 @@ class VenueQualityScore(UUIDMixin, TimestampMixin, Base):
     
     # AI model version used
     model_version: Mapped[Optional[str]] = Column(
-        String(100),
+        Text,
         nullable=True,
         comment="AI model version used for scoring",
     )
@@ -376,10 +372,8 @@ class VenueMockPricing(UUIDMixin, TimestampMixin, Base):
     __tablename__ = "venue_mock_pricing"
     
     __table_args__ = (
-        # Index for venue's pricing
-        Index("idx_mock_pricing_venue_id", "venue_id"),
-        
         # Unique constraint - one price per venue per activity type
+        # (also serves venue_id lookups as its leading column)
         Index(
             "idx_mock_pricing_venue_activity",
             "venue_id",
@@ -407,7 +401,7 @@ class VenueMockPricing(UUIDMixin, TimestampMixin, Base):
     # =========================================================================
     # Type of activity this pricing is for
     activity_type: Mapped[str] = Column(
-        String(100),
+        Text,
         nullable=False,
         comment="Activity type (swimming, badminton, etc.)",
     )
@@ -439,7 +433,7 @@ class VenueMockPricing(UUIDMixin, TimestampMixin, Base):
     # =========================================================================
     # How the price was determined
     price_source: Mapped[str] = Column(
-        String(50),
+        Text,
         nullable=False,
         default="algorithm",
         comment="Price source: algorithm, manual, scraped",
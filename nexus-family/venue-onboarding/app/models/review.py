@@ -31,16 +31,19 @@ from sqlalchemy import (
     String,
     Text,
     Integer,
-    Boolean,
+    SmallInteger,
     DateTime,
     ForeignKey,
     Index,
+    literal_column,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID  # PostgreSQL UUID type
+from sqlalchemy.ext.hybrid import hybrid_property  # Status flag accessors
 from sqlalchemy.orm import relationship, Mapped  # ORM relationships
 
 # Local imports
-from app.models.base import Base, UUIDMixin, TimestampMixin
+from app.models.base import Base, UUIDMixin, TimestampMixin, set_status_flag
 
 # Type checking imports (avoid circular imports)
 if TYPE_CHECKING:
@@ -72,7 +75,8 @@ class GoogleReview(UUIDMixin, TimestampMixin, Base):
         language: Review language code
         
         # Processing Status
-        is_processed: Whether AI has processed this review
+        status: Bitmask of STATUS_PROCESSED
+        is_processed: Whether AI has processed this review (hybrid over status)
         processed_at: When AI processing completed
         
     Relationships:
@@ -103,16 +107,13 @@ class GoogleReview(UUIDMixin, TimestampMixin, Base):
         # Index for unprocessed reviews (for AI batch processing)
         Index(
             "idx_google_reviews_unprocessed",
-            "is_processed",
-            postgresql_where="is_processed = false"
+            "venue_id",
+            postgresql_where=text("(status & 1) = 0")
         ),
         
         # Index for review time (ordering)
         Index("idx_google_reviews_time", "review_time"),
         
-        # Unique constraint on Google review ID
-        Index("idx_google_reviews_google_id", "google_review_id", unique=True),
-        
         # Table comment
         {"comment": "Reviews fetched from Google Places API for AI quality scoring"},
     )
@@ -133,7 +134,7 @@ class GoogleReview(UUIDMixin, TimestampMixin, Base):
     # =========================================================================
     # Unique review ID from Google (for deduplication)
     google_review_id: Mapped[Optional[str]] = Column(
-        String(255),
+        Text,
         nullable=True,
         unique=True,
         comment="Unique review ID from Google Places",
@@ -141,14 +142,14 @@ class GoogleReview(UUIDMixin, TimestampMixin, Base):
     
     # Reviewer's display name
     author_name: Mapped[Optional[str]] = Column(
-        String(255),
+        Text,
         nullable=True,
         comment="Reviewer's display name",
     )
     
     # Author's profile photo URL
     author_photo_url: Mapped[Optional[str]] = Column(
-        String(500),
+        Text,
         nullable=True,
         comment="Reviewer's profile photo URL",
     )
@@ -176,7 +177,7 @@ class GoogleReview(UUIDMixin, TimestampMixin, Base):
     
     # Relative time description from Google (e.g., "2 months ago")
     relative_time_description: Mapped[Optional[str]] = Column(
-        String(100),
+        Text,
         nullable=True,
         comment="Relative time description from Google",
     )
@@ -192,13 +193,15 @@ class GoogleReview(UUIDMixin, TimestampMixin, Base):
     # =========================================================================
     # PROCESSING STATUS
     # =========================================================================
-    # Whether AI has processed this review
-    is_processed: Mapped[bool] = Column(
-        Boolean,
+    # Status flags packed into a single smallint using the STATUS_* bits;
+    # exposed as the is_processed hybrid property
+    STATUS_PROCESSED = 1
+    
+    status: Mapped[int] = Column(
+        SmallInteger,
         nullable=False,
-        default=False,
-        index=True,
-        comment="True if AI has processed this review",
+        default=0,
+        comment="Status bitmask: 1 = processed by AI",
     )
     
     # When AI processing was completed
@@ -210,7 +213,7 @@ class GoogleReview(UUIDMixin, TimestampMixin, Base):
     
     # AI processing model/version used
     processing_model: Mapped[Optional[str]] = Column(
-        String(100),
+        Text,
         nullable=True,
         comment="AI model/version used for processing",
     )
@@ -227,7 +230,7 @@ class GoogleReview(UUIDMixin, TimestampMixin, Base):
     # =========================================================================
     # Detected sentiment (positive, negative, neutral)
     detected_sentiment: Mapped[Optional[str]] = Column(
-        String(20),
+        Text,
         nullable=True,
         comment="AI-detected sentiment: positive, negative, neutral",
     )
@@ -252,6 +255,26 @@ class GoogleReview(UUIDMixin, TimestampMixin, Base):
     # =========================================================================
     # PROPERTIES
     # =========================================================================
+    @hybrid_property
+    def is_processed(self) -> bool:
+        """
+        Whether AI has processed this review.
+        
+        Returns:
+            bool: True if the processed bit is set
+        """
+        return bool((self.status or 0) & self.STATUS_PROCESSED)
+    
+    @is_processed.setter
+    def is_processed(self, value: bool) -> None:
+        self.status = set_status_flag(self.status, self.STATUS_PROCESSED, value)
+    
+    @is_processed.expression
+    def is_processed(cls):
+        # Literal operands (not bind params) so the planner can match the
+        # idx_google_reviews_unprocessed partial index predicate
+        return cls.status.op("&")(literal_column("1")) != literal_column("0")
+    
     @property
     def is_positive(self) -> bool:
         """
@@ -29,14 +29,14 @@ from typing import Optional, TYPE_CHECKING  # Type hints
 # Third-party imports
 from sqlalchemy import (
     Column,
-    String,
+    Text,
     Boolean,
     DateTime,
     Integer,
     ForeignKey,
     Index,
 )
-from sqlalchemy.dialects.postgresql import UUID  # PostgreSQL UUID type
+from sqlalchemy.dialects.postgresql import INET, UUID  # PostgreSQL types
 from sqlalchemy.orm import relationship, Mapped  # ORM relationships
 
 # Local imports
@@ -99,9 +99,6 @@ class VendorCredential(UUIDMixin, TimestampMixin, Base):
     __tablename__ = "vendor_credentials"
     
     __table_args__ = (
-        # Index for email lookup (login)
-        Index("idx_vendor_creds_email", "email"),
-        
         # Index for venue lookup
         Index("idx_vendor_creds_venue_id", "venue_id"),
         
@@ -126,7 +123,7 @@ class VendorCredential(UUIDMixin, TimestampMixin, Base):
     # =========================================================================
     # Login email address (must be unique)
     email: Mapped[str] = Column(
-        String(255),
+        Text,
         nullable=False,
         unique=True,
         comment="Login email address",
@@ -135,21 +132,21 @@ class VendorCredential(UUIDMixin, TimestampMixin, Base):
     # Bcrypt hashed password
     # NULL for accounts that haven't set a password yet
     password_hash: Mapped[Optional[str]] = Column(
-        String(255),
+        Text,
         nullable=True,
         comment="Bcrypt hashed password",
     )
     
     # Display name for the vendor admin
     display_name: Mapped[Optional[str]] = Column(
-        String(255),
+        Text,
         nullable=True,
         comment="Display name for the vendor admin",
     )
     
     # Contact phone (optional)
     phone: Mapped[Optional[str]] = Column(
-        String(50),
+        Text,
         nullable=True,
         comment="Contact phone number",
     )
@@ -192,7 +189,7 @@ class VendorCredential(UUIDMixin, TimestampMixin, Base):
     
     # Last login IP address
     last_login_ip: Mapped[Optional[str]] = Column(
-        String(45),  # IPv6 max length
+        INET,
         nullable=True,
         comment="IP address of last login",
     )
@@ -225,7 +222,7 @@ class VendorCredential(UUIDMixin, TimestampMixin, Base):
     # =========================================================================
     # Password reset token (hashed)
     password_reset_token: Mapped[Optional[str]] = Column(
-        String(255),
+        Text,
         nullable=True,
         comment="Hashed password reset token",
     )
@@ -242,7 +239,7 @@ class VendorCredential(UUIDMixin, TimestampMixin, Base):
     # =========================================================================
     # Current session token (Phase 1 simple auth)
     current_session_token: Mapped[Optional[str]] = Column(
-        String(255),
+        Text,
         nullable=True,
         comment="Current active session token (Phase 1)",
     )
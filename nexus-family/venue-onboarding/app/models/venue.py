@@ -37,10 +37,11 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Index,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB  # PostgreSQL JSON type
 from sqlalchemy.orm import relationship, Mapped  # ORM relationships
-from pgvector.sqlalchemy import Vector  # pgvector extension
+from pgvector.sqlalchemy import HALFVEC  # pgvector extension (FP16 vectors)
 
 # Local imports
 from app.models.base import Base, UUIDMixin, TimestampMixin, ActiveStatusMixin
@@ -132,19 +133,38 @@ class Venue(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
     
     # Table-level comment for documentation
     __table_args__ = (
-        # Index for geographic queries
-        Index("idx_venues_coordinates", "latitude", "longitude"),
+        # GiST index for geographic queries. Radius / nearest-neighbour
+        # lookups must use the same expression to hit it, e.g.
+        # ORDER BY point(longitude, latitude) <-> point(:lon, :lat)
+        Index(
+            "idx_venues_location",
+            text("point(longitude, latitude)"),
+            postgresql_using="gist",
+        ),
+        
+        # Covering index for the case-insensitive active-venue city filter
+        Index(
+            "idx_venues_city",
+            text("lower(city)"),
+            postgresql_include=["name", "slug", "google_rating"],
+            postgresql_where="is_active",
+        ),
         
         # Index for active venues by city
         Index(
             "idx_venues_active_city",
             "city",
-            "is_active",
-            postgresql_where="is_active = true"
+            postgresql_where="is_active"
         ),
         
-        # Index for Google Place ID lookup
-        Index("idx_venues_google_place_id", "google_place_id"),
+        # HNSW index for cosine-distance semantic search
+        Index(
+            "idx_venues_embedding",
+            "description_embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"description_embedding": "halfvec_cosine_ops"},
+        ),
         
         # Table comment
         {"comment": "Activity provider venues discovered from Google Places or manually added"},
@@ -155,7 +175,7 @@ class Venue(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
     # =========================================================================
     # Venue's business name as displayed to users
     name: Mapped[str] = Column(
-        String(255),
+        Text,
         nullable=False,
         comment="Venue's business name",
     )
@@ -163,7 +183,7 @@ class Venue(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
     # URL-friendly identifier for venue pages
     # Generated from name using python-slugify
     slug: Mapped[str] = Column(
-        String(255),
+        Text,
         unique=True,
         nullable=False,
         index=True,
@@ -186,7 +206,7 @@ class Venue(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
     
     # Primary category of activities offered
     primary_category: Mapped[Optional[str]] = Column(
-        String(50),
+        Text,
         nullable=True,
         index=True,
         comment="Primary activity category (stem, arts, sports, etc.)",
@@ -197,7 +217,7 @@ class Venue(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
     # =========================================================================
     # Unique ID from Google Places API
     google_place_id: Mapped[Optional[str]] = Column(
-        String(255),
+        Text,
         unique=True,
         nullable=True,
         comment="Google Places API place_id",
@@ -205,7 +225,7 @@ class Venue(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
     
     # Origin of this venue's data
     data_source: Mapped[str] = Column(
-        String(50),
+        Text,
         nullable=False,
         default="google_places",
         comment="Data source: google_places, manual, partner_api",
@@ -223,36 +243,35 @@ class Venue(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
     # =========================================================================
     # Street address
     address_line1: Mapped[Optional[str]] = Column(
-        String(255),
+        Text,
         nullable=True,
         comment="Street address line 1",
     )
     
     # Address line 2 (suite, unit, etc.)
     address_line2: Mapped[Optional[str]] = Column(
-        String(255),
+        Text,
         nullable=True,
         comment="Street address line 2",
     )
     
     # City name
     city: Mapped[Optional[str]] = Column(
-        String(100),
+        Text,
         nullable=True,
-        index=True,
         comment="City name",
     )
     
     # State or province
     state: Mapped[Optional[str]] = Column(
-        String(100),
+        Text,
         nullable=True,
         comment="State or province",
     )
     
     # Postal code
     postal_code: Mapped[Optional[str]] = Column(
-        String(20),
+        Text,
         nullable=True,
         comment="ZIP or postal code",
     )
@@ -283,14 +302,14 @@ class Venue(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
     # =========================================================================
     # Phone number
     contact_phone: Mapped[Optional[str]] = Column(
-        String(50),
+        Text,
         nullable=True,
         comment="Contact phone number",
     )
     
     # Website URL
     website_url: Mapped[Optional[str]] = Column(
-        String(500),
+        Text,
         nullable=True,
         comment="Venue website URL",
     )
@@ -300,7 +319,7 @@ class Venue(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
     # =========================================================================
     # Overall Google rating (1-5 scale)
     google_rating: Mapped[Optional[float]] = Column(
-        Float,
+        Float(precision=24),
         nullable=True,
         comment="Google Places overall rating (1-5)",
     )
@@ -319,9 +338,9 @@ class Venue(UUIDMixin, TimestampMixin, ActiveStatusMixin, Base):
     # Vector embedding for semantic search
     # Dimension must match the embedding model (768 for Gemini)
     description_embedding = Column(
-        Vector(settings.EMBEDDING_DIMENSION),
+        HALFVEC(settings.EMBEDDING_DIMENSION),
         nullable=True,
-        comment=f"Vector embedding ({settings.EMBEDDING_DIMENSION}D) for semantic search",
+        comment=f"Half-precision vector embedding ({settings.EMBEDDING_DIMENSION}D) for semantic search",
     )
     
     # Flag indicating embedding needs to be regenerated
@@ -0,0 +1,159 @@
+# =============================================================================
+# NEXUS FAMILY PASS - WEBHOOK JOB MODEL
+# =============================================================================
+"""
+Webhook Job Model Module.
+
+This module defines the WebhookJob model that tracks long-running jobs
+started by the N8N webhooks (onboarding, scoring, reconciliation, ...).
+
+Jobs are stored in the database rather than in process memory so that
+any API worker or replica can answer GET /webhooks/jobs/{job_id},
+regardless of which worker accepted the webhook and runs the job.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Standard library imports
+from datetime import datetime  # Timestamp handling
+from typing import Any, Dict, List, Optional  # Type hints
+
+# Third-party imports
+from sqlalchemy import Column, Text, DateTime, Integer, Index, text  # Column types
+from sqlalchemy.dialects.postgresql import JSONB  # PostgreSQL JSON type
+from sqlalchemy.orm import Mapped  # Typed columns
+
+# Local imports
+from app.models.base import Base, UUIDMixin, TimestampMixin
+
+
+# =============================================================================
+# WEBHOOK JOB MODEL
+# =============================================================================
+class WebhookJob(UUIDMixin, TimestampMixin, Base):
+    """
+    WebhookJob model for tracking background webhook jobs.
+    
+    Attributes:
+        id: UUID primary key, used as the public job ID (from UUIDMixin)
+        created_at: Creation timestamp (from TimestampMixin)
+        updated_at: Last update timestamp (from TimestampMixin)
+        
+        job_type: Kind of job (e.g. "venue_onboard")
+        status: pending, running, completed or failed
+        dedupe_key: Hash of job_type + payload; unique among in-flight jobs
+        message: Human-readable status message
+        payload: The webhook request that started the job
+        result: Job output once completed
+        errors: Error messages collected while running
+        heartbeat_at: Last heartbeat from the worker running the job
+        attempts: Number of times the job has been claimed
+        completed_at: When the job reached a final status
+    
+    Example:
+        ```python
+        job = WebhookJob(
+            job_type="venue_onboard",
+            status="pending",
+            message="Job created, pending execution",
+            payload={"google_place_id": "ChIJ...", "city": "Bangalore"},
+        )
+        ```
+    """
+    
+    # =========================================================================
+    # TABLE CONFIGURATION
+    # =========================================================================
+    __tablename__ = "webhook_jobs"
+    
+    __table_args__ = (
+        # Index for reaping finished jobs by age
+        Index("idx_webhook_jobs_created_at", "created_at"),
+        
+        # At most one in-flight job per identical request
+        Index(
+            "idx_webhook_jobs_in_flight_dedupe",
+            "dedupe_key",
+            unique=True,
+            postgresql_where=text("status IN ('pending', 'running')")
+        ),
+        
+        # Table comment
+        {"comment": "Background jobs started by N8N webhooks"},
+    )
+    
+    # =========================================================================
+    # JOB COLUMNS
+    # =========================================================================
+    # Kind of job
+    job_type: Mapped[str] = Column(
+        Text,
+        nullable=False,
+        comment="Job type (venue_onboard, quality_scoring, ...)",
+    )
+    
+    # Current status (JobStatus value)
+    status: Mapped[str] = Column(
+        Text,
+        nullable=False,
+        comment="pending, running, completed or failed",
+    )
+    
+    # Hash of job type + request, used to collapse retried webhooks
+    dedupe_key: Mapped[Optional[str]] = Column(
+        Text,
+        nullable=True,
+        comment="Hash of job type and request for deduplication",
+    )
+    
+    # Human-readable status message
+    message: Mapped[str] = Column(
+        Text,
+        nullable=False,
+        comment="Status message",
+    )
+    
+    # Webhook request body that started the job
+    payload: Mapped[Optional[Dict[str, Any]]] = Column(
+        JSONB,
+        nullable=True,
+        comment="Webhook request that started the job",
+    )
+    
+    # Job output
+    result: Mapped[Optional[Dict[str, Any]]] = Column(
+        JSONB,
+        nullable=True,
+        comment="Job result once completed",
+    )
+    
+    # Error messages
+    errors: Mapped[Optional[List[str]]] = Column(
+        JSONB,
+        nullable=True,
+        comment="Errors collected while running",
+    )
+    
+    # Refreshed by the worker while the job runs; a running job with a
+    # stale heartbeat was abandoned by a crashed worker
+    heartbeat_at: Mapped[Optional[datetime]] = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Last heartbeat from the worker running the job",
+    )
+    
+    # Times the job has been claimed (bounds retries of abandoned jobs)
+    attempts: Mapped[int] = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of times the job has been claimed",
+    )
+    
+    # When the job finished (completed or failed)
+    completed_at: Mapped[Optional[datetime]] = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When the job reached a final status",
+    )
@@ -46,6 +46,7 @@ from app.schemas.venue import (
     VenueUpdate,
     VenueResponse,
     VenueListResponse,
+    VenuePageResponse,
     VenueDetailResponse,
     VenueSearchParams,
 )
@@ -80,6 +81,7 @@ __all__ = [
     "VenueUpdate",
     "VenueResponse",
     "VenueListResponse",
+    "VenuePageResponse",
     "VenueDetailResponse",
     "VenueSearchParams",
     
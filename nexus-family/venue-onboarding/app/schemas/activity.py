@@ -25,7 +25,7 @@ from typing import Optional, List, Any  # Type hints
 from uuid import UUID  # UUID type
 
 # Third-party imports
-from pydantic import BaseModel, Field, ConfigDict  # Pydantic base and config
+from pydantic import AliasPath, BaseModel, Field, ConfigDict  # Pydantic base and config
 
 
 # =============================================================================
@@ -457,37 +457,51 @@ class ActivityListResponse(BaseModel):
 class ActivityDetailResponse(ActivityResponse):
     """
     Detailed activity response with sessions and venue info.
+    
+    When validated from an Activity model, the venue fields are read
+    straight from the loaded venue relationship and the sessions from
+    the _upcoming_sessions attribute set by
+    ActivityService.get_activity_detail. Missing values fall back to the
+    defaults.
     """
     
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+    
     # Upcoming sessions
     upcoming_sessions: List[ActivitySessionResponse] = Field(
         default_factory=list,
+        validation_alias="_upcoming_sessions",
         description="Upcoming available sessions",
     )
     
     # Venue details
     venue_name: Optional[str] = Field(
         default=None,
+        validation_alias=AliasPath("venue", "name"),
         description="Name of the venue",
     )
     
     venue_slug: Optional[str] = Field(
         default=None,
+        validation_alias=AliasPath("venue", "slug"),
         description="Venue URL slug",
     )
     
     venue_rating: Optional[float] = Field(
         default=None,
+        validation_alias=AliasPath("venue", "google_rating"),
         description="Venue's Google rating",
     )
     
     venue_address: Optional[str] = Field(
         default=None,
+        validation_alias=AliasPath("venue", "address_line1"),
         description="Venue address",
     )
     
     venue_city: Optional[str] = Field(
         default=None,
+        validation_alias=AliasPath("venue", "city"),
         description="Venue city",
     )
 
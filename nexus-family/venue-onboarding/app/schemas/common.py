@@ -19,6 +19,9 @@ from uuid import UUID  # UUID type
 # Third-party imports
 from pydantic import BaseModel, Field, ConfigDict  # Pydantic v2
 
+# Local imports
+from app.core.time import utcnow  # Timezone-aware UTC time
+
 
 # =============================================================================
 # TYPE VARIABLES
@@ -247,7 +250,7 @@ class HealthResponse(BaseSchema):
         description="Current environment",
     )
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Health check timestamp",
     )
     services: List[ServiceHealth] = Field(
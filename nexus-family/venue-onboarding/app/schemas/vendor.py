@@ -7,6 +7,11 @@ Vendor Portal Pydantic Schemas Module.
 This module defines Pydantic models for the Vendor Portal functionality
 including authentication, profile management, and venue access.
 
+Request bodies are flat TypedDicts rather than BaseModels: pydantic-core
+validates them straight into a plain dict without building a model
+instance, and endpoints read them with item access. The exception is
+VendorPasswordChangeRequest, which needs a cross-field validator.
+
 Phase 1 Implementation:
     - Simple email/password authentication
     - Basic vendor profile
@@ -24,17 +29,18 @@ Phase 2 Will Add:
 # =============================================================================
 # Standard library imports
 from datetime import datetime  # Date/time types
-from typing import Optional, List, Dict, Any  # Type hints
+from typing import Annotated, Optional, List, Dict, Any  # Type hints
 from uuid import UUID  # UUID type
 
 # Third-party imports
-from pydantic import BaseModel, Field, ConfigDict, EmailStr  # Pydantic
+from pydantic import BaseModel, Field, ConfigDict, EmailStr, model_validator  # Pydantic
+from typing_extensions import NotRequired, TypedDict  # Request bodies
 
 
 # =============================================================================
 # AUTHENTICATION SCHEMAS
 # =============================================================================
-class VendorLoginRequest(BaseModel):
+class VendorLoginRequest(TypedDict):
     """
     Schema for vendor login request.
     
@@ -42,26 +48,23 @@ class VendorLoginRequest(BaseModel):
     """
     
     # Email address
-    email: EmailStr = Field(
-        ...,
+    email: Annotated[EmailStr, Field(
         description="Vendor's email address",
         examples=["vendor@swimacademy.com"],
-    )
+    )]
     
     # Password
-    password: str = Field(
-        ...,
+    password: Annotated[str, Field(
         min_length=8,
         max_length=128,
         description="Vendor's password",
         examples=["SecurePassword123!"],
-    )
+    )]
     
-    # Remember me flag (extends session)
-    remember_me: bool = Field(
-        default=False,
+    # Remember me flag (extends session); absent means False
+    remember_me: NotRequired[Annotated[bool, Field(
         description="Extend session duration",
-    )
+    )]]
 
 
 class VendorLoginResponse(BaseModel):
@@ -214,30 +217,33 @@ class VendorProfileResponse(VendorProfileBase):
     )
 
 
-class VendorProfileUpdateRequest(BaseModel):
+class VendorProfileUpdateRequest(TypedDict):
     """
     Schema for updating vendor profile.
+    
+    Omitted keys are left unchanged.
     """
     
     # Display name
-    display_name: Optional[str] = Field(
-        default=None,
+    display_name: NotRequired[Annotated[Optional[str], Field(
         min_length=2,
         max_length=255,
         description="New display name",
-    )
+    )]]
     
     # Phone number
-    phone: Optional[str] = Field(
-        default=None,
+    phone: NotRequired[Annotated[Optional[str], Field(
         max_length=50,
         description="New phone number",
-    )
+    )]]
 
 
 class VendorPasswordChangeRequest(BaseModel):
     """
     Schema for changing vendor password.
+    
+    Rejects (422) requests whose confirmation doesn't match the new
+    password during validation, before the endpoint runs.
     """
     
     # Current password
@@ -262,6 +268,13 @@ class VendorPasswordChangeRequest(BaseModel):
         max_length=128,
         description="Confirm new password",
     )
+    
+    @model_validator(mode="after")
+    def validate_passwords_match(self) -> "VendorPasswordChangeRequest":
+        """Validate that confirm_password matches new_password."""
+        if self.new_password != self.confirm_password:
+            raise ValueError("New password and confirmation don't match")
+        return self
 
 
 # =============================================================================
@@ -506,31 +519,30 @@ class MockPricingResponse(BaseModel):
     )
 
 
-class MockPricingUpdateRequest(BaseModel):
+class MockPricingUpdateRequest(TypedDict):
     """
     Schema for updating mock pricing (vendor can override).
+    
+    Omitted prices are left unchanged.
     """
     
     # Activity type
-    activity_type: str = Field(
-        ...,
+    activity_type: Annotated[str, Field(
         description="Activity type to update",
-    )
+    )]
     
     # New prices
-    weekday_price_inr: Optional[float] = Field(
-        default=None,
+    weekday_price_inr: NotRequired[Annotated[Optional[float], Field(
         ge=0,
         le=10000,
         description="New weekday price",
-    )
+    )]]
     
-    weekend_price_inr: Optional[float] = Field(
-        default=None,
+    weekend_price_inr: NotRequired[Annotated[Optional[float], Field(
         ge=0,
         le=10000,
         description="New weekend price",
-    )
+    )]]
 
 
 class MockPricingListResponse(BaseModel):
@@ -258,6 +258,44 @@ class VenueListResponse(BaseSchema):
     is_active: bool = True
 
 
+class VenuePageResponse(BaseModel):
+    """
+    Paginated list of venues.
+    """
+    
+    # List of venues
+    venues: List[VenueResponse] = Field(
+        default_factory=list,
+        description="List of venues",
+    )
+    
+    # Pagination info
+    total: int = Field(
+        default=0,
+        ge=0,
+        description="Total number of venues",
+    )
+    
+    page: int = Field(
+        default=1,
+        ge=1,
+        description="Current page number",
+    )
+    
+    page_size: int = Field(
+        default=20,
+        ge=1,
+        le=100,
+        description="Items per page",
+    )
+    
+    total_pages: int = Field(
+        default=1,
+        ge=1,
+        description="Total number of pages",
+    )
+
+
 class VenueDetailResponse(VenueResponse):
     """
     Schema for detailed venue response.
@@ -22,6 +22,8 @@ Services Included:
     - VenueService: Venue discovery and management
     - ActivityService: Activity management
     - VendorService: Vendor authentication and portal
+    - job_queue: Webhook job queue, worker and callbacks (module-level
+      functions, imported from app.services.job_queue directly)
 
 Usage:
     ```python
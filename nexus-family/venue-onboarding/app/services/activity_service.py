@@ -27,12 +27,17 @@ Phase 2 Will Add:
 # =============================================================================
 # Standard library imports
 from datetime import date, datetime, timedelta  # Date handling
-from typing import Optional, List, Tuple, Dict, Any  # Type hints
+from typing import Optional, List, Tuple, Dict, Any, AsyncIterator  # Type hints
 from uuid import UUID  # UUID type
 
 # Third-party imports
 from sqlalchemy import select, func, or_, and_  # Query building
-from sqlalchemy.orm import selectinload  # Eager loading
+from sqlalchemy.orm import (  # Eager loading
+    contains_eager,
+    joinedload,
+    lazyload,
+    selectinload,
+)
 from sqlalchemy.ext.asyncio import AsyncSession  # Session type
 
 # Local imports
@@ -48,6 +53,19 @@ from app.core.exceptions import NotFoundError  # Exceptions
 logger = get_logger(__name__)
 
 
+# =============================================================================
+# LOADER OPTIONS
+# =============================================================================
+# Activity.sessions and the Venue collections (activities, reviews,
+# pricing) are selectin-loaded by default. Activity reads only need the
+# venue row itself, and upcoming sessions are queried separately with a
+# date filter and limit, so these options stop that cascade.
+_SKIP_SESSIONS = lazyload(Activity.sessions)
+
+# Rows fetched per round trip when streaming from a server-side cursor
+_STREAM_BATCH_SIZE = 100
+
+
 # =============================================================================
 # ACTIVITY SERVICE
 # =============================================================================
@@ -134,7 +152,11 @@ class ActivityService(BaseService[Activity]):
         offset = (page - 1) * page_size
         
         # Build base query with venue join (needed for city filter)
-        query = select(Activity).join(Venue, Activity.venue_id == Venue.id)
+        # The total is computed in the same round trip with a window count
+        query = select(
+            Activity,
+            func.count().over().label("total_count"),
+        ).join(Venue, Activity.venue_id == Venue.id)
         count_query = select(func.count()).select_from(Activity).join(
             Venue, Activity.venue_id == Venue.id
         )
@@ -197,15 +219,25 @@ class ActivityService(BaseService[Activity]):
         # Add pagination
         query = query.offset(offset).limit(page_size)
         
-        # Add eager loading
-        query = query.options(selectinload(Activity.venue))
+        # Populate the venue from the existing join (no extra query)
+        query = query.options(
+            contains_eager(Activity.venue).lazyload("*"),
+            _SKIP_SESSIONS,
+        )
         
-        # Execute queries
+        # Execute query
         result = await self.db.execute(query)
-        activities = list(result.scalars().all())
-        
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar_one()
+        rows = result.all()
+        activities = [row[0] for row in rows]
+        
+        if rows:
+            total = rows[0].total_count
+        elif offset == 0:
+            total = 0
+        else:
+            # Page past the end: no rows to carry the window count
+            count_result = await self.db.execute(count_query)
+            total = count_result.scalar_one()
         
         logger.debug(
             f"Listed activities: {len(activities)} of {total}",
@@ -242,11 +274,14 @@ class ActivityService(BaseService[Activity]):
         Raises:
             NotFoundError: If activity not found
         """
-        # Build query with eager loading
+        # Build query with the venue joined in the same round trip
         query = (
             select(Activity)
             .where(Activity.id == activity_id)
-            .options(selectinload(Activity.venue))
+            .options(
+                joinedload(Activity.venue).lazyload("*"),
+                _SKIP_SESSIONS,
+            )
         )
         
         # Execute query
@@ -298,7 +333,10 @@ class ActivityService(BaseService[Activity]):
                     Activity.slug == activity_slug
                 )
             )
-            .options(selectinload(Activity.venue))
+            .options(
+                contains_eager(Activity.venue).lazyload("*"),
+                _SKIP_SESSIONS,
+            )
         )
         
         # Execute
@@ -416,11 +454,41 @@ class ActivityService(BaseService[Activity]):
             select(Activity)
             .where(and_(*conditions))
             .order_by(Activity.name.asc())
+            .options(_SKIP_SESSIONS)
         )
         
         result = await self.db.execute(query)
         return list(result.scalars().all())
     
+    async def stream_venue_activities(
+        self,
+        venue_id: UUID,
+    ) -> AsyncIterator[Activity]:
+        """
+        Stream all activities for a venue (active or not), by name.
+        
+        Rows are read through a server-side cursor in batches, so memory
+        stays flat for large venues and callers can start sending output
+        after the first batch.
+        
+        Args:
+            venue_id: The venue's UUID
+        
+        Yields:
+            Activity: Activities at the venue, without sessions loaded
+        """
+        query = (
+            select(Activity)
+            .where(Activity.venue_id == venue_id)
+            .order_by(Activity.name.asc())
+            .options(_SKIP_SESSIONS)
+            .execution_options(yield_per=_STREAM_BATCH_SIZE)
+        )
+        
+        result = await self.db.stream_scalars(query)
+        async for activity in result:
+            yield activity
+    
     # =========================================================================
     # FILTERING HELPERS
     # =========================================================================
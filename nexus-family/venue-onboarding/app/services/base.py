@@ -36,6 +36,7 @@ from sqlalchemy.orm import selectinload  # Eager loading
 from app.models.base import Base  # Base model class
 from app.core.logging_config import get_logger  # Logging
 from app.core.exceptions import NotFoundError, DatabaseError  # Exceptions
+from app.core.cache import invalidate_lookups  # Lookup cache
 
 # =============================================================================
 # TYPE VARIABLES
@@ -312,6 +313,9 @@ class BaseService(ABC, Generic[ModelType]):
             # Refresh to get generated values (like ID, timestamps)
             await self.db.refresh(db_obj)
             
+            # Cached lookups (cities, categories) may now be stale
+            invalidate_lookups(self.model.__tablename__)
+            
             self.logger.info(
                 f"Created {self.model.__name__}",
                 extra={"id": str(db_obj.id)}
@@ -363,6 +367,9 @@ class BaseService(ABC, Generic[ModelType]):
             # Refresh to get any computed values
             await self.db.refresh(db_obj)
             
+            # Cached lookups (cities, categories) may now be stale
+            invalidate_lookups(self.model.__tablename__)
+            
             self.logger.info(
                 f"Updated {self.model.__name__}",
                 extra={"id": str(id)}
@@ -406,6 +413,9 @@ class BaseService(ABC, Generic[ModelType]):
             # Commit the deletion
             await self.db.commit()
             
+            # Cached lookups (cities, categories) may now be stale
+            invalidate_lookups(self.model.__tablename__)
+            
             self.logger.info(
                 f"Deleted {self.model.__name__}",
                 extra={"id": str(id)}
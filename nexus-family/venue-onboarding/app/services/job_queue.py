@@ -0,0 +1,946 @@
+# =============================================================================
+# NEXUS FAMILY PASS - WEBHOOK JOB QUEUE
+# =============================================================================
+"""
+Webhook Job Queue Service Module.
+
+This service runs the long-running jobs started by the N8N webhooks
+(app/api/v1/endpoints/webhooks.py):
+    - Durable job queue in the webhook_jobs table (create, dedupe, update)
+    - Job runners for each job type (LangGraph workflows, ...)
+    - Per-process job worker with heartbeat leases and pruning
+    - LISTEN/NOTIFY job events for WebSocket watchers
+    - Completion callback dispatcher
+
+The worker, event listener and dispatcher are started and stopped from
+the app lifespan via start_job_worker() / stop_job_worker().
+
+Usage:
+    ```python
+    from app.services.job_queue import create_job, wake_job_worker
+    
+    job_id = await create_job("venue_onboard", request)
+    wake_job_worker()
+    ```
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+import contextlib
+import hashlib
+import time
+import uuid
+import asyncio
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING, Any, Awaitable, Callable, Optional, List, Dict,
+    NamedTuple, Set, Tuple,
+)
+from datetime import timedelta
+from enum import Enum
+
+import asyncpg
+import httpx
+import orjson
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.config import settings
+from app.core.logging_config import get_logger
+from app.core.database import get_session_factory
+from app.models.webhook_job import WebhookJob
+
+if TYPE_CHECKING:
+    from app.integrations.ai.langgraph import (
+        QualityScoringBatchWorkflow,
+        VenueDiscoveryWorkflow,
+        VenueOnboardingWorkflow,
+    )
+
+# =============================================================================
+# LOGGER
+# =============================================================================
+logger = get_logger(__name__)
+
+# =============================================================================
+# JOB STORAGE
+# =============================================================================
+# Jobs are stored in the webhook_jobs table, which doubles as the job queue
+# (see JOB WORKER below): a job can be polled through, and run by, any
+# worker or replica. Finished jobs older than _JOB_RETENTION are pruned by
+# the job worker, at most once per _JOB_PRUNE_INTERVAL seconds per process,
+# so the table stays bounded without a DELETE on every job creation.
+_JOB_RETENTION = timedelta(days=1)
+_JOB_PRUNE_INTERVAL = 3600.0
+
+
+class JobStatus(str, Enum):
+    """Webhook job status."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+# Statuses a job never leaves
+FINAL_STATUSES = (JobStatus.COMPLETED.value, JobStatus.FAILED.value)
+
+
+# =============================================================================
+# JOB STORE
+# =============================================================================
+def _to_json(value: Any) -> Any:
+    """Convert workflow output (UUIDs, datetimes, ...) to plain JSON values."""
+    return orjson.loads(orjson.dumps(value, default=str))
+
+
+def _parse_job_id(job_id: str) -> Optional[uuid.UUID]:
+    """Parse a job ID, returning None if it is not a valid UUID."""
+    try:
+        return uuid.UUID(job_id)
+    except ValueError:
+        return None
+
+
+def _dedupe_key(job_type: str, payload: Any) -> str:
+    """Hash a job type and its (JSON) payload into a dedupe key."""
+    canonical = orjson.dumps([job_type, payload], option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+async def create_job(job_type: str, payload: Dict[str, Any]) -> str:
+    """
+    Create a new job and return its ID.
+
+    The payload is the validated webhook body. It is stored as-is (it is
+    what the worker runs the job from), so it must already be plain JSON
+    data; the TypedDict request schemas guarantee that.
+
+    If an identical request (same job type and body) is already pending or
+    running, e.g. an N8N retry, that job's ID is returned instead, unless
+    that job was abandoned by a dead worker (expired lease): it is failed
+    and the request gets a fresh job.
+    """
+    dedupe_key = _dedupe_key(job_type, payload)
+
+    async with get_session_factory()() as session:
+        # Three tries: the in-flight duplicate may finish, or be failed as
+        # abandoned, between the conflicting insert and the retry
+        for _ in range(3):
+            job_id = await session.scalar(
+                pg_insert(WebhookJob)
+                .values(
+                    job_type=job_type,
+                    status=JobStatus.PENDING.value,
+                    message="Job created, pending execution",
+                    payload=payload,
+                    errors=[],
+                    dedupe_key=dedupe_key,
+                    # Database clock, like completed_at, heartbeat_at and
+                    # the retention cutoff, rather than the mixin's
+                    # application-side utcnow default
+                    created_at=func.now(),
+                )
+                .on_conflict_do_nothing()
+                .returning(WebhookJob.id)
+            )
+            if job_id is not None:
+                logger.info("Created job %s of type %s", job_id, job_type)
+                break
+
+            in_flight = (
+                await session.execute(
+                    select(
+                        WebhookJob.id,
+                        _lease_expired().label("abandoned"),
+                    ).where(
+                        WebhookJob.dedupe_key == dedupe_key,
+                        WebhookJob.status.in_(
+                            [JobStatus.PENDING.value, JobStatus.RUNNING.value]
+                        ),
+                    )
+                )
+            ).first()
+            if in_flight is None:
+                continue
+
+            if not in_flight.abandoned:
+                job_id = in_flight.id
+                logger.info("Reusing in-flight job %s of type %s", job_id, job_type)
+                break
+
+            # Free the dedupe key held by the dead worker's job
+            await _fail_abandoned_jobs(WebhookJob.dedupe_key == dedupe_key)
+        else:
+            raise RuntimeError(f"Could not create {job_type} job")
+
+        await session.commit()
+
+    return str(job_id)
+
+
+async def update_job(
+    job_id: str,
+    status: JobStatus,
+    message: str,
+    result: Optional[Dict[str, Any]] = None,
+    errors: Optional[List[str]] = None,
+) -> None:
+    """Update a job's status."""
+    values: Dict[str, Any] = {"status": status.value, "message": message}
+    if result:
+        values["result"] = _to_json(result)
+    if errors:
+        values["errors"] = _to_json(errors)
+    if status in [JobStatus.COMPLETED, JobStatus.FAILED]:
+        # Stamped by the database, on the same clock as created_at
+        values["completed_at"] = func.now()
+
+    async with get_session_factory()() as session:
+        await session.execute(
+            update(WebhookJob)
+            .where(WebhookJob.id == uuid.UUID(job_id))
+            .values(**values)
+        )
+        # Delivered on commit to every process's job listener (WebSockets)
+        await session.execute(select(func.pg_notify(_JOB_CHANNEL, job_id)))
+        await session.commit()
+
+    logger.info("Updated job %s: %s", job_id, status.value)
+
+
+async def get_job(job_id: str) -> Optional[WebhookJob]:
+    """Load a job by ID, or None if it doesn't exist."""
+    job_uuid = _parse_job_id(job_id)
+    if job_uuid is None:
+        return None
+
+    async with get_session_factory()() as session:
+        return await session.get(WebhookJob, job_uuid)
+
+
+class JobProgress:
+    """
+    Coalesced progress reporting for batch jobs.
+
+    Counts finished items in memory and writes a progress message to the
+    job row only every ~5% of the batch, so a batch of N items costs at
+    most ~20 progress writes instead of N.
+    """
+
+    def __init__(self, job_id: str, total: int, label: str) -> None:
+        self.job_id = job_id
+        self.total = total
+        self.label = label
+        self.done = 0
+        self._flushed = 0
+        self._step = max(1, total // 20)
+        self._flushing = False
+
+    async def tick(self) -> None:
+        """Record one finished item, flushing if enough have accumulated."""
+        self.done += 1
+        # The final count is written by the job's COMPLETED update
+        if self.done >= self.total or self._flushing:
+            return
+        if self.done - self._flushed < self._step:
+            return
+
+        self._flushed = self.done
+        self._flushing = True
+        try:
+            await update_job(
+                self.job_id,
+                JobStatus.RUNNING,
+                f"{self.label} {self.done}/{self.total}",
+            )
+        except Exception as e:
+            logger.warning("Failed to record progress for job %s: %s", self.job_id, e)
+        finally:
+            self._flushing = False
+
+
+# =============================================================================
+# WORKFLOWS
+# =============================================================================
+# Workflows compile their LangGraph graph in __init__ and keep no per-run
+# state, so each process builds one of each on first use and reuses it.
+# The import stays deferred so the API starts without loading LangGraph.
+@lru_cache(maxsize=1)
+def _get_onboarding_workflow() -> "VenueOnboardingWorkflow":
+    """Return the shared venue onboarding workflow."""
+    from app.integrations.ai.langgraph import VenueOnboardingWorkflow
+
+    return VenueOnboardingWorkflow()
+
+
+@lru_cache(maxsize=1)
+def _get_scoring_workflow() -> "QualityScoringBatchWorkflow":
+    """Return the shared quality scoring workflow."""
+    from app.integrations.ai.langgraph import QualityScoringBatchWorkflow
+
+    return QualityScoringBatchWorkflow()
+
+
+@lru_cache(maxsize=1)
+def _get_discovery_workflow() -> "VenueDiscoveryWorkflow":
+    """Return the shared venue discovery workflow."""
+    from app.integrations.ai.langgraph import VenueDiscoveryWorkflow
+
+    return VenueDiscoveryWorkflow()
+
+
+# =============================================================================
+# JOB RUNNERS
+# =============================================================================
+# Each runner takes the job ID and the stored request payload, so it can run
+# in whichever process claims the job. It returns the completion message and
+# result, or raises; _run_claimed_job writes the RUNNING/COMPLETED/FAILED
+# updates and sends the callback.
+JobOutcome = Tuple[str, Dict[str, Any]]
+
+
+class JobFailed(Exception):
+    """Raised by a runner whose workflow reported failure (not a crash)."""
+
+    def __init__(self, message: str, errors: List[str]) -> None:
+        super().__init__(message)
+        self.errors = errors
+
+
+async def run_onboarding(job_id: str, request: Dict[str, Any]) -> JobOutcome:
+    """Run the venue onboarding workflow."""
+    result = await _get_onboarding_workflow().run(
+        google_place_id=request["google_place_id"],
+        city=request["city"],
+    )
+
+    if result.get("status") != "completed":
+        raise JobFailed("Onboarding failed", result.get("errors", []))
+
+    return f"Venue onboarded: {result.get('venue_id')}", result
+
+
+async def run_batch(job_id: str, request: Dict[str, Any]) -> JobOutcome:
+    """Run batch venue onboarding."""
+    progress = JobProgress(job_id, len(request["place_ids"]), "Processed venues")
+    results = await _get_onboarding_workflow().run_batch(
+        place_ids=request["place_ids"],
+        city=request["city"],
+        on_venue_done=progress.tick,
+    )
+
+    success_count = sum(
+        1 for r in results if r.get("status") == "completed"
+    )
+
+    return (
+        f"Onboarded {success_count}/{len(request['place_ids'])} venues",
+        {"results": results, "success_count": success_count},
+    )
+
+
+async def run_scoring(job_id: str, request: Dict[str, Any]) -> JobOutcome:
+    """Run batch quality scoring."""
+    result = await _get_scoring_workflow().run(venue_ids=request["venue_ids"])
+
+    return f"Scored {result.get('processed_count', 0)} venues", result
+
+
+async def run_discovery(job_id: str, request: Dict[str, Any]) -> JobOutcome:
+    """Run venue discovery."""
+    result = await _get_discovery_workflow().discover_and_onboard(
+        search_query=request["search_query"],
+        city=request["city"],
+        auto_onboard=request.get("auto_onboard", False),
+    )
+
+    suitable_count = len(result.get("suitable_venues", []))
+    return f"Found {suitable_count} suitable venues", result
+
+
+async def run_refresh(job_id: str, request: Dict[str, Any]) -> JobOutcome:
+    """Run the monthly credit refresh."""
+    # TODO: Implement credit refresh logic
+    # This would:
+    # 1. Query all active subscriptions
+    # 2. Calculate credit allocations
+    # 3. Create credit_ledger entries
+    # 4. Send notifications
+
+    return (
+        "Credit refresh completed",
+        {"month": request["month"], "year": request["year"]},
+    )
+
+
+async def run_reconciliation(job_id: str, request: Dict[str, Any]) -> JobOutcome:
+    """Run booking reconciliation."""
+    # TODO: Implement reconciliation logic
+    # This would:
+    # 1. Query all bookings for the date
+    # 2. Check venue attendance records
+    # 3. Update booking statuses
+    # 4. Process credit forfeitures
+    # 5. Send feedback request emails
+
+    return (
+        f"Reconciliation completed for {request['date']}",
+        {"date": request["date"], "processed": 0, "no_shows": 0},
+    )
+
+
+class _JobType(NamedTuple):
+    """How to start and run one kind of job."""
+
+    # Builds the RUNNING message from the request
+    start_message: Callable[[Dict[str, Any]], str]
+    run: Callable[[str, Dict[str, Any]], Awaitable[JobOutcome]]
+
+
+# job_type -> how to run it
+_JOB_TYPES: Dict[str, _JobType] = {
+    "venue_onboard": _JobType(
+        lambda _r: "Onboarding in progress",
+        run_onboarding,
+    ),
+    "batch_onboard": _JobType(
+        lambda r: f"Processing {len(r['place_ids'])} venues",
+        run_batch,
+    ),
+    "quality_scoring": _JobType(
+        lambda r: f"Scoring {len(r['venue_ids'])} venues",
+        run_scoring,
+    ),
+    "venue_discovery": _JobType(
+        lambda r: f"Discovering {r['search_query']} in {r['city']}",
+        run_discovery,
+    ),
+    "credit_refresh": _JobType(
+        lambda r: f"Refreshing credits for {r['month']}/{r['year']}",
+        run_refresh,
+    ),
+    "booking_reconciliation": _JobType(
+        lambda r: f"Reconciling bookings for {r['date']}",
+        run_reconciliation,
+    ),
+}
+
+
+# =============================================================================
+# JOB WORKER
+# =============================================================================
+# Every API process runs a worker that claims pending jobs from the
+# webhook_jobs table (FOR UPDATE SKIP LOCKED, so each job is claimed by
+# exactly one process) and runs up to settings.WEBHOOK_JOB_CONCURRENCY of
+# them at a time. Pending jobs survive restarts and are picked up by any
+# replica; jobs interrupted by a clean shutdown are put back to pending.
+#
+# Jobs whose worker died without a clean shutdown (crash, SIGKILL, lost
+# replica) are recovered through a lease: the running worker refreshes
+# heartbeat_at every _JOB_HEARTBEAT_INTERVAL seconds, and a running job
+# whose heartbeat is older than _JOB_LEASE is claimed again. After
+# _JOB_MAX_ATTEMPTS claims it is failed instead, so a job that keeps
+# killing its worker can't loop forever (or hold its dedupe key).
+_JOB_POLL_INTERVAL = 5.0
+_JOB_HEARTBEAT_INTERVAL = 30.0
+_JOB_LEASE = timedelta(minutes=2)
+_JOB_MAX_ATTEMPTS = 3
+
+_job_wakeup = asyncio.Event()
+_job_worker_task: Optional[asyncio.Task] = None
+
+
+async def _prune_jobs() -> None:
+    """Delete finished jobs older than _JOB_RETENTION."""
+    async with get_session_factory()() as session:
+        result = await session.execute(
+            delete(WebhookJob).where(
+                WebhookJob.status.in_(FINAL_STATUSES),
+                WebhookJob.created_at < func.now() - _JOB_RETENTION,
+            )
+        )
+        await session.commit()
+
+    if result.rowcount:
+        logger.info("Pruned %s old webhook jobs", result.rowcount)
+
+
+def _lease_expired() -> Any:
+    """SQL condition for running jobs whose worker stopped heartbeating."""
+    return and_(
+        WebhookJob.status == JobStatus.RUNNING.value,
+        or_(
+            # Running since before heartbeats were recorded
+            WebhookJob.heartbeat_at.is_(None),
+            WebhookJob.heartbeat_at < func.now() - _JOB_LEASE,
+        ),
+    )
+
+
+async def _fail_abandoned_jobs(*conditions: Any) -> None:
+    """
+    Fail running jobs whose lease expired, notifying watchers and callbacks.
+
+    Args:
+        *conditions: Further WHERE conditions selecting which jobs to fail
+    """
+    async with get_session_factory()() as session:
+        result = await session.execute(
+            update(WebhookJob)
+            .where(_lease_expired(), *conditions)
+            .values(
+                status=JobStatus.FAILED.value,
+                message="Job abandoned",
+                errors=["Worker stopped responding"],
+                completed_at=func.now(),
+            )
+            .returning(WebhookJob.id, WebhookJob.payload)
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
+        for row in rows:
+            await session.execute(select(func.pg_notify(_JOB_CHANNEL, str(row.id))))
+        await session.commit()
+
+    for row in rows:
+        logger.warning("Failed abandoned job %s", row.id)
+        callback_url = (row.payload or {}).get("callback_url")
+        if callback_url:
+            enqueue_callback(callback_url, str(row.id))
+
+
+async def _claim_job() -> Optional[Tuple[str, str, Dict[str, Any]]]:
+    """
+    Atomically mark the oldest claimable job as running and return it.
+
+    Claimable jobs are pending ones, and running ones whose lease expired
+    with attempts to spare.
+    """
+    next_pending = (
+        select(WebhookJob.id)
+        .where(
+            or_(
+                WebhookJob.status == JobStatus.PENDING.value,
+                and_(_lease_expired(), WebhookJob.attempts < _JOB_MAX_ATTEMPTS),
+            )
+        )
+        .order_by(WebhookJob.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+
+    async with get_session_factory()() as session:
+        result = await session.execute(
+            update(WebhookJob)
+            .where(WebhookJob.id == next_pending)
+            .values(
+                status=JobStatus.RUNNING.value,
+                message="Job started",
+                heartbeat_at=func.now(),
+                attempts=WebhookJob.attempts + 1,
+            )
+            .returning(WebhookJob.id, WebhookJob.job_type, WebhookJob.payload)
+            .execution_options(synchronize_session=False)
+        )
+        row = result.first()
+        await session.commit()
+
+    if row is None:
+        return None
+    return str(row.id), row.job_type, row.payload or {}
+
+
+async def _job_heartbeat_loop(job_id: str) -> None:
+    """Refresh a running job's heartbeat_at until cancelled."""
+    job_uuid = uuid.UUID(job_id)
+    while True:
+        await asyncio.sleep(_JOB_HEARTBEAT_INTERVAL)
+        try:
+            async with get_session_factory()() as session:
+                await session.execute(
+                    update(WebhookJob)
+                    .where(
+                        WebhookJob.id == job_uuid,
+                        WebhookJob.status == JobStatus.RUNNING.value,
+                    )
+                    .values(heartbeat_at=func.now())
+                )
+                await session.commit()
+        except Exception as e:
+            logger.warning("Failed to refresh heartbeat of job %s: %s", job_id, e)
+
+
+async def _record_outcome(
+    job_id: str,
+    status: JobStatus,
+    message: str,
+    errors: Optional[List[str]] = None,
+) -> None:
+    """
+    Record a failed or requeued job without raising.
+
+    Used from the runner's error paths, which often run because the
+    database is unreachable. If this write fails too, the job stays
+    running and is recovered once its lease expires.
+    """
+    try:
+        await update_job(job_id, status, message, errors=errors)
+    except Exception as e:
+        logger.error(
+            "Failed to record job %s as %s: %s", job_id, status.value, e
+        )
+
+
+async def _run_claimed_job(
+    job_id: str,
+    job_type: str,
+    request: Dict[str, Any],
+) -> None:
+    """Run a claimed job, record its outcome and send its callback."""
+    heartbeat = asyncio.create_task(_job_heartbeat_loop(job_id))
+    try:
+        spec = _JOB_TYPES.get(job_type)
+        if spec is None:
+            raise ValueError(f"Unknown job type: {job_type}")
+
+        await update_job(job_id, JobStatus.RUNNING, spec.start_message(request))
+        message, result = await spec.run(job_id, request)
+        await update_job(job_id, JobStatus.COMPLETED, message, result=result)
+
+    except JobFailed as e:
+        await _record_outcome(job_id, JobStatus.FAILED, str(e), errors=e.errors)
+
+    except asyncio.CancelledError:
+        # Worker shutting down: hand the job to the next worker
+        await _record_outcome(
+            job_id, JobStatus.PENDING, "Requeued after worker shutdown"
+        )
+        raise
+
+    except Exception as e:
+        logger.error("Job %s (%s) failed: %s", job_id, job_type, e)
+        await _record_outcome(job_id, JobStatus.FAILED, str(e), errors=[str(e)])
+
+    finally:
+        heartbeat.cancel()
+
+    # Call callback if provided
+    if request.get("callback_url"):
+        enqueue_callback(request["callback_url"], job_id)
+
+
+async def _job_worker_loop(concurrency: int) -> None:
+    """Claim and run pending jobs until cancelled."""
+    slots = asyncio.Semaphore(concurrency)
+    running: Set[asyncio.Task] = set()
+
+    def on_done(task: asyncio.Task) -> None:
+        running.discard(task)
+        slots.release()
+
+    next_prune = 0.0
+    next_reap = 0.0
+
+    try:
+        while True:
+            await slots.acquire()
+
+            if time.monotonic() >= next_prune:
+                next_prune = time.monotonic() + _JOB_PRUNE_INTERVAL
+                try:
+                    await _prune_jobs()
+                except Exception as e:
+                    logger.warning("Failed to prune webhook jobs: %s", e)
+
+            if time.monotonic() >= next_reap:
+                next_reap = time.monotonic() + _JOB_LEASE.total_seconds()
+                try:
+                    await _fail_abandoned_jobs(
+                        WebhookJob.attempts >= _JOB_MAX_ATTEMPTS
+                    )
+                except Exception as e:
+                    logger.warning("Failed to expire abandoned webhook jobs: %s", e)
+
+            # Clear before claiming so a job created meanwhile re-wakes us
+            _job_wakeup.clear()
+            try:
+                claimed = await _claim_job()
+            except Exception as e:
+                logger.warning("Failed to claim webhook job: %s", e)
+                claimed = None
+
+            if claimed is None:
+                slots.release()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        _job_wakeup.wait(), timeout=_JOB_POLL_INTERVAL
+                    )
+                continue
+
+            task = asyncio.create_task(_run_claimed_job(*claimed))
+            running.add(task)
+            task.add_done_callback(on_done)
+
+    finally:
+        for task in list(running):
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+
+
+def wake_job_worker() -> None:
+    """Tell this process's worker a new job is pending (skips the poll wait)."""
+    _job_wakeup.set()
+
+
+async def start_job_worker() -> None:
+    """Start the webhook job worker. Called from the app lifespan."""
+    global _job_worker_task, _job_listener_task
+
+    await start_callback_dispatcher()
+
+    if _job_listener_task is None:
+        _job_listener_task = asyncio.create_task(_job_listener_loop())
+
+    concurrency = settings.WEBHOOK_JOB_CONCURRENCY
+    if concurrency > 0 and _job_worker_task is None:
+        _job_worker_task = asyncio.create_task(_job_worker_loop(concurrency))
+
+
+async def stop_job_worker() -> None:
+    """Stop the worker, requeueing the jobs it was running."""
+    global _job_worker_task, _job_listener_task
+
+    for task in (_job_worker_task, _job_listener_task):
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+    _job_worker_task = None
+    _job_listener_task = None
+
+    # After the worker, so callbacks of the last jobs are still sent
+    await stop_callback_dispatcher()
+
+
+# =============================================================================
+# JOB EVENTS
+# =============================================================================
+# update_job NOTIFYs _JOB_CHANNEL with the job ID. Each process LISTENs on
+# one dedicated asyncpg connection, opened outside the engine pool so it
+# never holds a pool slot, and wakes the WebSockets watching that job, so a
+# client sees updates from whichever process runs the job. When the
+# connection drops (or LISTEN is unavailable, e.g. behind a
+# transaction-mode pooler), the listener reconnects with exponential
+# backoff; meanwhile watchers still re-read the job every
+# JOB_WATCH_RECHECK seconds.
+_JOB_CHANNEL = "webhook_jobs"
+JOB_WATCH_RECHECK = 15.0
+_LISTENER_RETRY_MIN = 1.0
+_LISTENER_RETRY_MAX = 60.0
+
+# job_id -> events of the WebSockets watching it in this process
+_job_watchers: Dict[str, Set[asyncio.Event]] = {}
+_job_listener_task: Optional[asyncio.Task] = None
+
+
+def watch_job(job_id: str) -> asyncio.Event:
+    """Register a watcher for a job's updates."""
+    event = asyncio.Event()
+    _job_watchers.setdefault(job_id, set()).add(event)
+    return event
+
+
+def unwatch_job(job_id: str, event: asyncio.Event) -> None:
+    """Remove a watcher registered by watch_job."""
+    watchers = _job_watchers.get(job_id)
+    if watchers is not None:
+        watchers.discard(event)
+        if not watchers:
+            del _job_watchers[job_id]
+
+
+def _on_job_notify(connection: Any, pid: int, channel: str, job_id: str) -> None:
+    """asyncpg listener: wake everything watching the updated job."""
+    for event in _job_watchers.get(job_id, ()):
+        event.set()
+
+
+def _listener_dsn() -> str:
+    """Return DATABASE_URL as a plain libpq DSN for asyncpg.connect."""
+    return "postgresql://" + settings.async_database_url.partition("://")[2]
+
+
+async def _listen_for_jobs() -> None:
+    """
+    LISTEN for job updates on a dedicated connection until it closes.
+    
+    Raises:
+        ConnectionError: When the server or network drops the connection
+    """
+    conn = await asyncpg.connect(
+        _listener_dsn(),
+        timeout=settings.DATABASE_POOL_TIMEOUT,
+    )
+    closed = asyncio.Event()
+    conn.add_termination_listener(lambda _conn: closed.set())
+    try:
+        await conn.add_listener(_JOB_CHANNEL, _on_job_notify)
+        await closed.wait()
+        raise ConnectionError("job update listener connection closed")
+    finally:
+        if not conn.is_closed():
+            # terminate() never blocks on a dead socket, unlike close()
+            conn.terminate()
+
+
+async def _job_listener_loop() -> None:
+    """Hold a LISTEN connection for job updates, reconnecting until cancelled."""
+    delay = _LISTENER_RETRY_MIN
+    while True:
+        started = time.monotonic()
+        try:
+            await _listen_for_jobs()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # A connection that stayed up for a while resets the backoff
+            if time.monotonic() - started > _LISTENER_RETRY_MAX:
+                delay = _LISTENER_RETRY_MIN
+            logger.warning(
+                "Job update listener failed, retrying in %.0fs "
+                "(watchers poll meanwhile): %s",
+                delay, e,
+            )
+
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, _LISTENER_RETRY_MAX)
+
+
+# =============================================================================
+# CALLBACKS
+# =============================================================================
+# Callbacks go through one pooled client, so repeat callbacks to the same
+# N8N host reuse a kept-alive connection instead of a new TCP/TLS handshake.
+# Jobs only enqueue them; the dispatcher sends each one as its own task
+# (at most _CALLBACK_CONCURRENCY at a time), so a slow callback URL never
+# holds a job worker slot or delays the callbacks queued behind it.
+# On shutdown, callbacks still in flight get _CALLBACK_DRAIN_TIMEOUT
+# seconds to finish.
+_CALLBACK_TIMEOUT = 10.0
+_CALLBACK_CONCURRENCY = 50
+_CALLBACK_DRAIN_TIMEOUT = _CALLBACK_TIMEOUT + 5.0
+
+_callback_client: Optional[httpx.AsyncClient] = None
+_callback_queue: "asyncio.Queue[Tuple[str, str]]" = asyncio.Queue()
+_callback_slots = asyncio.Semaphore(_CALLBACK_CONCURRENCY)
+_callback_tasks: Set[asyncio.Task] = set()
+_callback_dispatcher_task: Optional[asyncio.Task] = None
+
+
+def _get_callback_client() -> httpx.AsyncClient:
+    """Return the shared callback client, creating it on first use."""
+    global _callback_client
+
+    if _callback_client is None:
+        _callback_client = httpx.AsyncClient(
+            timeout=_CALLBACK_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=50),
+        )
+    return _callback_client
+
+
+def enqueue_callback(callback_url: str, job_id: str) -> None:
+    """Queue a completion callback for the dispatcher."""
+    _callback_queue.put_nowait((callback_url, job_id))
+
+
+async def notify_callback(callback_url: str, job_id: str) -> None:
+    """Send callback notification when job completes."""
+    try:
+        job = await get_job(job_id)
+        if not job:
+            return
+
+        await _get_callback_client().post(
+            callback_url,
+            json={
+                "job_id": job_id,
+                "status": job.status,
+                "result": job.result,
+                "completed_at": (
+                    job.completed_at.isoformat() if job.completed_at else None
+                ),
+            },
+        )
+
+        logger.info("Callback sent for job %s to %s", job_id, callback_url)
+
+    except Exception as e:
+        logger.warning("Failed to send callback for job %s: %s", job_id, e)
+
+
+async def _send_callback(callback_url: str, job_id: str) -> None:
+    """Send one callback once a dispatcher slot is free."""
+    async with _callback_slots:
+        await notify_callback(callback_url, job_id)
+
+
+def _spawn_callback(callback_url: str, job_id: str) -> None:
+    """Start sending a callback as a tracked task."""
+    task = asyncio.create_task(_send_callback(callback_url, job_id))
+    _callback_tasks.add(task)
+    task.add_done_callback(_callback_tasks.discard)
+
+
+async def _callback_dispatcher_loop() -> None:
+    """Start a task for each queued callback until cancelled."""
+    while True:
+        callback_url, job_id = await _callback_queue.get()
+        _spawn_callback(callback_url, job_id)
+
+
+async def start_callback_dispatcher() -> None:
+    """Start the callback dispatcher."""
+    global _callback_dispatcher_task
+
+    if _callback_dispatcher_task is None:
+        _callback_dispatcher_task = asyncio.create_task(
+            _callback_dispatcher_loop()
+        )
+
+
+async def stop_callback_dispatcher() -> None:
+    """Stop the dispatcher, drain queued and in-flight callbacks, close the client."""
+    global _callback_dispatcher_task, _callback_client
+
+    # The dispatcher only ever waits on the queue, so cancelling it
+    # loses nothing: callbacks already taken are running as their own tasks
+    if _callback_dispatcher_task is not None:
+        _callback_dispatcher_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _callback_dispatcher_task
+        _callback_dispatcher_task = None
+
+    while not _callback_queue.empty():
+        _spawn_callback(*_callback_queue.get_nowait())
+
+    if _callback_tasks:
+        _, unfinished = await asyncio.wait(
+            _callback_tasks, timeout=_CALLBACK_DRAIN_TIMEOUT
+        )
+        if unfinished:
+            logger.warning(
+                "Dropping %d callbacks still in flight after %.0fs",
+                len(unfinished), _CALLBACK_DRAIN_TIMEOUT,
+            )
+            for task in unfinished:
+                task.cancel()
+            await asyncio.gather(*unfinished, return_exceptions=True)
+
+    if _callback_client is not None:
+        await _callback_client.aclose()
+        _callback_client = None
@@ -28,18 +28,19 @@ Phase 2 Will Add:
 # =============================================================================
 # Standard library imports
 from datetime import datetime, timedelta  # Date handling
-from typing import Optional, List, Dict, Any  # Type hints
+from typing import Optional, List, Dict, Any, Tuple  # Type hints
 from uuid import UUID  # UUID type
 
 # Third-party imports
-from sqlalchemy import select, and_  # Query building
-from sqlalchemy.orm import selectinload  # Eager loading
+from sqlalchemy import select, and_, func  # Query building
+from sqlalchemy.orm import joinedload, lazyload, selectinload  # Eager loading
 from sqlalchemy.ext.asyncio import AsyncSession  # Session type
 
 # Local imports
 from app.services.base import BaseService  # Base class
 from app.models.vendor import VendorCredential  # Vendor model
 from app.models.venue import Venue  # Venue model
+from app.models.activity import Activity  # Activity model
 from app.models.quality_score import VenueMockPricing  # Pricing model
 from app.core.security import (  # Security utilities
     hash_password,
@@ -247,15 +248,18 @@ class VendorService(BaseService[VendorCredential]):
             vendor_id: The vendor's UUID
         
         Returns:
-            Vendor with venue loaded
+            Vendor with venue loaded and its name copied to a plain
+            `venue_name` attribute (read by VendorProfileResponse)
         
         Raises:
             NotFoundError: If vendor not found
         """
+        # Only the venue row is needed (for its name and id), not the
+        # venue's selectin collections
         query = (
             select(VendorCredential)
             .where(VendorCredential.id == vendor_id)
-            .options(selectinload(VendorCredential.venue))
+            .options(joinedload(VendorCredential.venue).lazyload("*"))
         )
         
         result = await self.db.execute(query)
@@ -264,6 +268,9 @@ class VendorService(BaseService[VendorCredential]):
         if vendor is None:
             raise NotFoundError(f"Vendor with ID {vendor_id} not found")
         
+        # Unmapped attribute, so it survives the refresh after an update
+        vendor.venue_name = vendor.venue.name if vendor.venue else None
+        
         return vendor
     
     async def update_vendor_profile(
@@ -349,45 +356,112 @@ class VendorService(BaseService[VendorCredential]):
     async def get_vendor_venue(
         self,
         vendor_id: UUID,
+        include_activities: bool = False,
+        include_quality_score: bool = False,
     ) -> Venue:
         """
         Get the venue associated with a vendor.
         
+        The venue is looked up through the vendor's credential in a single
+        query. Only the requested relationships are loaded.
+        
         Args:
             vendor_id: The vendor's UUID
+            include_activities: Whether to load the venue's activities
+            include_quality_score: Whether to load the quality score
         
         Returns:
-            The vendor's venue with related data
+            The vendor's venue with requested related data
         
         Raises:
-            NotFoundError: If vendor or venue not found
+            NotFoundError: If vendor has no venue
         """
-        vendor = await self.get_vendor_profile(vendor_id)
+        # Venue collections are selectin by default; start from nothing
+        # and opt in to what the caller needs
+        options = [lazyload("*")]
         
-        if vendor.venue is None:
-            raise NotFoundError(
-                f"No venue associated with vendor {vendor_id}"
+        if include_activities:
+            options.append(
+                selectinload(Venue.activities).lazyload(Activity.sessions)
             )
         
-        # Load full venue details
+        if include_quality_score:
+            options.append(joinedload(Venue.quality_score))
+        
         query = (
             select(Venue)
-            .where(Venue.id == vendor.venue_id)
-            .options(
-                selectinload(Venue.quality_score),
-                selectinload(Venue.activities),
-                selectinload(Venue.mock_pricing),
-            )
+            .join(VendorCredential, VendorCredential.venue_id == Venue.id)
+            .where(VendorCredential.id == vendor_id)
+            .options(*options)
         )
         
         result = await self.db.execute(query)
         venue = result.scalar_one_or_none()
         
         if venue is None:
-            raise NotFoundError("Venue not found")
+            raise NotFoundError(
+                f"No venue associated with vendor {vendor_id}"
+            )
         
         return venue
     
+    async def get_vendor_venue_summary(
+        self,
+        vendor_id: UUID,
+    ) -> Tuple[Venue, int, int]:
+        """
+        Get the vendor's venue with its activity counts.
+        
+        The counts are computed by the database alongside the venue
+        fetch, so no activity rows are loaded.
+        
+        Args:
+            vendor_id: The vendor's UUID
+        
+        Returns:
+            Tuple of (venue with quality score, total activities,
+            active activities)
+        
+        Raises:
+            NotFoundError: If vendor has no venue
+        """
+        # Correlated counts use the activities (venue_id) index
+        total_activities = (
+            select(func.count())
+            .where(Activity.venue_id == Venue.id)
+            .correlate(Venue)
+            .scalar_subquery()
+        )
+        active_activities = (
+            select(func.count())
+            .where(
+                and_(
+                    Activity.venue_id == Venue.id,
+                    Activity.is_active == True,
+                )
+            )
+            .correlate(Venue)
+            .scalar_subquery()
+        )
+        
+        query = (
+            select(Venue, total_activities, active_activities)
+            .join(VendorCredential, VendorCredential.venue_id == Venue.id)
+            .where(VendorCredential.id == vendor_id)
+            .options(lazyload("*"), joinedload(Venue.quality_score))
+        )
+        
+        result = await self.db.execute(query)
+        row = result.one_or_none()
+        
+        if row is None:
+            raise NotFoundError(
+                f"No venue associated with vendor {vendor_id}"
+            )
+        
+        venue, total, active = row
+        return venue, total, active
+    
     async def verify_vendor_venue_access(
         self,
         vendor_id: UUID,
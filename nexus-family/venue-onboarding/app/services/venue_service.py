@@ -26,17 +26,18 @@ Phase 2 Will Add:
 # IMPORTS
 # =============================================================================
 # Standard library imports
-from typing import Optional, List, Tuple, Dict, Any  # Type hints
+from typing import Optional, List, Tuple  # Type hints
 from uuid import UUID  # UUID type
 
 # Third-party imports
-from sqlalchemy import select, func, or_, and_  # Query building
-from sqlalchemy.orm import selectinload  # Eager loading
+from sqlalchemy import Text, and_, case, cast, func, literal_column, or_, select  # Query building
+from sqlalchemy.orm import joinedload, lazyload, selectinload  # Eager loading
 from sqlalchemy.ext.asyncio import AsyncSession  # Session type
 
 # Local imports
 from app.services.base import BaseService  # Base class
 from app.models.venue import Venue  # Venue model
+from app.models.activity import Activity  # Activity model
 from app.models.quality_score import VenueQualityScore, VenueMockPricing  # Related models
 from app.core.logging_config import get_logger  # Logging
 from app.core.exceptions import NotFoundError  # Exceptions
@@ -126,7 +127,11 @@ class VenueService(BaseService[Venue]):
         offset = (page - 1) * page_size
         
         # Build base query
-        query = select(Venue)
+        # The total is computed in the same round trip with a window count
+        query = select(
+            Venue,
+            func.count().over().label("total_count"),
+        )
         count_query = select(func.count()).select_from(Venue)
         
         # Build filter conditions
@@ -175,15 +180,26 @@ class VenueService(BaseService[Venue]):
         # Add pagination
         query = query.offset(offset).limit(page_size)
         
-        # Add eager loading for quality scores
-        query = query.options(selectinload(Venue.quality_score))
+        # Add eager loading for quality scores (has_quality_scores); the
+        # list never reads the selectin collections, so skip them
+        query = query.options(
+            selectinload(Venue.quality_score),
+            lazyload("*"),
+        )
         
-        # Execute queries
+        # Execute query
         result = await self.db.execute(query)
-        venues = list(result.scalars().all())
-        
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar_one()
+        rows = result.all()
+        venues = [row[0] for row in rows]
+        
+        if rows:
+            total = rows[0].total_count
+        elif offset == 0:
+            total = 0
+        else:
+            # Page past the end: no rows to carry the window count
+            count_result = await self.db.execute(count_query)
+            total = count_result.scalar_one()
         
         logger.debug(
             f"Listed venues: {len(venues)} of {total}",
@@ -203,34 +219,46 @@ class VenueService(BaseService[Venue]):
     async def get_venue_detail(
         self,
         venue_id: UUID,
+        include_pricing: bool = False,
+        include_reviews: bool = False,
     ) -> Venue:
         """
-        Get detailed venue information with all related data.
+        Get detailed venue information with related data.
         
         Loads venue with:
-            - Quality scores
-            - Activities
-            - Mock pricing
-            - Google reviews
+            - Quality scores (joined in the same query)
+            - Activities (without their sessions)
+            - Mock pricing and Google reviews, only if requested
         
         Args:
             venue_id: The venue's UUID
+            include_pricing: Whether to load mock pricing
+            include_reviews: Whether to load Google reviews
         
         Returns:
-            Venue with all related data loaded
+            Venue with related data loaded
         
         Raises:
             NotFoundError: If venue not found
         """
-        # Build query with eager loading
+        # Build query with eager loading. Collections that aren't requested
+        # are switched off explicitly because they are selectin by default.
         query = (
             select(Venue)
             .where(Venue.id == venue_id)
             .options(
-                selectinload(Venue.quality_score),
-                selectinload(Venue.activities),
-                selectinload(Venue.mock_pricing),
-                selectinload(Venue.google_reviews),
+                joinedload(Venue.quality_score),
+                selectinload(Venue.activities).lazyload(Activity.sessions),
+                (
+                    selectinload(Venue.mock_pricing)
+                    if include_pricing
+                    else lazyload(Venue.mock_pricing)
+                ),
+                (
+                    selectinload(Venue.google_reviews)
+                    if include_reviews
+                    else lazyload(Venue.google_reviews)
+                ),
             )
         )
         
@@ -356,46 +384,80 @@ class VenueService(BaseService[Venue]):
     async def get_venue_statistics(
         self,
         venue_id: UUID,
-    ) -> Dict[str, Any]:
+    ) -> str:
         """
-        Get statistics for a venue.
+        Get statistics for a venue as a JSON document.
+        
+        The counts and the JSON object are built in a single aggregate
+        query by PostgreSQL, so no ORM objects are loaded and the result
+        can be sent to the client as-is.
         
         Args:
             venue_id: The venue's UUID
         
         Returns:
-            Dictionary with venue statistics
+            str: JSON object with venue statistics
+        
+        Raises:
+            NotFoundError: If venue not found
         """
-        venue = await self.get_venue_detail(venue_id)
-        
-        # Count activities
-        from app.models.activity import Activity
-        activity_query = select(func.count()).select_from(Activity).where(
-            and_(
-                Activity.venue_id == venue_id,
-                Activity.is_active == True
+        has_scores = VenueQualityScore.id.isnot(None)
+        fields = [
+            ("venue_id", Venue.id),
+            ("venue_name", Venue.name),
+            ("total_activities", func.count(Activity.id)),
+            (
+                "active_activities",
+                func.count(Activity.id).filter(Activity.is_active == True),
+            ),
+            ("google_rating", Venue.google_rating),
+            ("google_review_count", Venue.google_review_count),
+            ("has_quality_scores", has_scores),
+            ("is_active", Venue.is_active),
+        ]
+        
+        # Keys are rendered as SQL literals rather than bind parameters,
+        # since jsonb_build_object's variadic "any" arguments can't infer
+        # a parameter type
+        stats = func.jsonb_build_object(
+            *(
+                arg
+                for key, expr in fields
+                for arg in (literal_column(f"'{key}'"), expr)
+            )
+        )
+        
+        # overall_quality_score is only present when the venue has scores
+        quality = case(
+            (
+                has_scores,
+                func.jsonb_build_object(
+                    literal_column("'overall_quality_score'"),
+                    VenueQualityScore.overall_score,
+                ),
+            ),
+            else_=literal_column("'{}'::jsonb"),
+        )
+        
+        query = (
+            select(cast(stats.op("||")(quality), Text))
+            .select_from(Venue)
+            .outerjoin(Activity, Activity.venue_id == Venue.id)
+            .outerjoin(
+                VenueQualityScore,
+                VenueQualityScore.venue_id == Venue.id,
             )
+            .where(Venue.id == venue_id)
+            .group_by(Venue.id, VenueQualityScore.id)
         )
-        activity_result = await self.db.execute(activity_query)
-        active_activities = activity_result.scalar_one()
-        
-        # Build statistics
-        stats = {
-            "venue_id": str(venue_id),
-            "venue_name": venue.name,
-            "total_activities": len(venue.activities) if venue.activities else 0,
-            "active_activities": active_activities,
-            "google_rating": venue.google_rating,
-            "google_review_count": venue.google_review_count,
-            "has_quality_scores": venue.quality_score is not None,
-            "is_active": venue.is_active,
-        }
-        
-        # Add quality score if available
-        if venue.quality_score:
-            stats["overall_quality_score"] = venue.quality_score.overall_score
-        
-        return stats
+        
+        result = await self.db.execute(query)
+        stats_json = result.scalar_one_or_none()
+        
+        if stats_json is None:
+            raise NotFoundError(f"Venue with ID {venue_id} not found")
+        
+        return stats_json
     
     # =========================================================================
     # GEOGRAPHIC QUERIES (PHASE 1 - SIMPLE)
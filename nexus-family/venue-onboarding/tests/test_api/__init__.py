@@ -0,0 +1,4 @@
+# =============================================================================
+# NEXUS FAMILY PASS - API TESTS
+# =============================================================================
+"""API endpoint and request-path tests."""
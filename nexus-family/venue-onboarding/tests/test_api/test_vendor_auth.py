@@ -0,0 +1,112 @@
+# =============================================================================
+# NEXUS FAMILY PASS - VENDOR AUTHENTICATION TESTS
+# =============================================================================
+"""
+Tests for vendor login/logout and the session validation cache in
+app/api/v1/dependencies.py.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Standard library
+from datetime import datetime, timedelta
+
+# Third-party
+import pytest
+import pytest_asyncio
+
+# Local
+from app.api.v1 import dependencies
+from app.models.venue import Venue
+from app.services.vendor_service import VendorService
+from tests.conftest import assert_response_error, assert_response_ok
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+@pytest.fixture(autouse=True)
+def clear_session_cache():
+    """Start and end every test with an empty session cache."""
+    dependencies._session_cache.clear()
+    yield
+    dependencies._session_cache.clear()
+
+
+@pytest_asyncio.fixture
+async def vendor_token(
+    async_client,
+    db_session,
+    sample_venue_data,
+    sample_vendor_credentials,
+) -> str:
+    """
+    Create a vendor account and log it in.
+    
+    Returns:
+        str: Session token
+    """
+    venue = Venue(**sample_venue_data)
+    db_session.add(venue)
+    await db_session.flush()
+    
+    await VendorService(db_session).create_vendor_account(
+        venue_id=venue.id,
+        **sample_vendor_credentials,
+    )
+    
+    response = await async_client.post(
+        "/api/v1/vendors/login",
+        json={
+            "email": sample_vendor_credentials["email"],
+            "password": sample_vendor_credentials["password"],
+        },
+    )
+    assert_response_ok(response)
+    return response.json()["token"]
+
+
+# =============================================================================
+# BEARER PARSING
+# =============================================================================
+@pytest.mark.parametrize("scheme", ["Bearer", "bearer", "BEARER", "bEaReR"])
+def test_bearer_scheme_is_case_insensitive(scheme):
+    """The auth scheme matches in any casing; the token itself is kept as-is."""
+    assert dependencies.parse_bearer_token(f"{scheme} AbC123") == "AbC123"
+
+
+def test_non_bearer_scheme_is_rejected():
+    """Other schemes (even 7 characters long) are not bearer tokens."""
+    assert dependencies._extract_bearer_token("Basic  AbC123") is None
+
+
+# =============================================================================
+# SESSION CACHE
+# =============================================================================
+def test_invalidate_token_drops_cached_session():
+    """invalidate_token() removes the entry immediately, not after the TTL."""
+    expires_at = (datetime.utcnow() + timedelta(hours=1)).isoformat()
+    dependencies._cache_session("token", {"expires_at": expires_at})
+    assert dependencies._get_cached_session("token") is not None
+    
+    dependencies.invalidate_token("token")
+    
+    assert dependencies._get_cached_session("token") is None
+
+
+async def test_logout_revokes_cached_session(async_client, vendor_token):
+    """A token validated (and cached) before logout stops working after it."""
+    headers = {"Authorization": f"Bearer {vendor_token}"}
+    
+    # Validates the token and fills the cache
+    assert_response_ok(await async_client.get("/api/v1/vendors/me", headers=headers))
+    assert dependencies._get_cached_session(vendor_token) is not None
+    
+    assert_response_ok(await async_client.post("/api/v1/vendors/logout", headers=headers))
+    
+    assert dependencies._get_cached_session(vendor_token) is None
+    assert_response_error(
+        await async_client.get("/api/v1/vendors/me", headers=headers),
+        401,
+    )
@@ -0,0 +1,92 @@
+# =============================================================================
+# NEXUS FAMILY PASS - VENUE ENDPOINT TESTS
+# =============================================================================
+"""
+Tests for the venue endpoints in app/api/v1/endpoints/venues.py.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Third-party
+import pytest
+
+# Local
+from app.core.cache import invalidate_lookups
+from app.models.venue import Venue
+from tests.conftest import assert_response_ok
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+@pytest.fixture(autouse=True)
+def clear_venue_cache():
+    """Drop cached venue pages so each test sees its own data."""
+    invalidate_lookups("venues")
+    yield
+    invalidate_lookups("venues")
+
+
+# =============================================================================
+# LIST VENUES
+# =============================================================================
+async def test_list_venues_empty(async_client):
+    """An empty table gives an empty first page."""
+    response = await async_client.get("/api/v1/venues")
+    
+    assert_response_ok(response)
+    assert response.json() == {
+        "venues": [],
+        "total": 0,
+        "page": 1,
+        "page_size": 20,
+        "total_pages": 1,
+    }
+
+
+async def test_list_venues_returns_page(async_client, db_session, sample_venue_data):
+    """Active venues are listed with pagination metadata."""
+    db_session.add(Venue(**sample_venue_data))
+    await db_session.flush()
+    
+    response = await async_client.get("/api/v1/venues", params={"page_size": 10})
+    
+    assert_response_ok(response)
+    body = response.json()
+    assert body["total"] == 1
+    assert body["page"] == 1
+    assert body["page_size"] == 10
+    assert body["total_pages"] == 1
+    assert [venue["slug"] for venue in body["venues"]] == [sample_venue_data["slug"]]
+
+
+# =============================================================================
+# LOOKUPS
+# =============================================================================
+async def test_cities_lookup_revalidates_with_etag(
+    async_client, db_session, sample_venue_data
+):
+    """A repeat lookup with a matching If-None-Match gets a bodiless 304."""
+    db_session.add(Venue(**sample_venue_data))
+    await db_session.flush()
+    
+    first = await async_client.get("/api/v1/venues/cities")
+    assert_response_ok(first)
+    assert first.json() == [sample_venue_data["city"]]
+    etag = first.headers["ETag"]
+    
+    second = await async_client.get(
+        "/api/v1/venues/cities",
+        headers={"If-None-Match": etag},
+    )
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+    
+    stale = await async_client.get(
+        "/api/v1/venues/cities",
+        headers={"If-None-Match": '"stale"'},
+    )
+    assert_response_ok(stale)
+    assert stale.json() == [sample_venue_data["city"]]
@@ -0,0 +1,238 @@
+# =============================================================================
+# NEXUS FAMILY PASS - WEBHOOK JOB QUEUE TESTS
+# =============================================================================
+"""
+Tests for the webhook job queue in app/services/job_queue.py.
+
+The queue lives in the webhook_jobs table, so these run against the test
+database: the module's session factory is pointed at the test engine.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Standard library
+import asyncio
+import uuid
+from datetime import timedelta
+from typing import Any
+
+# Third-party
+import pytest
+from sqlalchemy import func, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+# Local
+from app.models.webhook_job import WebhookJob
+from app.services import job_queue
+from app.services.job_queue import JobStatus, _JobType
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+PAYLOAD: dict[str, Any] = {"date": "2026-10-16", "callback_url": None}
+
+
+@pytest.fixture
+def job_sessions(db_session: AsyncSession, monkeypatch) -> async_sessionmaker:
+    """
+    Point the job queue at the test database.
+    
+    Returns:
+        async_sessionmaker: Factory for sessions on the test engine
+    """
+    factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    monkeypatch.setattr(job_queue, "get_session_factory", lambda: factory)
+    return factory
+
+
+async def _load(factory: async_sessionmaker, job_id: str) -> WebhookJob:
+    """Read a job row fresh from the database."""
+    async with factory() as session:
+        return await session.get(WebhookJob, uuid.UUID(job_id))
+
+
+async def _set_job(factory: async_sessionmaker, job_id: str, **values: Any) -> None:
+    """Overwrite columns of a job row."""
+    async with factory() as session:
+        await session.execute(
+            update(WebhookJob)
+            .where(WebhookJob.id == uuid.UUID(job_id))
+            .values(**values)
+        )
+        await session.commit()
+
+
+async def _expire_lease(factory: async_sessionmaker, job_id: str) -> None:
+    """Backdate a job's heartbeat as if its worker died."""
+    await _set_job(factory, job_id, heartbeat_at=func.now() - timedelta(minutes=10))
+
+
+# =============================================================================
+# CLAIMING
+# =============================================================================
+async def test_claim_marks_job_running_once(job_sessions):
+    """A pending job is claimed by exactly one worker."""
+    job_id = await job_queue.create_job("booking_reconciliation", PAYLOAD)
+    
+    claimed = await job_queue._claim_job()
+    
+    assert claimed == (job_id, "booking_reconciliation", PAYLOAD)
+    job = await _load(job_sessions, job_id)
+    assert job.status == JobStatus.RUNNING.value
+    assert job.attempts == 1
+    assert job.heartbeat_at is not None
+    assert await job_queue._claim_job() is None
+
+
+async def test_cancelled_job_is_requeued(job_sessions, monkeypatch):
+    """A job interrupted by worker shutdown goes back to pending."""
+    started = asyncio.Event()
+    
+    async def run_forever(job_id: str, request: dict[str, Any]):
+        started.set()
+        await asyncio.Event().wait()
+    
+    monkeypatch.setitem(
+        job_queue._JOB_TYPES,
+        "test_job",
+        _JobType(lambda _r: "Testing", run_forever),
+    )
+    job_id = await job_queue.create_job("test_job", {})
+    claimed = await job_queue._claim_job()
+    
+    task = asyncio.create_task(job_queue._run_claimed_job(*claimed))
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    
+    assert (await _load(job_sessions, job_id)).status == JobStatus.PENDING.value
+    assert (await job_queue._claim_job())[0] == job_id
+
+
+async def test_expired_lease_is_reclaimed(job_sessions):
+    """A running job whose worker stopped heartbeating is claimed again."""
+    job_id = await job_queue.create_job("booking_reconciliation", PAYLOAD)
+    await job_queue._claim_job()
+    await _expire_lease(job_sessions, job_id)
+    
+    claimed = await job_queue._claim_job()
+    
+    assert claimed is not None and claimed[0] == job_id
+    assert (await _load(job_sessions, job_id)).attempts == 2
+
+
+async def test_abandoned_job_fails_after_max_attempts(job_sessions):
+    """A job that keeps losing its worker is failed, not retried forever."""
+    job_id = await job_queue.create_job("booking_reconciliation", PAYLOAD)
+    await job_queue._claim_job()
+    await _set_job(job_sessions, job_id, attempts=job_queue._JOB_MAX_ATTEMPTS)
+    await _expire_lease(job_sessions, job_id)
+    
+    assert await job_queue._claim_job() is None
+    await job_queue._fail_abandoned_jobs(
+        WebhookJob.attempts >= job_queue._JOB_MAX_ATTEMPTS
+    )
+    
+    job = await _load(job_sessions, job_id)
+    assert job.status == JobStatus.FAILED.value
+    assert job.completed_at is not None
+
+
+# =============================================================================
+# PRUNING
+# =============================================================================
+async def test_prune_keeps_unfinished_jobs(job_sessions):
+    """Only finished jobs past the retention period are deleted."""
+    pending_id = await job_queue.create_job("booking_reconciliation", {"date": "a"})
+    done_id = await job_queue.create_job("booking_reconciliation", {"date": "b"})
+    await job_queue.update_job(done_id, JobStatus.COMPLETED, "Done")
+    for job_id in (pending_id, done_id):
+        await _set_job(job_sessions, job_id, created_at=func.now() - timedelta(days=2))
+    
+    await job_queue._prune_jobs()
+    
+    assert await _load(job_sessions, pending_id) is not None
+    assert await _load(job_sessions, done_id) is None
+
+
+# =============================================================================
+# DEDUPLICATION
+# =============================================================================
+async def test_identical_request_reuses_in_flight_job(job_sessions):
+    """A retried webhook gets the pending job's ID instead of a new job."""
+    first = await job_queue.create_job("booking_reconciliation", PAYLOAD)
+    second = await job_queue.create_job("booking_reconciliation", PAYLOAD)
+    
+    assert second == first
+
+
+async def test_retry_reuses_job_with_live_worker(job_sessions):
+    """A running job whose worker still heartbeats keeps its dedupe key."""
+    job_id = await job_queue.create_job("booking_reconciliation", PAYLOAD)
+    claimed = await job_queue._claim_job()
+    assert claimed is not None and claimed[0] == job_id
+    
+    assert await job_queue.create_job("booking_reconciliation", PAYLOAD) == job_id
+
+
+async def test_crashed_job_key_is_accepted_again(job_sessions):
+    """A retry of a job abandoned by a dead worker starts a fresh job."""
+    job_id = await job_queue.create_job("booking_reconciliation", PAYLOAD)
+    await job_queue._claim_job()
+    await _expire_lease(job_sessions, job_id)
+    
+    retry_id = await job_queue.create_job("booking_reconciliation", PAYLOAD)
+    
+    assert retry_id != job_id
+    assert (await _load(job_sessions, job_id)).status == JobStatus.FAILED.value
+    assert (await _load(job_sessions, retry_id)).status == JobStatus.PENDING.value
+
+
+# =============================================================================
+# CALLBACKS
+# =============================================================================
+async def test_slow_callback_does_not_block_others(monkeypatch):
+    """Each callback is sent as its own task, so a slow URL delays nobody."""
+    sent: list[str] = []
+    release = asyncio.Event()
+    
+    async def fake_notify(callback_url: str, job_id: str) -> None:
+        if callback_url == "http://slow":
+            await release.wait()
+        sent.append(job_id)
+    
+    monkeypatch.setattr(job_queue, "notify_callback", fake_notify)
+    await job_queue.start_callback_dispatcher()
+    try:
+        job_queue.enqueue_callback("http://slow", "slow-job")
+        job_queue.enqueue_callback("http://fast", "fast-job")
+        for _ in range(10):
+            await asyncio.sleep(0)
+        
+        assert sent == ["fast-job"]
+    finally:
+        release.set()
+        await job_queue.stop_callback_dispatcher()
+    
+    assert sent == ["fast-job", "slow-job"]
+
+
+async def test_stop_drains_in_flight_callbacks(monkeypatch):
+    """Shutdown waits for callbacks already being sent instead of dropping them."""
+    sent: list[str] = []
+    
+    async def fake_notify(callback_url: str, job_id: str) -> None:
+        await asyncio.sleep(0.05)
+        sent.append(job_id)
+    
+    monkeypatch.setattr(job_queue, "notify_callback", fake_notify)
+    await job_queue.start_callback_dispatcher()
+    job_queue.enqueue_callback("http://n8n", "in-flight")
+    await asyncio.sleep(0)
+    job_queue.enqueue_callback("http://n8n", "queued")
+    
+    await job_queue.stop_callback_dispatcher()
+    
+    assert sorted(sent) == ["in-flight", "queued"]